@@ -1,141 +0,0 @@
-"""Plexity Agentic Orchestrator Python SDK."""
-
-__version__ = "0.3.0"
-
-from .agentic import ContextClient, MCPClient, TeamDelegationClient
-from .async_client import AsyncPlexityClient
-from .automation import ClaudeAutomationClient, IntegrationAutomationClient, IntegrationPlan
-from .client import PlexityClient, PlexityError
-from .insights import InsightClient
-from .models import ExecutionSummary, WorkflowSummary
-from .webhooks import (
-    compute_webhook_signature,
-    extract_webhook_request,
-    verify_webhook_signature,
-)
-from .graphrag import GraphRAGClient, GraphRAGTelemetry, ensure_microsoft_graphrag_runtime
-from .graphrag_runtime import (
-    GraphRAGFeature,
-    GraphRAGFeatureFlags,
-    GraphRAGPackage,
-    GraphRAGRuntimeProfile,
-    resolve_runtime_profile,
-)
-from .orchestration import (
-    ArgoWorkflowsScheduler,
-    IncrementalJobHandle,
-    IncrementalJobScheduler,
-    IncrementalJobSpec,
-    IncrementalJobStatus,
-    InMemoryJobScheduler,
-    JobState,
-    TemporalJobScheduler,
-)
-from .neo4j import (
-    JobSliceRecommendation,
-    Neo4jConnectionConfig,
-    Neo4jDriverManager,
-    Neo4jIncrementalJobAdvisor,
-    Neo4jMigrationAction,
-    Neo4jMigrationPlan,
-    Neo4jMigrationResult,
-    Neo4jSchemaPlanner,
-    Neo4jSchemaSnapshot,
-    Neo4jTransactionalBatchExecutor,
-)
-from .frameworks import (
-    create_langchain_retriever,
-    LangChainRetrieverOptions,
-    create_llamaindex_retriever,
-    LlamaIndexRetrieverOptions,
-    create_haystack_retriever,
-    HaystackRetrieverOptions,
-)
-from .incremental_plugins import (
-    IncrementalIngestionPlugin,
-    get_incremental_ingestion_plugin,
-    invoke_incremental_ingestion_plugin,
-    list_incremental_ingestion_plugins,
-    register_incremental_ingestion_plugin,
-)
-from .security import (
-    AccessControlPolicy,
-    ComplianceDirective,
-    ComplianceDirectiveType,
-    EncryptionContext,
-    SecretReference,
-)
-from .storage import (
-    GCSStorageAdapter,
-    MinIOStorageAdapter,
-    S3StorageAdapter,
-    StorageAdapter,
-    StorageAdapterRegistry,
-    StorageObject,
-)
-
-__all__ = [
-    "PlexityClient",
-    "PlexityError",
-    "ContextClient",
-    "MCPClient",
-    "TeamDelegationClient",
-    "IntegrationPlan",
-    "IntegrationAutomationClient",
-    "ClaudeAutomationClient",
-    "InsightClient",
-    "AsyncPlexityClient",
-    "WorkflowSummary",
-    "ExecutionSummary",
-    "compute_webhook_signature",
-    "verify_webhook_signature",
-    "extract_webhook_request",
-    "GraphRAGClient",
-    "GraphRAGTelemetry",
-    "ensure_microsoft_graphrag_runtime",
-    "GraphRAGFeature",
-    "GraphRAGFeatureFlags",
-    "GraphRAGPackage",
-    "GraphRAGRuntimeProfile",
-    "resolve_runtime_profile",
-    "JobState",
-    "IncrementalJobSpec",
-    "IncrementalJobHandle",
-    "IncrementalJobStatus",
-    "IncrementalJobScheduler",
-    "InMemoryJobScheduler",
-    "TemporalJobScheduler",
-    "ArgoWorkflowsScheduler",
-    "Neo4jConnectionConfig",
-    "Neo4jDriverManager",
-    "Neo4jSchemaPlanner",
-    "Neo4jSchemaSnapshot",
-    "Neo4jMigrationPlan",
-    "Neo4jMigrationAction",
-    "Neo4jMigrationResult",
-    "Neo4jTransactionalBatchExecutor",
-    "Neo4jIncrementalJobAdvisor",
-    "JobSliceRecommendation",
-    "AccessControlPolicy",
-    "EncryptionContext",
-    "ComplianceDirectiveType",
-    "ComplianceDirective",
-    "SecretReference",
-    "StorageAdapter",
-    "StorageObject",
-    "StorageAdapterRegistry",
-    "S3StorageAdapter",
-    "GCSStorageAdapter",
-    "MinIOStorageAdapter",
-    "IncrementalIngestionPlugin",
-    "register_incremental_ingestion_plugin",
-    "get_incremental_ingestion_plugin",
-    "list_incremental_ingestion_plugins",
-    "invoke_incremental_ingestion_plugin",
-    "create_langchain_retriever",
-    "LangChainRetrieverOptions",
-    "create_llamaindex_retriever",
-    "LlamaIndexRetrieverOptions",
-    "create_haystack_retriever",
-    "HaystackRetrieverOptions",
-]
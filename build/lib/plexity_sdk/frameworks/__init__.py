@@ -1,23 +0,0 @@
-"""Helpers for integrating GraphRAG with third-party LLM frameworks."""
-
-from .langchain import (
-    LangChainRetrieverOptions,
-    create_langchain_retriever,
-)
-from .llamaindex import (
-    LlamaIndexRetrieverOptions,
-    create_llamaindex_retriever,
-)
-from .haystack import (
-    HaystackRetrieverOptions,
-    create_haystack_retriever,
-)
-
-__all__ = [
-    "create_langchain_retriever",
-    "LangChainRetrieverOptions",
-    "create_llamaindex_retriever",
-    "LlamaIndexRetrieverOptions",
-    "create_haystack_retriever",
-    "HaystackRetrieverOptions",
-]
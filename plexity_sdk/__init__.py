@@ -2,77 +2,151 @@
 
 __version__ = "0.3.0"
 
-from .agentic import ContextClient, MCPClient, TeamDelegationClient
-from .async_client import AsyncPlexityClient
-from .automation import ClaudeAutomationClient, IntegrationAutomationClient, IntegrationPlan
-from .client import PlexityClient, PlexityError
-from .insights import InsightClient
-from .models import ExecutionSummary, WorkflowSummary
-from .webhooks import (
-    compute_webhook_signature,
-    extract_webhook_request,
-    verify_webhook_signature,
-)
-from .graphrag import GraphRAGClient, GraphRAGTelemetry, ensure_microsoft_graphrag_runtime
-from .graphrag_runtime import (
-    GraphRAGFeature,
-    GraphRAGFeatureFlags,
-    GraphRAGPackage,
-    GraphRAGRuntimeProfile,
-    resolve_runtime_profile,
-)
-from .orchestration import (
-    ArgoWorkflowsScheduler,
-    IncrementalJobHandle,
-    IncrementalJobScheduler,
-    IncrementalJobSpec,
-    IncrementalJobStatus,
-    InMemoryJobScheduler,
-    JobState,
-    TemporalJobScheduler,
-)
-from .neo4j import (
-    JobSliceRecommendation,
-    Neo4jConnectionConfig,
-    Neo4jDriverManager,
-    Neo4jIncrementalJobAdvisor,
-    Neo4jMigrationAction,
-    Neo4jMigrationPlan,
-    Neo4jMigrationResult,
-    Neo4jSchemaPlanner,
-    Neo4jSchemaSnapshot,
-    Neo4jTransactionalBatchExecutor,
-)
-from .frameworks import (
-    create_langchain_retriever,
-    LangChainRetrieverOptions,
-    create_llamaindex_retriever,
-    LlamaIndexRetrieverOptions,
-    create_haystack_retriever,
-    HaystackRetrieverOptions,
-)
-from .incremental_plugins import (
-    IncrementalIngestionPlugin,
-    get_incremental_ingestion_plugin,
-    invoke_incremental_ingestion_plugin,
-    list_incremental_ingestion_plugins,
-    register_incremental_ingestion_plugin,
-)
-from .security import (
-    AccessControlPolicy,
-    ComplianceDirective,
-    ComplianceDirectiveType,
-    EncryptionContext,
-    SecretReference,
-)
-from .storage import (
-    GCSStorageAdapter,
-    MinIOStorageAdapter,
-    S3StorageAdapter,
-    StorageAdapter,
-    StorageAdapterRegistry,
-    StorageObject,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover - imports for type checkers only
+    from .agentic import ContextClient, MCPClient, TeamDelegationClient
+    from .async_client import AsyncPlexityClient
+    from .automation import ClaudeAutomationClient, IntegrationAutomationClient, IntegrationPlan
+    from .client import PlexityClient, PlexityError
+    from .insights import InsightClient
+    from .models import ExecutionSummary, WorkflowSummary
+    from .webhooks import (
+        compute_webhook_signature,
+        extract_webhook_request,
+        verify_webhook_signature,
+    )
+    from .graphrag import GraphRAGClient, GraphRAGTelemetry, ensure_microsoft_graphrag_runtime
+    from .graphrag_runtime import (
+        GraphRAGFeature,
+        GraphRAGFeatureFlags,
+        GraphRAGPackage,
+        GraphRAGRuntimeProfile,
+        resolve_runtime_profile,
+    )
+    from .orchestration import (
+        ArgoWorkflowsScheduler,
+        IncrementalJobHandle,
+        IncrementalJobScheduler,
+        IncrementalJobSpec,
+        IncrementalJobStatus,
+        InMemoryJobScheduler,
+        JobState,
+        TemporalJobScheduler,
+    )
+    from .neo4j import (
+        JobSliceRecommendation,
+        Neo4jConnectionConfig,
+        Neo4jDriverManager,
+        Neo4jIncrementalJobAdvisor,
+        Neo4jMigrationAction,
+        Neo4jMigrationPlan,
+        Neo4jMigrationResult,
+        Neo4jSchemaPlanner,
+        Neo4jSchemaSnapshot,
+        Neo4jTransactionalBatchExecutor,
+    )
+    from .frameworks import (
+        create_langchain_retriever,
+        LangChainRetrieverOptions,
+        create_llamaindex_retriever,
+        LlamaIndexRetrieverOptions,
+        create_haystack_retriever,
+        HaystackRetrieverOptions,
+    )
+    from .incremental_plugins import (
+        IncrementalIngestionPlugin,
+        get_incremental_ingestion_plugin,
+        invoke_incremental_ingestion_plugin,
+        list_incremental_ingestion_plugins,
+        register_incremental_ingestion_plugin,
+    )
+    from .security import (
+        AccessControlPolicy,
+        ComplianceDirective,
+        ComplianceDirectiveType,
+        EncryptionContext,
+        SecretReference,
+    )
+    from .storage import (
+        GCSStorageAdapter,
+        MinIOStorageAdapter,
+        S3StorageAdapter,
+        StorageAdapter,
+        StorageAdapterRegistry,
+        StorageObject,
+    )
+
+# Submodules are imported on first attribute access (PEP 562), so `import plexity_sdk`
+# does not pull in Neo4j, storage SDKs or LLM frameworks until they are used.
+_ATTR_TO_MODULE: Dict[str, str] = {
+    "ContextClient": ".agentic",
+    "MCPClient": ".agentic",
+    "TeamDelegationClient": ".agentic",
+    "AsyncPlexityClient": ".async_client",
+    "ClaudeAutomationClient": ".automation",
+    "IntegrationAutomationClient": ".automation",
+    "IntegrationPlan": ".automation",
+    "PlexityClient": ".client",
+    "PlexityError": ".client",
+    "InsightClient": ".insights",
+    "ExecutionSummary": ".models",
+    "WorkflowSummary": ".models",
+    "compute_webhook_signature": ".webhooks",
+    "extract_webhook_request": ".webhooks",
+    "verify_webhook_signature": ".webhooks",
+    "GraphRAGClient": ".graphrag",
+    "GraphRAGTelemetry": ".graphrag",
+    "ensure_microsoft_graphrag_runtime": ".graphrag",
+    "GraphRAGFeature": ".graphrag_runtime",
+    "GraphRAGFeatureFlags": ".graphrag_runtime",
+    "GraphRAGPackage": ".graphrag_runtime",
+    "GraphRAGRuntimeProfile": ".graphrag_runtime",
+    "resolve_runtime_profile": ".graphrag_runtime",
+    "ArgoWorkflowsScheduler": ".orchestration",
+    "IncrementalJobHandle": ".orchestration",
+    "IncrementalJobScheduler": ".orchestration",
+    "IncrementalJobSpec": ".orchestration",
+    "IncrementalJobStatus": ".orchestration",
+    "InMemoryJobScheduler": ".orchestration",
+    "JobState": ".orchestration",
+    "TemporalJobScheduler": ".orchestration",
+    "JobSliceRecommendation": ".neo4j",
+    "Neo4jConnectionConfig": ".neo4j",
+    "Neo4jDriverManager": ".neo4j",
+    "Neo4jIncrementalJobAdvisor": ".neo4j",
+    "Neo4jMigrationAction": ".neo4j",
+    "Neo4jMigrationPlan": ".neo4j",
+    "Neo4jMigrationResult": ".neo4j",
+    "Neo4jSchemaPlanner": ".neo4j",
+    "Neo4jSchemaSnapshot": ".neo4j",
+    "Neo4jTransactionalBatchExecutor": ".neo4j",
+    "create_langchain_retriever": ".frameworks",
+    "LangChainRetrieverOptions": ".frameworks",
+    "create_llamaindex_retriever": ".frameworks",
+    "LlamaIndexRetrieverOptions": ".frameworks",
+    "create_haystack_retriever": ".frameworks",
+    "HaystackRetrieverOptions": ".frameworks",
+    "IncrementalIngestionPlugin": ".incremental_plugins",
+    "get_incremental_ingestion_plugin": ".incremental_plugins",
+    "invoke_incremental_ingestion_plugin": ".incremental_plugins",
+    "list_incremental_ingestion_plugins": ".incremental_plugins",
+    "register_incremental_ingestion_plugin": ".incremental_plugins",
+    "AccessControlPolicy": ".security",
+    "ComplianceDirective": ".security",
+    "ComplianceDirectiveType": ".security",
+    "EncryptionContext": ".security",
+    "SecretReference": ".security",
+    "GCSStorageAdapter": ".storage",
+    "MinIOStorageAdapter": ".storage",
+    "S3StorageAdapter": ".storage",
+    "StorageAdapter": ".storage",
+    "StorageAdapterRegistry": ".storage",
+    "StorageObject": ".storage",
+}
+# ``types`` re-exports nothing here but was reachable as an attribute under the eager imports.
+_SUBMODULES = frozenset(_ATTR_TO_MODULE.values()) | {".types"}
 
 __all__ = [
     "PlexityClient",
@@ -139,3 +213,19 @@ __all__ = [
     "create_haystack_retriever",
     "HaystackRetrieverOptions",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        if f".{name}" in _SUBMODULES:
+            # Keep `plexity_sdk.<submodule>` attribute access working as it did with eager imports.
+            return importlib.import_module(f".{name}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -6,7 +6,7 @@ from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
 import httpx
 
-from .client import PlexityError
+from .client import PlexityError, _decode_json_response, _json_loads
 from .models import ExecutionSummary, WorkflowSummary
 from .types import JSONValue
 
@@ -1323,11 +1323,11 @@ class AsyncPlexityClient:
 
         content_type = response.headers.get("content-type", "")
         if "json" in content_type:
-            return response.json()
+            return _decode_json_response(response)
         if not response.text:
             return None
         try:
-            return json.loads(response.text)
+            return _json_loads(response.text)
         except json.JSONDecodeError:
             return response.text
 
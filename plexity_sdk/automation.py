@@ -1,19 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, Optional, Sequence
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from .client import PlexityClient
 from .types import JSONValue
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .async_client import AsyncPlexityClient
+
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 __all__ = [
     "IntegrationPlan",
     "IntegrationAutomationClient",
     "ClaudeAutomationClient",
 ]
 
+_DEPENDENCY_FIELDS = ("dependencies", "dev_dependencies", "python_dependencies")
+
 
-@dataclass
+def _as_str_tuple(items: Optional[Iterable[Any]]) -> Tuple[str, ...]:
+    # ``filter``/``map`` keep the per-item ``str`` conversion and blank check in C.
+    return tuple(filter(None, map(str, items or ())))
+
+
+@dataclass(**_SLOTS)
 class IntegrationPlan:
     """Structured representation of an integration change-set."""
 
@@ -27,18 +42,73 @@ class IntegrationPlan:
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "IntegrationPlan":
-        data = dict(payload or {})
+        # Read straight from the payload; ``files`` is the only mutable value that needs a copy.
+        data = payload or {}
+        dependencies, dev_dependencies, python_dependencies = (
+            _as_str_tuple(data.get(key)) for key in _DEPENDENCY_FIELDS
+        )
         return cls(
             files=dict(data.get("files") or {}),
-            dependencies=tuple(str(item) for item in data.get("dependencies", []) if str(item)),
-            dev_dependencies=tuple(str(item) for item in data.get("dev_dependencies", []) if str(item)),
-            python_dependencies=tuple(str(item) for item in data.get("python_dependencies", []) if str(item)),
+            dependencies=dependencies,
+            dev_dependencies=dev_dependencies,
+            python_dependencies=python_dependencies,
             config=data.get("config"),
             tests=data.get("tests"),
             metadata=data.get("metadata"),
         )
 
 
+def _resolve_plan(plan: IntegrationPlan | Dict[str, Any]) -> IntegrationPlan:
+    return plan if isinstance(plan, IntegrationPlan) else IntegrationPlan.from_dict(plan)
+
+
+def _bootstrap_result(clone_result: Any, prepare_result: Any) -> Dict[str, Any]:
+    repository_path = (
+        prepare_result.get("local_path")
+        or clone_result.get("local_path")
+        or prepare_result.get("repository_path")
+    )
+    return {
+        "clone": clone_result,
+        "prepare": prepare_result,
+        "repository_path": repository_path,
+    }
+
+
+def _repository_path(bootstrap: Mapping[str, Any]) -> str:
+    repo_path = bootstrap.get("repository_path")
+    if not repo_path:
+        raise RuntimeError("Repository path could not be resolved from bootstrap response")
+    return repo_path
+
+
+def _plan_changes(plan: IntegrationPlan) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Return the dependency and file fields of ``plan``, or ``None`` for a step it does not need."""
+
+    dependencies = None
+    if any((plan.dependencies, plan.dev_dependencies, plan.python_dependencies)):
+        dependencies = {
+            "dependencies": plan.dependencies,
+            "dev_dependencies": plan.dev_dependencies,
+            "python_dependencies": plan.python_dependencies,
+        }
+    files = {"files": plan.files, "config": plan.config} if plan.files or plan.config else None
+    return dependencies, files
+
+
+def _should_run_tests(plan: IntegrationPlan, run_tests: bool) -> bool:
+    return run_tests and (plan.tests is None or not plan.tests.get("skip"))
+
+
+def _pull_request_text(
+    plan: IntegrationPlan,
+    title: Optional[str],
+    body: Optional[str],
+) -> Tuple[str, Optional[str]]:
+    summary = plan.metadata.get("summary") if plan.metadata else None
+    return title or "Automated GraphRAG integration", body or summary
+
+
 class IntegrationAutomationClient:
     """High-level helper that orchestrates repository automation workflows."""
 
@@ -46,6 +116,30 @@ class IntegrationAutomationClient:
         self._client = client
         self._auth_token = auth_token
 
+    def _bootstrap_kwargs(
+        self,
+        *,
+        repository_url: str,
+        branch_name: Optional[str],
+        base_branch: str,
+        backup_original: bool,
+        shallow_clone: bool,
+        refresh_analysis: bool,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        clone_kwargs = {
+            "repository_url": repository_url,
+            "shallow_clone": shallow_clone,
+            "refresh_analysis": refresh_analysis,
+            "auth_token": self._auth_token,
+        }
+        prepare_kwargs = {
+            **clone_kwargs,
+            "branch_name": branch_name,
+            "base_branch": base_branch,
+            "backup_original": backup_original,
+        }
+        return clone_kwargs, prepare_kwargs
+
     def bootstrap_repository(
         self,
         *,
@@ -56,45 +150,32 @@ class IntegrationAutomationClient:
         shallow_clone: bool = True,
         refresh_analysis: bool = False,
     ) -> Dict[str, Any]:
-        clone_result = self._client.clone_repository(
-            repository_url=repository_url,
-            shallow_clone=shallow_clone,
-            refresh_analysis=refresh_analysis,
-            auth_token=self._auth_token,
-        )
-        prepare_result = self._client.prepare_integration(
+        clone_kwargs, prepare_kwargs = self._bootstrap_kwargs(
             repository_url=repository_url,
             branch_name=branch_name,
             base_branch=base_branch,
             backup_original=backup_original,
             shallow_clone=shallow_clone,
             refresh_analysis=refresh_analysis,
-            auth_token=self._auth_token,
         )
-        repository_path = (
-            prepare_result.get("local_path")
-            or clone_result.get("local_path")
-            or prepare_result.get("repository_path")
-        )
-        return {
-            "clone": clone_result,
-            "prepare": prepare_result,
-            "repository_path": repository_path,
-        }
+        clone_result = self._client.clone_repository(**clone_kwargs)
+        prepare_result = self._client.prepare_integration(**prepare_kwargs)
+        return _bootstrap_result(clone_result, prepare_result)
 
     def install_dependencies(
         self,
         *,
         repository_path: str,
-        dependencies: Sequence[str] = (),
-        dev_dependencies: Sequence[str] = (),
-        python_dependencies: Sequence[str] = (),
+        dependencies: Iterable[str] = (),
+        dev_dependencies: Iterable[str] = (),
+        python_dependencies: Iterable[str] = (),
     ) -> JSONValue:
+        # The client serialises each iterable into its own list payload, so no copy is taken here.
         return self._client.install_integration_dependencies(
             repository_path=repository_path,
-            dependencies=list(dependencies),
-            dev_dependencies=list(dev_dependencies),
-            python_dependencies=list(python_dependencies),
+            dependencies=dependencies,
+            dev_dependencies=dev_dependencies,
+            python_dependencies=python_dependencies,
         )
 
     def write_files(
@@ -149,68 +230,138 @@ class IntegrationAutomationClient:
         shallow_clone: bool = True,
         refresh_analysis: bool = False,
         auto_pr: bool = True,
+        repository_path: Optional[str] = None,
     ) -> Dict[str, Any]:
-        resolved_plan = plan if isinstance(plan, IntegrationPlan) else IntegrationPlan.from_dict(plan)
-        bootstrap = self.bootstrap_repository(
-            repository_url=repository_url,
-            branch_name=branch_name,
-            base_branch=base_branch,
-            backup_original=backup_original,
-            shallow_clone=shallow_clone,
-            refresh_analysis=refresh_analysis,
-        )
-        repo_path = bootstrap.get("repository_path")
-        if not repo_path:
-            raise RuntimeError("Repository path could not be resolved from bootstrap response")
+        resolved_plan = _resolve_plan(plan)
+        if repository_path:
+            # Re-applying to an already prepared workspace skips the clone/prepare round-trips.
+            bootstrap: Dict[str, Any] = {"repository_path": repository_path, "skipped": True}
+        else:
+            bootstrap = self.bootstrap_repository(
+                repository_url=repository_url,
+                branch_name=branch_name,
+                base_branch=base_branch,
+                backup_original=backup_original,
+                shallow_clone=shallow_clone,
+                refresh_analysis=refresh_analysis,
+            )
+        repo_path = _repository_path(bootstrap)
 
         results: Dict[str, Any] = {"bootstrap": bootstrap}
 
-        if any((resolved_plan.dependencies, resolved_plan.dev_dependencies, resolved_plan.python_dependencies)):
-            results["dependencies"] = self.install_dependencies(
+        dependency_fields, file_fields = _plan_changes(resolved_plan)
+        if dependency_fields is not None:
+            results["dependencies"] = self.install_dependencies(repository_path=repo_path, **dependency_fields)
+        if file_fields is not None:
+            results["files"] = self.write_files(repository_path=repo_path, **file_fields)
+
+        if _should_run_tests(resolved_plan, run_tests):
+            results["tests"] = self.run_tests(repository_path=repo_path)
+
+        if auto_pr:
+            pr_title, pr_body = _pull_request_text(resolved_plan, pull_request_title, pull_request_body)
+            results["pull_request"] = self.create_pull_request(
+                repository_url=repository_url,
                 repository_path=repo_path,
-                dependencies=resolved_plan.dependencies,
-                dev_dependencies=resolved_plan.dev_dependencies,
-                python_dependencies=resolved_plan.python_dependencies,
+                branch_name=branch_name,
+                base_branch=base_branch,
+                title=pr_title,
+                body=pr_body,
             )
 
-        if resolved_plan.files or resolved_plan.config:
-            results["files"] = self.write_files(
-                repository_path=repo_path,
-                files=resolved_plan.files,
-                config=resolved_plan.config,
+        return results
+
+    async def apply_plan_async(
+        self,
+        *,
+        async_client: "AsyncPlexityClient",
+        repository_url: str,
+        plan: IntegrationPlan | Dict[str, Any],
+        branch_name: str = "graphrag-integration",
+        base_branch: str = "main",
+        pull_request_title: Optional[str] = None,
+        pull_request_body: Optional[str] = None,
+        run_tests: bool = True,
+        backup_original: bool = True,
+        shallow_clone: bool = True,
+        refresh_analysis: bool = False,
+        auto_pr: bool = True,
+        repository_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`apply_plan` that issues the requests through ``async_client``.
+
+        Dependency installation and file writes are independent, so they run concurrently;
+        tests and pull request creation still follow them in order.
+        """
+
+        resolved_plan = _resolve_plan(plan)
+        if repository_path:
+            bootstrap: Dict[str, Any] = {"repository_path": repository_path, "skipped": True}
+        else:
+            clone_kwargs, prepare_kwargs = self._bootstrap_kwargs(
+                repository_url=repository_url,
+                branch_name=branch_name,
+                base_branch=base_branch,
+                backup_original=backup_original,
+                shallow_clone=shallow_clone,
+                refresh_analysis=refresh_analysis,
             )
+            clone_result = await async_client.clone_repository(**clone_kwargs)
+            prepare_result = await async_client.prepare_integration(**prepare_kwargs)
+            bootstrap = _bootstrap_result(clone_result, prepare_result)
+        repo_path = _repository_path(bootstrap)
 
-        if run_tests and (resolved_plan.tests is None or not resolved_plan.tests.get("skip")):
-            results["tests"] = self.run_tests(repository_path=repo_path)
+        results: Dict[str, Any] = {"bootstrap": bootstrap}
+
+        keys: List[str] = []
+        steps: List[Awaitable[JSONValue]] = []
+        dependency_fields, file_fields = _plan_changes(resolved_plan)
+        if dependency_fields is not None:
+            keys.append("dependencies")
+            steps.append(async_client.install_integration_dependencies(repository_path=repo_path, **dependency_fields))
+        if file_fields is not None:
+            keys.append("files")
+            steps.append(
+                async_client.write_integration_files(repository_path=repo_path, create_backup=True, **file_fields)
+            )
+        if steps:
+            results.update(zip(keys, await asyncio.gather(*steps)))
+
+        if _should_run_tests(resolved_plan, run_tests):
+            results["tests"] = await async_client.run_integration_tests(repository_path=repo_path)
 
         if auto_pr:
-            pr_title = pull_request_title or "Automated GraphRAG integration"
-            pr_body = pull_request_body or resolved_plan.metadata.get("summary") if resolved_plan.metadata else None
-            results["pull_request"] = self.create_pull_request(
+            pr_title, pr_body = _pull_request_text(resolved_plan, pull_request_title, pull_request_body)
+            results["pull_request"] = await async_client.create_github_pull_request(
                 repository_url=repository_url,
                 repository_path=repo_path,
                 branch_name=branch_name,
                 base_branch=base_branch,
                 title=pr_title,
                 body=pr_body,
+                auth_token=self._auth_token,
             )
 
         return results
 
 
-DEFAULT_INTEGRATION_TASKS: Sequence[Dict[str, Any]] = (
-    {
-        "name": "Assess existing GraphRAG readiness",
-        "description": "Review repository structure, dependencies, and configuration to determine required GraphRAG integration steps.",
-    },
-    {
-        "name": "Implement GraphRAG integration scaffolding",
-        "description": "Add necessary configuration files, environment templates, and orchestrator calls to enable GraphRAG features.",
-    },
-    {
-        "name": "Validate integration",
-        "description": "Run project tests or GraphRAG smoke checks to confirm the integration works.",
-    },
+# Read-only views, so callers can share the defaults without taking defensive copies.
+DEFAULT_INTEGRATION_TASKS: Sequence[Mapping[str, Any]] = tuple(
+    MappingProxyType(task)
+    for task in (
+        {
+            "name": "Assess existing GraphRAG readiness",
+            "description": "Review repository structure, dependencies, and configuration to determine required GraphRAG integration steps.",
+        },
+        {
+            "name": "Implement GraphRAG integration scaffolding",
+            "description": "Add necessary configuration files, environment templates, and orchestrator calls to enable GraphRAG features.",
+        },
+        {
+            "name": "Validate integration",
+            "description": "Run project tests or GraphRAG smoke checks to confirm the integration works.",
+        },
+    )
 )
 
 
@@ -231,7 +382,7 @@ class ClaudeAutomationClient:
         repository_owner: Optional[str] = None,
         repository_url: Optional[str] = None,
         default_branch: Optional[str] = None,
-        tasks: Optional[Iterable[Dict[str, Any]]] = None,
+        tasks: Optional[Iterable[Mapping[str, Any]]] = None,
     ) -> JSONValue:
         return self._client.create_claude_session(
             repository_name=repository_name,
@@ -250,9 +401,11 @@ class ClaudeAutomationClient:
         repository_url: Optional[str] = None,
         team_id: Optional[str] = None,
         default_branch: Optional[str] = None,
-        tasks: Optional[Iterable[Dict[str, Any]]] = None,
+        tasks: Optional[Iterable[Mapping[str, Any]]] = None,
     ) -> JSONValue:
-        task_payload = list(tasks) if tasks is not None else list(DEFAULT_INTEGRATION_TASKS)
+        # ``create_claude_session`` copies each task into the request payload, so the caller's
+        # iterable (or the immutable defaults) is passed through as-is.
+        task_payload = tasks if tasks is not None else DEFAULT_INTEGRATION_TASKS
         return self.start_session(
             repository_name=repository_name,
             team_id=team_id,
@@ -9,6 +9,33 @@ import requests
 from .types import JSONValue
 from .models import ExecutionSummary, WorkflowSummary
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+_JSON_CONTENT_TYPE = {"content-type": "application/json"}
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _decode_json_response(response: Any) -> Any:
+    """Decode a JSON response body, preferring orjson on the raw bytes when installed."""
+
+    if orjson is not None:
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, str)) and content:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+    return response.json()
+
+
 class PlexityError(Exception):
     """Raised when the API returns an error response."""
 
@@ -197,39 +224,36 @@ class PlexityClient:
     # GraphRAG telemetry -----------------------------------------------------
 
     def record_graphrag_entity_events(self, events: Any) -> int:
-        payload = self._wrap_events(events)
-        res = self._request("POST", "/graphrag/ingest/entity", json_payload=payload)
-        return int(res.get("accepted", len(payload["events"]))) if isinstance(res, dict) else len(payload["events"])
+        return self._ingest_events("/graphrag/ingest/entity", events)
 
     def record_graphrag_relationship_events(self, events: Any) -> int:
-        payload = self._wrap_events(events)
-        res = self._request("POST", "/graphrag/ingest/relationship", json_payload=payload)
-        return int(res.get("accepted", len(payload["events"]))) if isinstance(res, dict) else len(payload["events"])
+        return self._ingest_events("/graphrag/ingest/relationship", events)
 
     def record_graphrag_community_events(self, events: Any) -> int:
-        payload = self._wrap_events(events)
-        res = self._request("POST", "/graphrag/ingest/community", json_payload=payload)
-        return int(res.get("accepted", len(payload["events"]))) if isinstance(res, dict) else len(payload["events"])
+        return self._ingest_events("/graphrag/ingest/community", events)
 
     def record_graphrag_query_coverage(self, events: Any) -> int:
-        payload = self._wrap_events(events)
-        res = self._request("POST", "/graphrag/ingest/query", json_payload=payload)
-        return int(res.get("accepted", len(payload["events"]))) if isinstance(res, dict) else len(payload["events"])
+        return self._ingest_events("/graphrag/ingest/query", events)
 
     def record_graphrag_indexing_operations(self, events: Any) -> int:
-        payload = self._wrap_events(events)
-        res = self._request("POST", "/graphrag/ingest/indexing", json_payload=payload)
-        return int(res.get("accepted", len(payload["events"]))) if isinstance(res, dict) else len(payload["events"])
+        return self._ingest_events("/graphrag/ingest/indexing", events)
 
     def record_graphrag_schema_snapshots(self, events: Any) -> int:
-        payload = self._wrap_events(events)
-        res = self._request("POST", "/graphrag/ingest/schema", json_payload=payload)
-        return int(res.get("accepted", len(payload["events"]))) if isinstance(res, dict) else len(payload["events"])
+        return self._ingest_events("/graphrag/ingest/schema", events)
 
     def record_graphrag_topology_snapshots(self, events: Any) -> int:
+        return self._ingest_events("/graphrag/ingest/topology", events)
+
+    def _ingest_events(self, path: str, events: Any) -> int:
         payload = self._wrap_events(events)
-        res = self._request("POST", "/graphrag/ingest/topology", json_payload=payload)
-        return int(res.get("accepted", len(payload["events"]))) if isinstance(res, dict) else len(payload["events"])
+        if orjson is not None:
+            # Telemetry batches can hold thousands of events; encode them in C in one pass.
+            body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+            res = self._request("POST", path, body=body, headers=_JSON_CONTENT_TYPE)
+        else:
+            res = self._request("POST", path, json_payload=payload)
+        count = len(payload["events"])
+        return int(res.get("accepted", count)) if isinstance(res, dict) else count
 
     # Insight jobs -----------------------------------------------------------------
     def list_insight_jobs(
@@ -1244,6 +1268,12 @@ class PlexityClient:
         body = {key: value for key, value in payload.items() if value is not None}
         return self._request("POST", "/graphrag/incremental/jobs/slices", json_payload=body)
 
+    def trigger_graphrag_incremental_job_slices_batch(self, slices: Iterable[Dict[str, Any]]) -> JSONValue:
+        body = {
+            "slices": [{key: value for key, value in item.items() if value is not None} for item in slices],
+        }
+        return self._request("POST", "/graphrag/incremental/jobs/slices/batch", json_payload=body)
+
     def apply_graphrag_compliance_directive(
         self,
         *,
@@ -1360,6 +1390,7 @@ class PlexityClient:
         *,
         params: Optional[Dict[str, str]] = None,
         json_payload: Any | None = None,
+        body: Optional[bytes] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> JSONValue:
         if self._closed:
@@ -1373,6 +1404,8 @@ class PlexityClient:
         if self.token:
             req_headers["authorization"] = f"Bearer {self.token}"
 
+        # Pre-encoded bodies are sent as-is; everything else is JSON-encoded by requests.
+        payload_kwargs: Dict[str, Any] = {"json": json_payload} if body is None else {"data": body}
         response = None
         last_error: Optional[BaseException] = None
         for attempt in range(self.max_retries + 1):
@@ -1381,9 +1414,9 @@ class PlexityClient:
                     method,
                     url,
                     params=params,
-                    json=json_payload,
                     headers=req_headers,
                     timeout=self.timeout,
+                    **payload_kwargs,
                 )
             except requests.RequestException as exc:  # pragma: no cover - exercised in tests
                 last_error = exc
@@ -1417,11 +1450,11 @@ class PlexityClient:
 
         content_type = response.headers.get("content-type", "")
         if "json" in content_type:
-            return response.json()
+            return _decode_json_response(response)
         if not response.text:
             return None
         try:
-            return json.loads(response.text)
+            return _json_loads(response.text)
         except json.JSONDecodeError:
             return response.text
 
@@ -1,17 +1,32 @@
 """Helpers for integrating GraphRAG with third-party LLM frameworks."""
 
-from .langchain import (
-    LangChainRetrieverOptions,
-    create_langchain_retriever,
-)
-from .llamaindex import (
-    LlamaIndexRetrieverOptions,
-    create_llamaindex_retriever,
-)
-from .haystack import (
-    HaystackRetrieverOptions,
-    create_haystack_retriever,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover - imports for type checkers only
+    from .langchain import (
+        LangChainRetrieverOptions,
+        create_langchain_retriever,
+    )
+    from .llamaindex import (
+        LlamaIndexRetrieverOptions,
+        create_llamaindex_retriever,
+    )
+    from .haystack import (
+        HaystackRetrieverOptions,
+        create_haystack_retriever,
+    )
+
+# Each integration is imported on first use, so picking one framework never loads the others.
+_ATTR_TO_MODULE: Dict[str, str] = {
+    "LangChainRetrieverOptions": ".langchain",
+    "create_langchain_retriever": ".langchain",
+    "LlamaIndexRetrieverOptions": ".llamaindex",
+    "create_llamaindex_retriever": ".llamaindex",
+    "HaystackRetrieverOptions": ".haystack",
+    "create_haystack_retriever": ".haystack",
+}
+_SUBMODULES = frozenset(_ATTR_TO_MODULE.values())
 
 __all__ = [
     "create_langchain_retriever",
@@ -21,3 +36,18 @@ __all__ = [
     "create_haystack_retriever",
     "HaystackRetrieverOptions",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        if f".{name}" in _SUBMODULES:
+            return importlib.import_module(f".{name}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
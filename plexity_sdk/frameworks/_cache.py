@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+MISSING: Any = object()
+
+
+class SearchCache:
+    """Bounded LRU of search results shared by a retriever's sync and async paths.
+
+    A ``maxsize`` of zero disables caching: lookups always miss and nothing is stored.
+    """
+
+    __slots__ = ("_maxsize", "_entries", "_lock")
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = max(0, int(maxsize))
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        # Blocking fallbacks run on worker threads, so entries are guarded by a lock.
+        self._lock = threading.Lock()
+
+    def get(self, query: str) -> Any:
+        if not self._maxsize:
+            return MISSING
+        with self._lock:
+            result = self._entries.get(query, MISSING)
+            if result is not MISSING:
+                self._entries.move_to_end(query)
+            return result
+
+    def put(self, query: str, result: Any) -> None:
+        if not self._maxsize:
+            return
+        with self._lock:
+            self._entries[query] = result
+            self._entries.move_to_end(query)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def build_search_kwargs(
+    search_type: Optional[str],
+    max_tokens: Optional[int],
+    max_entities: Optional[int],
+    max_communities: Optional[int],
+) -> Dict[str, Any]:
+    """Translate retriever options into ``GraphRAGClient.search`` kwargs.
+
+    The options classes are frozen, so each caches the result once per instance.
+    """
+
+    kwargs: Dict[str, Any] = {}
+    if search_type:
+        kwargs["search_type"] = search_type.lower()
+    if max_tokens is not None:
+        kwargs["max_tokens"] = int(max_tokens)
+    if max_entities is not None:
+        kwargs["max_entities"] = int(max_entities)
+    if max_communities is not None:
+        kwargs["max_communities"] = int(max_communities)
+    return kwargs
+
+
+class CachedRetrieverMixin:
+    """Search caching, blocking fallback and batching shared by the framework retrievers.
+
+    Retrievers provide ``client``, ``search_kwargs``, ``search_cache`` (a :class:`SearchCache`),
+    ``max_parallel`` and ``executor`` attributes, and implement ``_aretrieve_one``.
+    The mixin declares no annotations of its own so model metaclasses do not pick up fields.
+    """
+
+    def cache_clear(self) -> None:
+        self.search_cache.cache_clear()
+
+    def close(self) -> None:
+        """Shut down the worker threads used for blocking async retrievals."""
+
+        executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _search(self, query: str) -> Any:
+        result = self.search_cache.get(query)
+        if result is MISSING:
+            result = self.client.search(query, **self.search_kwargs)
+            self.search_cache.put(query, result)
+        return result
+
+    def _fallback_executor(self) -> ThreadPoolExecutor:
+        # Only clients without ``asearch`` need worker threads, so the pool is created on
+        # the first blocking fallback rather than with every retriever.
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=max(1, self.max_parallel),
+                thread_name_prefix="graphrag-retriever",
+            )
+        return self.executor
+
+    async def _aresults(self, query: str, blocking: Callable[[], T], transform: Callable[[Any], T]) -> T:
+        # Clients exposing an async ``asearch`` are awaited directly (through the same cache);
+        # blocking clients run on the retriever's own bounded pool rather than the loop's
+        # shared default executor.
+        asearch = getattr(self.client, "asearch", None)
+        if asearch is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._fallback_executor(), blocking)
+        result = self.search_cache.get(query)
+        if result is MISSING:
+            result = await asearch(query, **self.search_kwargs)
+            self.search_cache.put(query, result)
+        return transform(result)
+
+    async def _aretrieve_one(self, query: str) -> Any:
+        raise NotImplementedError
+
+    async def abatch_retrieve(self, queries: Sequence[str]) -> List[Any]:
+        """Retrieve several independent queries concurrently, at most ``max_parallel`` at a time."""
+
+        semaphore = asyncio.Semaphore(max(1, self.max_parallel))
+
+        async def retrieve(query: str) -> Any:
+            async with semaphore:
+                return await self._aretrieve_one(query)
+
+        return list(await asyncio.gather(*(retrieve(query) for query in queries)))
@@ -1,109 +1,118 @@
 from __future__ import annotations
 
-import asyncio
-from dataclasses import dataclass
+import functools
+import importlib.util
+import sys
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple, Type
 
 from ..graphrag import GraphRAGClient
+from ._cache import build_search_kwargs
 
 BaseRetrieverType = Any
 DocumentType = Any
 
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class HaystackRetrieverOptions:
     """Options for constructing a Haystack retriever backed by GraphRAG."""
 
     search_type: str = "hybrid"
     max_tokens: Optional[int] = None
     top_k: Optional[int] = None
+    executor: Optional[Executor] = None
+    _search_kwargs: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        kwargs = build_search_kwargs(self.search_type, self.max_tokens, self.top_k, self.top_k)
+        object.__setattr__(self, "_search_kwargs", kwargs)
 
     def to_search_kwargs(self) -> Dict[str, Any]:
-        kwargs: Dict[str, Any] = {}
-        if self.search_type:
-            kwargs["search_type"] = self.search_type.lower()
-        if self.max_tokens is not None:
-            kwargs["max_tokens"] = int(self.max_tokens)
-        if self.top_k is not None:
-            limit = int(self.top_k)
-            kwargs["max_entities"] = limit
-            kwargs["max_communities"] = limit
-        return kwargs
+        return dict(self._search_kwargs)
 
 
-def _import_haystack() -> Tuple[Type[BaseRetrieverType], Type[DocumentType], str]:
+def _module_available(name: str) -> bool:
+    # Probe the module finders rather than importing; modules already loaded (or stubbed) in
+    # ``sys.modules`` may carry no ``__spec__``, so they are checked first.
+    if name in sys.modules:
+        return sys.modules[name] is not None
     try:
-        from haystack.components.retrievers import BaseRetriever  # type: ignore
-        from haystack.dataclasses import Document  # type: ignore
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
 
-        return BaseRetriever, Document, "components"
-    except ImportError:
-        try:
+@functools.lru_cache(maxsize=1)
+def _import_haystack() -> Tuple[Type[BaseRetrieverType], Type[DocumentType], str]:
+    if _module_available("haystack"):
+        if _module_available("haystack.components.retrievers"):
+            from haystack.components.retrievers import BaseRetriever  # type: ignore
+            from haystack.dataclasses import Document  # type: ignore
+
+            return BaseRetriever, Document, "components"
+        if _module_available("haystack.nodes"):
             from haystack.nodes import BaseRetriever  # type: ignore
             from haystack import Document  # type: ignore
 
             return BaseRetriever, Document, "legacy"
-        except ImportError as exc:  # pragma: no cover - exercised in tests
-            raise ImportError(
-                "Haystack integration requires either `haystack-ai` (v2) or `farm-haystack` (v1). "
-                "Install with `pip install haystack-ai` or `pip install farm-haystack`."
-            ) from exc
+    raise ImportError(
+        "Haystack integration requires either `haystack-ai` (v2) or `farm-haystack` (v1). "
+        "Install with `pip install haystack-ai` or `pip install farm-haystack`."
+    )
 
 
 def _transform_result(result: Any, document_ctor: Type[DocumentType]) -> List[DocumentType]:
-    documents: List[DocumentType] = []
     payload = result if isinstance(result, dict) else {}
-    context = payload.get("context", {}) if isinstance(payload, dict) else {}
-    entities = context.get("entities", []) if isinstance(context, dict) else []
+    context = payload.get("context") or {}
+    if not isinstance(context, dict):
+        context = {}
+    entities = context.get("entities")
+    if not entities:
+        return []
     confidence = payload.get("confidence")
     search_type = payload.get("search_type")
-
-    for entity in entities:
-        if not isinstance(entity, dict):
-            continue
-        text = entity.get("description") or entity.get("name") or ""
-        documents.append(
-            document_ctor(
-                content=text,
-                meta={
-                    "entity_id": entity.get("id"),
-                    "entity_type": entity.get("type"),
-                    "search_type": search_type,
-                    "confidence": confidence,
-                },
-            )
+    ctor = document_ctor
+
+    return [
+        ctor(
+            content=entity.get("description") or entity.get("name") or "",
+            meta={
+                "entity_id": entity.get("id"),
+                "entity_type": entity.get("type"),
+                "search_type": search_type,
+                "confidence": confidence,
+            },
         )
-    return documents
-
-
-def create_haystack_retriever(
-    client: GraphRAGClient,
-    options: Optional[HaystackRetrieverOptions] = None,
-) -> BaseRetrieverType:
-    """Return a Haystack retriever backed by the GraphRAGClient."""
-
-    BaseRetriever, Document, _variant = _import_haystack()
-    opts = options or HaystackRetrieverOptions()
-
+        for entity in entities
+        if isinstance(entity, dict)
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _retriever_class(
+    BaseRetriever: Type[BaseRetrieverType],
+    Document: Type[DocumentType],
+) -> Type[BaseRetrieverType]:
+    # The class body only depends on the imported Haystack types, so build it once
+    # rather than on every ``create_haystack_retriever`` call.
     class GraphRAGHaystackRetriever(BaseRetriever):
         client: GraphRAGClient
         search_type: str = "hybrid"
         max_tokens: Optional[int] = None
         top_k: Optional[int] = None
-
-        def _build_kwargs(self) -> Dict[str, Any]:
-            kwargs: Dict[str, Any] = {}
-            if self.search_type:
-                kwargs["search_type"] = self.search_type
-            if self.max_tokens is not None:
-                kwargs["max_tokens"] = self.max_tokens
-            if self.top_k is not None:
-                kwargs["max_entities"] = self.top_k
-                kwargs["max_communities"] = self.top_k
-            return kwargs
+        search_kwargs: Dict[str, Any] = {}
+        search_fn: Any = None
+        executor: Any = None
 
         def _fetch(self, query: str) -> List[DocumentType]:
-            result = self.client.search(query, **self._build_kwargs())
+            if self.top_k == 0:
+                return []
+            return self._documents(self.search_fn(query, **self.search_kwargs))
+
+        def _documents(self, result: Any) -> List[DocumentType]:
             documents = _transform_result(result, Document)
             if self.top_k is not None:
                 return documents[: int(self.top_k)]
@@ -123,12 +132,39 @@ def create_haystack_retriever(
             return {"documents": documents}
 
         async def arun(self, query: str) -> Dict[str, Any]:  # type: ignore[override]
-            documents = await asyncio.to_thread(self._fetch, query)
+            # Unlike the cached retrievers, blocking clients run on the configured executor
+            # (the loop's default when none was given).
+            if self.top_k == 0:
+                return {"documents": []}
+            asearch = getattr(self.client, "asearch", None)
+            if asearch is None:
+                import asyncio
+
+                loop = asyncio.get_running_loop()
+                documents = await loop.run_in_executor(self.executor, self._fetch, query)
+            else:
+                documents = self._documents(await asearch(query, **self.search_kwargs))
             return {"documents": documents}
 
-    return GraphRAGHaystackRetriever(
+    return GraphRAGHaystackRetriever
+
+
+def create_haystack_retriever(
+    client: GraphRAGClient,
+    options: Optional[HaystackRetrieverOptions] = None,
+) -> BaseRetrieverType:
+    """Return a Haystack retriever backed by the GraphRAGClient."""
+
+    BaseRetriever, Document, _variant = _import_haystack()
+    retriever_cls = _retriever_class(BaseRetriever, Document)
+    opts = options or HaystackRetrieverOptions()
+    search_kwargs = opts.to_search_kwargs()
+    return retriever_cls(
         client=client,
-        search_type=opts.to_search_kwargs().get("search_type", "hybrid"),
+        search_type=search_kwargs.get("search_type", "hybrid"),
         max_tokens=opts.max_tokens,
         top_k=opts.top_k,
+        search_kwargs=search_kwargs,
+        search_fn=client.search,
+        executor=opts.executor,
     )
@@ -1,15 +1,39 @@
 from __future__ import annotations
 
-import asyncio
+import functools
+import itertools
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
 from ..graphrag import GraphRAGClient
+from ._cache import CachedRetrieverMixin, SearchCache, build_search_kwargs
 
 DocumentType = Any
 BaseRetrieverType = Any
 CallbackManagerType = Any
 
+_TYPE_ENTITY = sys.intern("entity")
+_TYPE_COMMUNITY = sys.intern("community")
+
+# Fixed-shape metadata templates; copying one is cheaper than rebuilding the literal per record.
+_ENTITY_TMPL: Dict[str, Any] = {
+    "type": _TYPE_ENTITY,
+    "entity_id": None,
+    "name": None,
+    "entity_type": None,
+    "search_type": None,
+    "confidence": None,
+}
+_COMMUNITY_TMPL: Dict[str, Any] = {
+    "type": _TYPE_COMMUNITY,
+    "community_id": None,
+    "title": None,
+    "level": None,
+    "search_type": None,
+    "confidence": None,
+}
+
 
 @dataclass(frozen=True)
 class LangChainRetrieverOptions:
@@ -19,20 +43,18 @@ class LangChainRetrieverOptions:
     max_tokens: Optional[int] = None
     max_entities: Optional[int] = None
     max_communities: Optional[int] = None
+    cache_size: int = 0
+    max_parallel: int = 8
 
     def to_search_kwargs(self) -> Dict[str, Any]:
-        kwargs: Dict[str, Any] = {}
-        if self.search_type:
-            kwargs["search_type"] = self.search_type.lower()
-        if self.max_tokens is not None:
-            kwargs["max_tokens"] = int(self.max_tokens)
-        if self.max_entities is not None:
-            kwargs["max_entities"] = int(self.max_entities)
-        if self.max_communities is not None:
-            kwargs["max_communities"] = int(self.max_communities)
-        return kwargs
+        return dict(self._search_kwargs)
+
+    @functools.cached_property
+    def _search_kwargs(self) -> Dict[str, Any]:
+        return build_search_kwargs(self.search_type, self.max_tokens, self.max_entities, self.max_communities)
 
 
+@functools.lru_cache(maxsize=1)
 def _import_langchain() -> Tuple[BaseRetrieverType, Type[DocumentType], CallbackManagerType]:
     try:
         from langchain_core.documents import Document  # type: ignore
@@ -49,69 +71,85 @@ def _import_langchain() -> Tuple[BaseRetrieverType, Type[DocumentType], Callback
     return BaseRetriever, Document, CallbackManagerForRetrieverRun
 
 
-def _transform_result(result: Any, document_ctor: Type[DocumentType]) -> List[DocumentType]:
-    documents: List[DocumentType] = []
-
-    context = (result or {}).get("context", {}) if isinstance(result, dict) else {}
-    entities = context.get("entities", []) if isinstance(context, dict) else []
-    communities = context.get("communities", []) if isinstance(context, dict) else []
-    confidence = (result or {}).get("confidence")
-    search_type = (result or {}).get("search_type")
-
-    for entity in entities:
-        if not isinstance(entity, dict):
-            continue
-        page_content = entity.get("description") or entity.get("name") or ""
-        documents.append(
-            document_ctor(
-                page_content=page_content,
-                metadata={
-                    "type": "entity",
-                    "entity_id": entity.get("id"),
-                    "name": entity.get("name"),
-                    "entity_type": entity.get("type"),
-                    "search_type": search_type,
-                    "confidence": confidence,
-                },
-            )
+def _limit(items: Iterable[Any], limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+    # Enforce the requested limit client-side before any documents are built.
+    records = (item for item in items if isinstance(item, dict))
+    return itertools.islice(records, None if limit is None else max(0, int(limit)))
+
+
+def _iter_transform_result(
+    result: Any,
+    document_ctor: Type[DocumentType],
+    *,
+    max_entities: Optional[int] = None,
+    max_communities: Optional[int] = None,
+) -> Iterator[DocumentType]:
+    payload = result if isinstance(result, dict) else {}
+    context = payload.get("context") or {}
+    if not isinstance(context, dict):
+        context = {}
+    entities = context.get("entities") or ()
+    communities = context.get("communities") or ()
+    if not entities and not communities:
+        return
+    shared = {"search_type": payload.get("search_type"), "confidence": payload.get("confidence")}
+    entity_tmpl = {**_ENTITY_TMPL, **shared}
+    community_tmpl = {**_COMMUNITY_TMPL, **shared}
+    ctor = document_ctor
+
+    for entity in _limit(entities, max_entities):
+        get = entity.get
+        name = get("name")
+        meta = entity_tmpl.copy()
+        meta["entity_id"] = get("id")
+        meta["name"] = name
+        meta["entity_type"] = get("type")
+        yield ctor(page_content=get("description") or name or "", metadata=meta)
+    for community in _limit(communities, max_communities):
+        get = community.get
+        title = get("title")
+        meta = community_tmpl.copy()
+        meta["community_id"] = get("id")
+        meta["title"] = title
+        meta["level"] = get("level")
+        yield ctor(page_content=get("summary") or title or "", metadata=meta)
+
+
+def _transform_result(
+    result: Any,
+    document_ctor: Type[DocumentType],
+    *,
+    max_entities: Optional[int] = None,
+    max_communities: Optional[int] = None,
+) -> List[DocumentType]:
+    return list(
+        _iter_transform_result(
+            result,
+            document_ctor,
+            max_entities=max_entities,
+            max_communities=max_communities,
         )
+    )
 
-    for community in communities:
-        if not isinstance(community, dict):
-            continue
-        summary = community.get("summary") or community.get("title") or ""
-        documents.append(
-            document_ctor(
-                page_content=summary,
-                metadata={
-                    "type": "community",
-                    "community_id": community.get("id"),
-                    "title": community.get("title"),
-                    "level": community.get("level"),
-                    "search_type": search_type,
-                    "confidence": confidence,
-                },
-            )
-        )
-
-    return documents
-
-
-def create_langchain_retriever(
-    client: GraphRAGClient,
-    options: Optional[LangChainRetrieverOptions] = None,
-) -> BaseRetrieverType:
-    """Return a LangChain retriever backed by the GraphRAGClient."""
-
-    BaseRetriever, Document, CallbackManagerForRetrieverRun = _import_langchain()
-    opts = options or LangChainRetrieverOptions()
 
-    class GraphRAGLangChainRetriever(BaseRetriever):
+@functools.lru_cache(maxsize=1)
+def _retriever_class(
+    BaseRetriever: BaseRetrieverType,
+    Document: Type[DocumentType],
+    CallbackManagerForRetrieverRun: CallbackManagerType,
+) -> Type[BaseRetrieverType]:
+    # The class body only depends on the imported LangChain types, so build it once
+    # rather than on every ``create_langchain_retriever`` call.
+    class GraphRAGLangChainRetriever(CachedRetrieverMixin, BaseRetriever):
         client: GraphRAGClient
         search_type: str = "hybrid"
         max_tokens: Optional[int] = None
         max_entities: Optional[int] = None
         max_communities: Optional[int] = None
+        search_kwargs: Dict[str, Any] = {}
+        search_cache: Any = None
+        max_parallel: int = 8
+        executor: Any = None
 
         def _get_relevant_documents(
             self,
@@ -119,17 +157,15 @@ def create_langchain_retriever(
             *,
             run_manager: Optional[CallbackManagerForRetrieverRun] = None,
         ) -> List[DocumentType]:
-            kwargs: Dict[str, Any] = {}
-            if self.search_type:
-                kwargs["search_type"] = self.search_type
-            if self.max_tokens is not None:
-                kwargs["max_tokens"] = self.max_tokens
-            if self.max_entities is not None:
-                kwargs["max_entities"] = self.max_entities
-            if self.max_communities is not None:
-                kwargs["max_communities"] = self.max_communities
-            result = self.client.search(query, **kwargs)
-            return _transform_result(result, Document)
+            return self._documents(self._search(query))
+
+        def _documents(self, result: Any) -> List[DocumentType]:
+            return _transform_result(
+                result,
+                Document,
+                max_entities=self.max_entities,
+                max_communities=self.max_communities,
+            )
 
         async def _aget_relevant_documents(
             self,
@@ -137,12 +173,34 @@ def create_langchain_retriever(
             *,
             run_manager: Optional[CallbackManagerForRetrieverRun] = None,
         ) -> List[DocumentType]:
-            return await asyncio.to_thread(self._get_relevant_documents, query, run_manager=run_manager)
+            return await self._aresults(
+                query,
+                functools.partial(self._get_relevant_documents, query, run_manager=run_manager),
+                self._documents,
+            )
+
+        async def _aretrieve_one(self, query: str) -> List[DocumentType]:
+            return await self._aget_relevant_documents(query)
+
+    return GraphRAGLangChainRetriever
+
 
-    return GraphRAGLangChainRetriever(
+def create_langchain_retriever(
+    client: GraphRAGClient,
+    options: Optional[LangChainRetrieverOptions] = None,
+) -> BaseRetrieverType:
+    """Return a LangChain retriever backed by the GraphRAGClient."""
+
+    retriever_cls = _retriever_class(*_import_langchain())
+    opts = options or LangChainRetrieverOptions()
+    search_kwargs = opts.to_search_kwargs()
+    return retriever_cls(
         client=client,
-        search_type=opts.to_search_kwargs().get("search_type", "hybrid"),
+        search_type=search_kwargs.get("search_type", "hybrid"),
         max_tokens=opts.max_tokens,
         max_entities=opts.max_entities,
         max_communities=opts.max_communities,
+        search_kwargs=search_kwargs,
+        search_cache=SearchCache(opts.cache_size),
+        max_parallel=opts.max_parallel,
     )
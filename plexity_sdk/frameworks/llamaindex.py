@@ -1,15 +1,27 @@
 from __future__ import annotations
 
-import asyncio
+import functools
+import itertools
+import sys
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
 from ..graphrag import GraphRAGClient
+from ._cache import CachedRetrieverMixin, SearchCache, build_search_kwargs
 
 BaseRetrieverType = Any
 NodeWithScoreType = Any
 TextNodeType = Any
 
+_TYPE_ENTITY = sys.intern("entity")
+_TYPE_COMMUNITY = sys.intern("community")
+_RELATES_TO = sys.intern("RELATES_TO")
+
+# Fixed-shape metadata templates; copying one is cheaper than rebuilding the literal per record.
+_ENTITY_TMPL: Dict[str, Any] = {"type": _TYPE_ENTITY, "entity_type": None, "name": None, "confidence": None}
+_COMMUNITY_TMPL: Dict[str, Any] = {"type": _TYPE_COMMUNITY, "level": None, "title": None, "confidence": None}
+
 
 @dataclass(frozen=True)
 class LlamaIndexRetrieverOptions:
@@ -19,20 +31,18 @@ class LlamaIndexRetrieverOptions:
     max_tokens: Optional[int] = None
     max_entities: Optional[int] = None
     max_communities: Optional[int] = None
+    cache_size: int = 0
+    max_parallel: int = 8
 
     def to_search_kwargs(self) -> Dict[str, Any]:
-        kwargs: Dict[str, Any] = {}
-        if self.search_type:
-            kwargs["search_type"] = self.search_type.lower()
-        if self.max_tokens is not None:
-            kwargs["max_tokens"] = int(self.max_tokens)
-        if self.max_entities is not None:
-            kwargs["max_entities"] = int(self.max_entities)
-        if self.max_communities is not None:
-            kwargs["max_communities"] = int(self.max_communities)
-        return kwargs
+        return dict(self._search_kwargs)
 
+    @functools.cached_property
+    def _search_kwargs(self) -> Dict[str, Any]:
+        return build_search_kwargs(self.search_type, self.max_tokens, self.max_entities, self.max_communities)
 
+
+@functools.lru_cache(maxsize=1)
 def _import_llamaindex() -> Tuple[Type[BaseRetrieverType], Type[NodeWithScoreType], Type[TextNodeType]]:
     try:
         from llama_index.core.retrievers import BaseRetriever  # type: ignore
@@ -46,24 +56,21 @@ def _import_llamaindex() -> Tuple[Type[BaseRetrieverType], Type[NodeWithScoreTyp
     return BaseRetriever, NodeWithScore, TextNode
 
 
-def _build_node_text(entity: Dict[str, Any], relationships: List[Dict[str, Any]]) -> str:
+def _build_node_text(entity: Dict[str, Any], relationships: Iterable[Dict[str, Any]]) -> str:
     summary: List[str] = []
-    name = entity.get("name")
+    get = entity.get
+    name = get("name")
     if name:
         summary.append(str(name))
-    description = entity.get("description")
+    description = get("description")
     if description:
         summary.append(str(description))
 
     related: List[str] = []
-    entity_id = entity.get("id")
     for rel in relationships:
-        if not isinstance(rel, dict):
-            continue
-        if rel.get("source") != entity_id and rel.get("target") != entity_id:
-            continue
-        rel_type = rel.get("type") or rel.get("relationship_type") or "RELATES_TO"
-        description = rel.get("description") or ""
+        get = rel.get
+        rel_type = get("type") or get("relationship_type") or _RELATES_TO
+        description = get("description") or ""
         related.append(f"{rel_type}: {description}".strip())
 
     if related:
@@ -71,89 +78,175 @@ def _build_node_text(entity: Dict[str, Any], relationships: List[Dict[str, Any]]
     return "\n".join(summary)
 
 
-def _transform_result(
+def _index_relationships(
+    relationships: Iterable[Any],
+) -> Tuple[Dict[Any, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """Index relationships by endpoint id; those with unhashable ids are returned separately."""
+
+    index: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+    unindexed: List[Dict[str, Any]] = []
+    for rel in relationships:
+        if not isinstance(rel, dict):
+            continue
+        source = rel.get("source")
+        target = rel.get("target")
+        try:
+            hash(source)
+            hash(target)
+        except TypeError:
+            unindexed.append(rel)
+            continue
+        index[source].append(rel)
+        if target != source:
+            index[target].append(rel)
+    return index, unindexed
+
+
+def _match_linear(entity_id: Any, relationships: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [rel for rel in relationships if rel.get("source") == entity_id or rel.get("target") == entity_id]
+
+
+def _related(
+    entity_id: Any,
+    index: Dict[Any, List[Dict[str, Any]]],
+    unindexed: List[Dict[str, Any]],
+    relationships: List[Any],
+) -> Iterable[Dict[str, Any]]:
+    try:
+        related: Iterable[Dict[str, Any]] = index.get(entity_id, ())
+    except TypeError:
+        # Unhashable entity id (e.g. a dict in the payload): fall back to comparing with ``==``.
+        return _match_linear(entity_id, (rel for rel in relationships if isinstance(rel, dict)))
+    if unindexed:
+        return [*related, *_match_linear(entity_id, unindexed)]
+    return related
+
+
+def _limit(items: Iterable[Any], limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+    # Enforce the requested limit client-side before any documents are built.
+    records = (item for item in items if isinstance(item, dict))
+    return itertools.islice(records, None if limit is None else max(0, int(limit)))
+
+
+def _iter_transform_result(
     result: Any,
     node_with_score_ctor: Type[NodeWithScoreType],
     text_node_ctor: Type[TextNodeType],
-) -> List[NodeWithScoreType]:
-    nodes: List[NodeWithScoreType] = []
+    *,
+    max_entities: Optional[int] = None,
+    max_communities: Optional[int] = None,
+) -> Iterator[NodeWithScoreType]:
     payload = result if isinstance(result, dict) else {}
-    context = payload.get("context", {}) if isinstance(payload, dict) else {}
-    entities = context.get("entities", []) if isinstance(context, dict) else []
-    communities = context.get("communities", []) if isinstance(context, dict) else []
-    relationships = context.get("relationships", []) if isinstance(context, dict) else []
+    context = payload.get("context") or {}
+    if not isinstance(context, dict):
+        context = {}
+    entities = context.get("entities") or ()
+    communities = context.get("communities") or ()
+    if not entities and not communities:
+        return
+    relationships = context.get("relationships")
+    if not isinstance(relationships, list):
+        relationships = []
+    rel_index, unindexed = _index_relationships(relationships)
     confidence = payload.get("confidence")
+    entity_tmpl = {**_ENTITY_TMPL, "confidence": confidence}
+    community_tmpl = {**_COMMUNITY_TMPL, "confidence": confidence}
+    scored = node_with_score_ctor
+    text_node = text_node_ctor
+
+    for entity in _limit(entities, max_entities):
+        get = entity.get
+        entity_id = get("id")
+        meta = entity_tmpl.copy()
+        meta["entity_type"] = get("type")
+        meta["name"] = get("name")
+        text = _build_node_text(entity, _related(entity_id, rel_index, unindexed, relationships))
+        yield scored(text_node(id_=entity_id, text=text, metadata=meta), score=confidence)
+    for community in _limit(communities, max_communities):
+        get = community.get
+        title = get("title")
+        meta = community_tmpl.copy()
+        meta["level"] = get("level")
+        meta["title"] = title
+        text = get("summary") or title or ""
+        yield scored(text_node(id_=get("id"), text=text, metadata=meta), score=confidence)
 
-    for entity in entities:
-        if not isinstance(entity, dict):
-            continue
-        text = _build_node_text(entity, relationships if isinstance(relationships, list) else [])
-        node = text_node_ctor(
-            id_=entity.get("id"),
-            text=text,
-            metadata={
-                "type": "entity",
-                "entity_type": entity.get("type"),
-                "name": entity.get("name"),
-                "confidence": confidence,
-            },
-        )
-        nodes.append(node_with_score_ctor(node, score=confidence))
 
-    for community in communities:
-        if not isinstance(community, dict):
-            continue
-        node = text_node_ctor(
-            id_=community.get("id"),
-            text=community.get("summary") or community.get("title") or "",
-            metadata={
-                "type": "community",
-                "level": community.get("level"),
-                "title": community.get("title"),
-                "confidence": confidence,
-            },
+def _transform_result(
+    result: Any,
+    node_with_score_ctor: Type[NodeWithScoreType],
+    text_node_ctor: Type[TextNodeType],
+    *,
+    max_entities: Optional[int] = None,
+    max_communities: Optional[int] = None,
+) -> List[NodeWithScoreType]:
+    return list(
+        _iter_transform_result(
+            result,
+            node_with_score_ctor,
+            text_node_ctor,
+            max_entities=max_entities,
+            max_communities=max_communities,
         )
-        nodes.append(node_with_score_ctor(node, score=confidence))
-
-    return nodes
+    )
 
 
-def create_llamaindex_retriever(
-    client: GraphRAGClient,
-    options: Optional[LlamaIndexRetrieverOptions] = None,
-) -> BaseRetrieverType:
-    """Return a LlamaIndex retriever backed by the GraphRAGClient."""
-
-    BaseRetriever, NodeWithScore, TextNode = _import_llamaindex()
-    opts = options or LlamaIndexRetrieverOptions()
-
-    class GraphRAGLlamaIndexRetriever(BaseRetriever):
+@functools.lru_cache(maxsize=1)
+def _retriever_class(
+    BaseRetriever: Type[BaseRetrieverType],
+    NodeWithScore: Type[NodeWithScoreType],
+    TextNode: Type[TextNodeType],
+) -> Type[BaseRetrieverType]:
+    # The class body only depends on the imported LlamaIndex types, so build it once
+    # rather than on every ``create_llamaindex_retriever`` call.
+    class GraphRAGLlamaIndexRetriever(CachedRetrieverMixin, BaseRetriever):
         client: GraphRAGClient
         search_type: str = "hybrid"
         max_tokens: Optional[int] = None
         max_entities: Optional[int] = None
         max_communities: Optional[int] = None
+        search_kwargs: Dict[str, Any] = {}
+        search_cache: Any = None
+        max_parallel: int = 8
+        executor: Any = None
 
         def _retrieve(self, query: str) -> List[NodeWithScoreType]:
-            kwargs: Dict[str, Any] = {}
-            if self.search_type:
-                kwargs["search_type"] = self.search_type
-            if self.max_tokens is not None:
-                kwargs["max_tokens"] = self.max_tokens
-            if self.max_entities is not None:
-                kwargs["max_entities"] = self.max_entities
-            if self.max_communities is not None:
-                kwargs["max_communities"] = self.max_communities
-            result = self.client.search(query, **kwargs)
-            return _transform_result(result, NodeWithScore, TextNode)
+            return self._nodes(self._search(query))
+
+        def _nodes(self, result: Any) -> List[NodeWithScoreType]:
+            return _transform_result(
+                result,
+                NodeWithScore,
+                TextNode,
+                max_entities=self.max_entities,
+                max_communities=self.max_communities,
+            )
 
         async def _aretrieve(self, query: str) -> List[NodeWithScoreType]:
-            return await asyncio.to_thread(self._retrieve, query)
+            return await self._aresults(query, functools.partial(self._retrieve, query), self._nodes)
+
+        async def _aretrieve_one(self, query: str) -> List[NodeWithScoreType]:
+            return await self._aretrieve(query)
+
+    return GraphRAGLlamaIndexRetriever
+
+
+def create_llamaindex_retriever(
+    client: GraphRAGClient,
+    options: Optional[LlamaIndexRetrieverOptions] = None,
+) -> BaseRetrieverType:
+    """Return a LlamaIndex retriever backed by the GraphRAGClient."""
 
-    return GraphRAGLlamaIndexRetriever(
+    retriever_cls = _retriever_class(*_import_llamaindex())
+    opts = options or LlamaIndexRetrieverOptions()
+    search_kwargs = opts.to_search_kwargs()
+    return retriever_cls(
         client=client,
-        search_type=opts.to_search_kwargs().get("search_type", "hybrid"),
+        search_type=search_kwargs.get("search_type", "hybrid"),
         max_tokens=opts.max_tokens,
         max_entities=opts.max_entities,
         max_communities=opts.max_communities,
+        search_kwargs=search_kwargs,
+        search_cache=SearchCache(opts.cache_size),
+        max_parallel=opts.max_parallel,
     )
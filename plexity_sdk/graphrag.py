@@ -4,12 +4,31 @@ import os
 import shutil
 import subprocess
 import sys
+import time
 import asyncio
+import atexit
+import functools
+import glob
+import hashlib
+import inspect
+import itertools
+import json
+import logging
+import re
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from .client import PlexityClient
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+from .client import PlexityClient, PlexityError
 from .graphrag_runtime import (
     GraphRAGFeature,
     GraphRAGFeatureFlags,
@@ -17,31 +36,33 @@ from .graphrag_runtime import (
     GraphRAGRuntimeProfile,
     resolve_runtime_profile,
 )
-from .neo4j import (
-    JobSliceRecommendation,
-    Neo4jConnectionConfig,
-    Neo4jDriverManager,
-    Neo4jIncrementalJobAdvisor,
-    Neo4jMigrationPlan,
-    Neo4jSchemaPlanner,
-    Neo4jSchemaSnapshot,
-    Neo4jTransactionalBatchExecutor,
-)
-from .orchestration import (
-    IncrementalJobHandle,
-    IncrementalJobScheduler,
-    IncrementalJobSpec,
-    IncrementalJobStatus,
-)
 from .security import AccessControlPolicy, ComplianceDirective, EncryptionContext
 from .storage import StorageAdapter, StorageAdapterRegistry, StorageObject
 
+if TYPE_CHECKING:  # pragma: no cover - imported lazily by the methods that need them
+    from .neo4j import (
+        JobSliceRecommendation,
+        Neo4jConnectionConfig,
+        Neo4jDriverManager,
+        Neo4jMigrationPlan,
+        Neo4jSchemaPlanner,
+        Neo4jSchemaSnapshot,
+        Neo4jTransactionalBatchExecutor,
+    )
+    from .orchestration import (
+        IncrementalJobHandle,
+        IncrementalJobScheduler,
+        IncrementalJobStatus,
+    )
+
 __all__ = [
     "GraphRAGClient",
     "GraphRAGTelemetry",
     "ensure_microsoft_graphrag_runtime",
 ]
 
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 _BACKEND_FEATURE_ENDPOINTS: Dict[GraphRAGFeature, Tuple[Tuple[str, str], ...]] = {
     GraphRAGFeature.INCREMENTAL_JOB_ADVISOR: (
         ("GET", "/graphrag/incremental/jobs/recommendations"),
@@ -54,7 +75,33 @@ _BACKEND_FEATURE_ENDPOINTS: Dict[GraphRAGFeature, Tuple[Tuple[str, str], ...]] =
 }
 
 
-@dataclass
+_THREAD_POOL_SIZE_ENV = "PLEXITY_THREAD_POOL_SIZE"
+_blocking_executor: Optional[ThreadPoolExecutor] = None
+_blocking_executor_lock = threading.Lock()
+
+
+def _get_blocking_executor() -> Optional[ThreadPoolExecutor]:
+    """Return the SDK's own pool for blocking calls, or ``None`` to use the loop's default.
+
+    The pool is only created when ``PLEXITY_THREAD_POOL_SIZE`` is set, so heavy async users
+    can size it without contending for the process-wide default executor.
+    """
+
+    global _blocking_executor
+    if _blocking_executor is None:
+        size = os.environ.get(_THREAD_POOL_SIZE_ENV)
+        if not size:
+            return None
+        with _blocking_executor_lock:
+            if _blocking_executor is None:
+                _blocking_executor = ThreadPoolExecutor(
+                    max_workers=max(1, int(size)),
+                    thread_name_prefix="plexity",
+                )
+    return _blocking_executor
+
+
+@dataclass(**_SLOTS)
 class GraphRAGTelemetryContext:
     org_id: str
     environment: str = "prod"
@@ -62,12 +109,298 @@ class GraphRAGTelemetryContext:
     workflow_execution_id: Optional[str] = None
 
 
+_TELEMETRY_MAX_BATCH = 100
+_TELEMETRY_FLUSH_INTERVAL_S = 5.0
+_TELEMETRY_BUFFER_CAPACITY = 10_000
+_TELEMETRY_CHUNK_SIZE = 1024
+# Kinds whose events commonly repeat across overlapping document chunks.
+_TELEMETRY_DEDUP_KINDS = frozenset({"entity", "relationship"})
+_live_batchers: weakref.WeakSet[_TelemetryBatcher] = weakref.WeakSet()
+_LOGGER = logging.getLogger(__name__)
+
+
+def _event_digest(event: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        encoded = orjson.dumps(event, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        encoded = json.dumps(event, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _dump_event(event: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(event, default=str).decode()
+    return json.dumps(event, separators=(",", ":"), default=str)
+
+
+def _flush_live_batchers() -> None:
+    for batcher in list(_live_batchers):
+        batcher._flush_and_log()
+
+
+atexit.register(_flush_live_batchers)
+
+
+class _TelemetryBatcher:
+    """Buffer telemetry events of every kind in one bounded queue and ship them in batches.
+
+    Events are grouped by kind only when flushing, so a burst of one kind can use the whole
+    buffer. Everything pending is flushed once ``max_batch`` events are queued, when a timer
+    armed by the first buffered event fires after ``flush_interval`` seconds, or at
+    interpreter exit. When more than ``capacity`` events are pending the oldest are dropped
+    and counted in ``drop_count``. With ``deduplicate`` set, identical entity and
+    relationship events are queued once per flush window.
+    """
+
+    def __init__(
+        self,
+        senders: Dict[str, Callable[[List[Dict[str, Any]]], int]],
+        *,
+        max_batch: int = _TELEMETRY_MAX_BATCH,
+        flush_interval: float = _TELEMETRY_FLUSH_INTERVAL_S,
+        capacity: int = _TELEMETRY_BUFFER_CAPACITY,
+        deduplicate: bool = True,
+    ) -> None:
+        self._senders = senders
+        self._deduplicate = deduplicate
+        self._seen: set = set()
+        self._max_batch = max(1, int(max_batch))
+        self._flush_interval = float(flush_interval)
+        self._capacity = max(self._max_batch, int(capacity))
+        self._buffer: deque = deque(maxlen=self._capacity)
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self.buffer_high_water = 0
+        self.drop_count = 0
+        _live_batchers.add(self)
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def enqueue(self, kind: str, events: Sequence[Dict[str, Any]]) -> int:
+        if kind not in self._senders:
+            raise KeyError(kind)
+        dedup = self._deduplicate and kind in _TELEMETRY_DEDUP_KINDS
+        digests = [(kind, _event_digest(event)) for event in events] if dedup else ()
+        with self._lock:
+            if dedup:
+                seen = self._seen
+                unique: List[Dict[str, Any]] = []
+                for event, digest in zip(events, digests):
+                    if digest not in seen:
+                        seen.add(digest)
+                        unique.append(event)
+                events = unique
+            added = len(events)
+            size = self._store(kind, events) if added else self.pending
+            if size > self.buffer_high_water:
+                self.buffer_high_water = size
+            full = size >= self._max_batch
+            if added and not full and self._timer is None:
+                self._timer = threading.Timer(self._flush_interval, self._flush_and_log)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush_all()
+        return added
+
+    def _store(self, kind: str, events: Sequence[Dict[str, Any]]) -> int:
+        # Called with ``_lock`` held; returns the number of pending events.
+        buffer = self._buffer
+        overflow = len(buffer) + len(events) - self._capacity
+        if overflow > 0:
+            self.drop_count += overflow
+        buffer.extend(zip(itertools.repeat(kind), events))
+        return len(buffer)
+
+    def _end_window(self) -> Optional[threading.Timer]:
+        # Called with ``_lock`` held; the caller cancels the returned timer outside the lock.
+        timer, self._timer = self._timer, None
+        self._seen.clear()
+        return timer
+
+    def _flush_and_log(self) -> None:
+        """Flush from the timer thread or at exit, where nobody could catch a sender error."""
+
+        try:
+            self.flush_all()
+        except Exception:
+            _LOGGER.exception("GraphRAG telemetry flush failed; %d events remain pending", self.pending)
+
+    def _requeue(self, unsent: List[Tuple[str, Dict[str, Any]]]) -> None:
+        # Unsent events are older than anything queued meanwhile, so they go back in front;
+        # the capacity bound still drops the oldest.
+        with self._lock:
+            merged = [*unsent, *self._buffer]
+            overflow = len(merged) - self._capacity
+            if overflow > 0:
+                self.drop_count += overflow
+                del merged[:overflow]
+            self._buffer.clear()
+            self._buffer.extend(merged)
+
+    def flush_all(self) -> int:
+        with self._lock:
+            timer = self._end_window()
+            pending = list(self._buffer)
+            self._buffer.clear()
+        if timer is not None:
+            timer.cancel()
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for kind, event in pending:
+            grouped.setdefault(kind, []).append(event)
+        accepted = 0
+        step = self._max_batch
+        batches = [
+            (kind, events[start : start + step])
+            for kind, events in grouped.items()
+            for start in range(0, len(events), step)
+        ]
+        for index, (kind, batch) in enumerate(batches):
+            try:
+                accepted += self._senders[kind](batch)
+            except BaseException:
+                self._requeue([(k, event) for k, rest in batches[index:] for event in rest])
+                raise
+        return accepted
+
+
+class _PersistentTelemetryBatcher(_TelemetryBatcher):
+    """:class:`_TelemetryBatcher` whose buffer lives in a SQLite table instead of memory.
+
+    Events are written through on ``enqueue`` and deleted only after the backend accepted
+    their batch, so events buffered by a process that crashed are replayed (oldest first)
+    the next time a batcher opens the same file.
+    """
+
+    def __init__(
+        self,
+        senders: Dict[str, Callable[[List[Dict[str, Any]]], int]],
+        path: str | os.PathLike[str],
+        **options: Any,
+    ) -> None:
+        import sqlite3
+
+        super().__init__(senders, **options)
+        self._flush_lock = threading.Lock()
+        self._conn = sqlite3.connect(os.fspath(path), isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS telemetry_events ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, payload TEXT NOT NULL, ts REAL NOT NULL)"
+        )
+        (self._pending,) = self._conn.execute("SELECT COUNT(*) FROM telemetry_events").fetchone()
+        if self._pending:
+            self.flush_all()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _store(self, kind: str, events: Sequence[Dict[str, Any]]) -> int:
+        now = time.time()
+        conn = self._conn
+        conn.executemany(
+            "INSERT INTO telemetry_events (kind, payload, ts) VALUES (?, ?, ?)",
+            [(kind, _dump_event(event), now) for event in events],
+        )
+        self._pending += len(events)
+        overflow = self._pending - self._capacity
+        if overflow > 0:
+            dropped = conn.execute(
+                "DELETE FROM telemetry_events WHERE id IN (SELECT id FROM telemetry_events ORDER BY id LIMIT ?)",
+                (overflow,),
+            ).rowcount
+            self._pending -= dropped
+            self.drop_count += dropped
+        return self._pending
+
+    def _discard(self, ids: List[int]) -> None:
+        with self._lock:
+            deleted = self._conn.execute(
+                f"DELETE FROM telemetry_events WHERE id IN ({','.join('?' * len(ids))})", ids
+            ).rowcount
+            self._pending -= deleted
+
+    def flush_all(self) -> int:
+        with self._lock:
+            timer = self._end_window()
+        if timer is not None:
+            timer.cancel()
+        accepted = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    rows = self._conn.execute(
+                        "SELECT id, kind, payload FROM telemetry_events ORDER BY id LIMIT ?",
+                        (self._max_batch,),
+                    ).fetchall()
+                if not rows:
+                    return accepted
+                grouped: Dict[str, Tuple[List[int], List[Dict[str, Any]]]] = {}
+                for row_id, kind, payload in rows:
+                    ids, events = grouped.setdefault(kind, ([], []))
+                    ids.append(row_id)
+                    events.append(json.loads(payload))
+                for kind, (ids, events) in grouped.items():
+                    accepted += self._senders[kind](events)
+                    self._discard(ids)
+
+
 class GraphRAGTelemetry:
-    """Thin helper over :class:`PlexityClient` for GraphRAG telemetry ingest."""
+    """Thin helper over :class:`PlexityClient` for GraphRAG telemetry ingest.
+
+    With ``batch=True`` the ``record_*`` methods buffer events (up to ``buffer_capacity``)
+    and return how many were queued; they are sent once ``max_batch`` events are pending,
+    after ``flush_interval`` seconds, on :meth:`flush`, or at interpreter exit. Repeated
+    entity and relationship events are sent once per flush unless ``deduplicate=False``.
+    Passing ``persistent_path`` batches through a SQLite file instead of memory, so events
+    buffered before a crash are replayed when the next telemetry helper opens that file.
+    Without batching, the ``*_async`` variants send right away, splitting events into
+    ``chunk_size`` requests of which up to ``concurrency`` are in flight at once; with
+    batching they buffer through the same queue as the ``record_*`` methods.
+    """
 
-    def __init__(self, client: PlexityClient, context: GraphRAGTelemetryContext) -> None:
+    __slots__ = ("_client", "_context", "_defaults_cache", "_senders", "_batcher")
+
+    def __init__(
+        self,
+        client: PlexityClient,
+        context: GraphRAGTelemetryContext,
+        *,
+        batch: bool = False,
+        max_batch: int = _TELEMETRY_MAX_BATCH,
+        flush_interval: float = _TELEMETRY_FLUSH_INTERVAL_S,
+        buffer_capacity: int = _TELEMETRY_BUFFER_CAPACITY,
+        deduplicate: bool = True,
+        persistent_path: Optional[str | os.PathLike[str]] = None,
+    ) -> None:
         self._client = client
         self._context = context
+        self._defaults_cache: Tuple[Optional[Tuple[Any, ...]], Dict[str, Any], Dict[str, Any]] = (None, {}, {})
+        self._senders: Dict[str, Callable[[List[Dict[str, Any]]], int]] = {
+            "entity": client.record_graphrag_entity_events,
+            "relationship": client.record_graphrag_relationship_events,
+            "community": client.record_graphrag_community_events,
+            "query_coverage": client.record_graphrag_query_coverage,
+            "indexing": client.record_graphrag_indexing_operations,
+            "schema": client.record_graphrag_schema_snapshots,
+            "topology": client.record_graphrag_topology_snapshots,
+        }
+        options = {
+            "max_batch": max_batch,
+            "flush_interval": flush_interval,
+            "capacity": buffer_capacity,
+            "deduplicate": deduplicate,
+        }
+        self._batcher: Optional[_TelemetryBatcher] = None
+        if persistent_path is not None:
+            self._batcher = _PersistentTelemetryBatcher(self._senders, persistent_path, **options)
+        elif batch:
+            self._batcher = _TelemetryBatcher(self._senders, **options)
 
     def update_context(self, **kwargs: Any) -> None:
         if "org_id" in kwargs:
@@ -79,44 +412,165 @@ class GraphRAGTelemetry:
         if "workflow_execution_id" in kwargs:
             self._context.workflow_execution_id = kwargs["workflow_execution_id"]
 
+    @property
+    def buffer_stats(self) -> Dict[str, int]:
+        """Pending count, high-water mark and dropped events of the batching buffer."""
+
+        batcher = self._batcher
+        if batcher is None:
+            return {"pending": 0, "buffer_high_water": 0, "drop_count": 0}
+        return {
+            "pending": batcher.pending,
+            "buffer_high_water": batcher.buffer_high_water,
+            "drop_count": batcher.drop_count,
+        }
+
+    def flush(self) -> int:
+        """Send any buffered events now; returns the number accepted by the backend."""
+
+        if self._batcher is None:
+            return 0
+        return self._batcher.flush_all()
+
     def record_entity_events(self, events: Iterable[Dict[str, Any]]) -> int:
-        payload = [self._decorate(e) for e in events]
-        return self._client.record_graphrag_entity_events(payload)
+        return self._emit("entity", self._iter_decorated(events))
 
     def record_relationship_events(self, events: Iterable[Dict[str, Any]]) -> int:
-        payload = [self._decorate(e) for e in events]
-        return self._client.record_graphrag_relationship_events(payload)
+        return self._emit("relationship", self._iter_decorated(events))
 
     def record_community_events(self, events: Iterable[Dict[str, Any]]) -> int:
-        payload = [self._decorate(e) for e in events]
-        return self._client.record_graphrag_community_events(payload)
+        return self._emit("community", self._iter_decorated(events))
 
     def record_query_coverage(self, events: Iterable[Dict[str, Any]]) -> int:
-        payload = [self._decorate(e, include_trigger=False) for e in events]
-        return self._client.record_graphrag_query_coverage(payload)
+        return self._emit("query_coverage", self._iter_decorated(events, include_trigger=False))
 
     def record_indexing_operations(self, events: Iterable[Dict[str, Any]]) -> int:
-        payload = [self._decorate(e) for e in events]
-        return self._client.record_graphrag_indexing_operations(payload)
+        return self._emit("indexing", self._iter_decorated(events))
 
     def record_schema_snapshots(self, events: Iterable[Dict[str, Any]]) -> int:
-        payload = [self._decorate(e, include_trigger=False) for e in events]
-        return self._client.record_graphrag_schema_snapshots(payload)
+        return self._emit("schema", self._iter_decorated(events, include_trigger=False))
 
     def record_topology_snapshots(self, events: Iterable[Dict[str, Any]]) -> int:
-        payload = [self._decorate(e, include_trigger=False) for e in events]
-        return self._client.record_graphrag_topology_snapshots(payload)
-
-    def _decorate(self, event: Dict[str, Any], *, include_trigger: bool = True) -> Dict[str, Any]:
-        enriched = dict(event)
-        enriched.setdefault("orgId", self._context.org_id)
-        enriched.setdefault("environment", self._context.environment)
-        if include_trigger:
-            if "triggeredBy" not in enriched and self._context.triggered_by:
-                enriched["triggeredBy"] = self._context.triggered_by
-            if "workflowExecutionId" not in enriched and self._context.workflow_execution_id:
-                enriched["workflowExecutionId"] = self._context.workflow_execution_id
-        return enriched
+        return self._emit("topology", self._iter_decorated(events, include_trigger=False))
+
+    async def record_entity_events_async(
+        self, events: Iterable[Dict[str, Any]], *, chunk_size: int = 500, concurrency: int = 8
+    ) -> int:
+        return await self._emit_async("entity", self._iter_decorated(events), chunk_size, concurrency)
+
+    async def record_relationship_events_async(
+        self, events: Iterable[Dict[str, Any]], *, chunk_size: int = 500, concurrency: int = 8
+    ) -> int:
+        return await self._emit_async("relationship", self._iter_decorated(events), chunk_size, concurrency)
+
+    async def record_community_events_async(
+        self, events: Iterable[Dict[str, Any]], *, chunk_size: int = 500, concurrency: int = 8
+    ) -> int:
+        return await self._emit_async("community", self._iter_decorated(events), chunk_size, concurrency)
+
+    async def record_query_coverage_async(
+        self, events: Iterable[Dict[str, Any]], *, chunk_size: int = 500, concurrency: int = 8
+    ) -> int:
+        decorated = self._iter_decorated(events, include_trigger=False)
+        return await self._emit_async("query_coverage", decorated, chunk_size, concurrency)
+
+    async def record_indexing_operations_async(
+        self, events: Iterable[Dict[str, Any]], *, chunk_size: int = 500, concurrency: int = 8
+    ) -> int:
+        return await self._emit_async("indexing", self._iter_decorated(events), chunk_size, concurrency)
+
+    async def record_schema_snapshots_async(
+        self, events: Iterable[Dict[str, Any]], *, chunk_size: int = 500, concurrency: int = 8
+    ) -> int:
+        decorated = self._iter_decorated(events, include_trigger=False)
+        return await self._emit_async("schema", decorated, chunk_size, concurrency)
+
+    async def record_topology_snapshots_async(
+        self, events: Iterable[Dict[str, Any]], *, chunk_size: int = 500, concurrency: int = 8
+    ) -> int:
+        decorated = self._iter_decorated(events, include_trigger=False)
+        return await self._emit_async("topology", decorated, chunk_size, concurrency)
+
+    def _emit(self, kind: str, events: Iterator[Dict[str, Any]]) -> int:
+        # Decorated events are materialised at most ``_TELEMETRY_CHUNK_SIZE`` at a time, so
+        # large generators (e.g. read from disk or Neo4j) are never held in memory whole.
+        handle = self._senders[kind] if self._batcher is None else functools.partial(self._batcher.enqueue, kind)
+        total = 0
+        while True:
+            chunk = list(itertools.islice(events, _TELEMETRY_CHUNK_SIZE))
+            if not chunk:
+                return total
+            total += handle(chunk)
+
+    async def _emit_async(
+        self,
+        kind: str,
+        events: Iterator[Dict[str, Any]],
+        chunk_size: int,
+        concurrency: int,
+    ) -> int:
+        # Chunks are produced lazily and sent concurrently, at most ``concurrency`` at a time, so
+        # large generators are never materialised whole. Async clients (e.g. AsyncPlexityClient)
+        # are awaited directly; blocking calls, including batcher enqueues, run on worker threads.
+        step = max(1, int(chunk_size))
+        chunks = iter(lambda: list(itertools.islice(events, step)), [])
+        loop = asyncio.get_running_loop()
+        executor = _get_blocking_executor()
+        if self._batcher is not None:
+            # Buffered like the sync methods, in order, so dedup, the SQLite buffer and event
+            # ordering behave the same whichever variant queued them.
+            total = 0
+            for chunk in chunks:
+                total += await loop.run_in_executor(executor, self._batcher.enqueue, kind, chunk)
+            return total
+
+        send = self._senders[kind]
+        if not inspect.iscoroutinefunction(send):
+            send = functools.partial(loop.run_in_executor, executor, send)
+        limit = max(1, int(concurrency))
+        in_flight: set = set()
+        total = 0
+        try:
+            for chunk in chunks:
+                if len(in_flight) >= limit:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    total += sum(task.result() for task in done)
+                in_flight.add(asyncio.ensure_future(send(chunk)))
+            if in_flight:
+                total += sum(await asyncio.gather(*in_flight))
+        except BaseException:
+            for task in in_flight:
+                task.cancel()
+            raise
+        return total
+
+    def _iter_decorated(
+        self,
+        events: Iterable[Dict[str, Any]],
+        *,
+        include_trigger: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        defaults = self._defaults(include_trigger)
+        return ({**defaults, **event} for event in events)
+
+    def _defaults(self, include_trigger: bool) -> Dict[str, Any]:
+        # Rebuilt only when the context changes; keyed on its values because callers may
+        # mutate the shared ``GraphRAGTelemetryContext`` directly.
+        ctx = self._context
+        key = (ctx.org_id, ctx.environment, ctx.triggered_by, ctx.workflow_execution_id)
+        # Key and defaults live in one tuple, swapped in a single assignment, so a concurrent
+        # caller never pairs a new key with stale defaults.
+        cached = self._defaults_cache
+        if cached[0] != key:
+            base = {"orgId": ctx.org_id, "environment": ctx.environment}
+            with_trigger = dict(base)
+            if ctx.triggered_by:
+                with_trigger["triggeredBy"] = ctx.triggered_by
+            if ctx.workflow_execution_id:
+                with_trigger["workflowExecutionId"] = ctx.workflow_execution_id
+            cached = (key, base, with_trigger)
+            self._defaults_cache = cached
+        return cached[2] if include_trigger else cached[1]
 
 
 class GraphRAGClient:
@@ -141,6 +595,7 @@ class GraphRAGClient:
         storage_registry: Optional[StorageAdapterRegistry] = None,
         default_storage_adapter: Optional[str] = None,
         validate_backend_support: bool = True,
+        prefer_options_probe: bool = False,
     ) -> None:
         self._client = client
         self._org_id = org_id
@@ -150,6 +605,7 @@ class GraphRAGClient:
         self._shard_id = shard_id
         self._access_policy = access_policy
         self._encryption_context = encryption
+        self._context_base = self._build_context_base()
         self._scheduler = scheduler
         self._storage_registry = storage_registry or StorageAdapterRegistry()
         self._default_storage_adapter = default_storage_adapter
@@ -158,8 +614,17 @@ class GraphRAGClient:
             enable=enable_features,
             disable=disable_features,
         )
+        self._enabled_features = self._runtime_profile.feature_flags.enabled
+        self._neo4j_lock = threading.Lock()
+        self._neo4j_managers: Dict[Neo4jConnectionConfig, Neo4jDriverManager] = {}
+        self._neo4j_planners: Dict[Neo4jDriverManager, Neo4jSchemaPlanner] = {}
+        self._neo4j_executors: Dict[Tuple[Neo4jDriverManager, int], Neo4jTransactionalBatchExecutor] = {}
         self._validate_backend_support = bool(validate_backend_support)
+        self._prefer_options_probe = bool(prefer_options_probe)
         self._feature_capabilities: Dict[GraphRAGFeature, bool] = {}
+        self._probe_results: Dict[Tuple[str, str], bool] = {}
+        self._capabilities_probed = False
+        self._slice_batch_supported = True
         if self._validate_backend_support:
             self.validate_backend_support(strict=True)
 
@@ -252,6 +717,7 @@ class GraphRAGClient:
             self._access_policy = access_policy
         if encryption is not None:
             self._encryption_context = encryption
+        self._context_base = self._build_context_base()
         if default_storage_adapter is not None:
             self._default_storage_adapter = default_storage_adapter
 
@@ -259,6 +725,24 @@ class GraphRAGClient:
         merged = self._merge_context(options)
         return self._client.search_graphrag(query, **merged)
 
+    async def asearch(self, query: str, **options: Any) -> Any:
+        """Async variant of :meth:`search`.
+
+        Awaits the underlying client directly when it is asynchronous (e.g. an
+        :class:`AsyncPlexityClient`); otherwise the blocking call runs in a worker thread,
+        on a dedicated pool when ``PLEXITY_THREAD_POOL_SIZE`` is set.
+        """
+
+        merged = self._merge_context(options)
+        search = self._client.search_graphrag
+        if inspect.iscoroutinefunction(search):
+            return await search(query, **merged)
+        executor = _get_blocking_executor()
+        if executor is None:
+            return await asyncio.to_thread(search, query, **merged)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(search, query, **merged))
+
     def index_documents(self, documents: Iterable[Dict[str, Any]], **options: Any) -> Any:
         merged = self._merge_context(options)
         return self._client.index_graphrag(documents, **merged)
@@ -279,22 +763,31 @@ class GraphRAGClient:
         merged = self._merge_context(options)
         return self._client.get_graphrag_communities(**merged)
 
+    def _build_context_base(self) -> Dict[str, Any]:
+        # Context only changes through ``update_context`` and the policy/encryption setters, so
+        # the scalar keys are resolved once here. The policy payloads are serialised per call in
+        # ``_merge_context`` so no two requests share their nested dicts.
+        base: Dict[str, Any] = {}
+        if self._org_id:
+            base["org_id"] = self._org_id
+        if self._environment:
+            base["environment"] = self._environment
+        if self._team_id is not None:
+            base["team_id"] = self._team_id
+        if self._graph_id:
+            base["graph_id"] = self._graph_id
+        if self._shard_id:
+            base["shard_id"] = self._shard_id
+        return base
+
     def _merge_context(self, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        merged: Dict[str, Any] = dict(overrides or {})
-        if self._org_id and "org_id" not in merged:
-            merged["org_id"] = self._org_id
-        if self._environment and "environment" not in merged:
-            merged["environment"] = self._environment
-        if self._team_id is not None and "team_id" not in merged:
-            merged["team_id"] = self._team_id
-        if self._graph_id and "graph_id" not in merged:
-            merged["graph_id"] = self._graph_id
-        if self._shard_id and "shard_id" not in merged:
-            merged["shard_id"] = self._shard_id
-        if self._access_policy and "access_policy" not in merged:
+        merged = dict(self._context_base)
+        if self._access_policy:
             merged["access_policy"] = self._access_policy.to_dict()
-        if self._encryption_context and "encryption" not in merged:
+        if self._encryption_context:
             merged["encryption"] = self._encryption_context.to_dict()
+        if overrides:
+            merged.update(overrides)
         return merged
 
     def offload_intermediate_state(
@@ -318,13 +811,13 @@ class GraphRAGClient:
         storage_adapter.delete_object(key)
 
     def _require_feature(self, feature: GraphRAGFeature) -> None:
-        if not self.feature_flags.is_enabled(feature):
+        if feature not in self._enabled_features:
             raise RuntimeError(
                 f"Feature '{feature.value}' is not enabled for the current GraphRAG runtime profile"
             )
         if self._validate_backend_support and feature in _BACKEND_FEATURE_ENDPOINTS:
             supported = self._feature_capabilities.get(feature)
-            if supported is None:
+            if supported is None and not self._capabilities_probed:
                 self.validate_backend_support()
                 supported = self._feature_capabilities.get(feature)
             if supported is False:
@@ -334,7 +827,13 @@ class GraphRAGClient:
                 )
 
     def validate_backend_support(self, *, strict: bool = False) -> Dict[GraphRAGFeature, bool]:
-        """Probe the orchestrator to confirm feature-dependent routes exist."""
+        """Probe the orchestrator to confirm feature-dependent routes exist.
+
+        Only features enabled in the runtime profile are checked. Each route is probed at
+        most once per client, concurrently, with its own method (preceded by ``OPTIONS`` when
+        the client was created with ``prefer_options_probe=True``); later calls reuse the
+        recorded result.
+        """
 
         probe = getattr(self._client, "probe_endpoint", None)
         if not callable(probe):
@@ -345,22 +844,35 @@ class GraphRAGClient:
                 )
             return {}
 
+        def route_exists(route: Tuple[str, str]) -> bool:
+            method, path = route
+            if self._prefer_options_probe and probe("OPTIONS", path):
+                return True
+            return bool(probe(method, path))
+
+        features = [feature for feature in _BACKEND_FEATURE_ENDPOINTS if feature in self._enabled_features]
+        probes = self._probe_results
+        routes = list(
+            dict.fromkeys(
+                route for feature in features for route in _BACKEND_FEATURE_ENDPOINTS[feature] if route not in probes
+            )
+        )
+        if len(routes) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(routes)), thread_name_prefix="plexity-probe") as pool:
+                probes.update(zip(routes, pool.map(route_exists, routes)))
+        elif routes:
+            probes[routes[0]] = route_exists(routes[0])
+
         capabilities: Dict[GraphRAGFeature, bool] = {}
-        for feature, endpoints in _BACKEND_FEATURE_ENDPOINTS.items():
-            supported = True
-            for method, path in endpoints:
-                if probe("OPTIONS", path):
-                    continue
-                if not probe(method, path):
-                    supported = False
-                    break
+        for feature in features:
+            supported = all(probes[route] for route in _BACKEND_FEATURE_ENDPOINTS[feature])
             capabilities[feature] = supported
             self._feature_capabilities[feature] = supported
+        # Only a completed round counts; a probe that raised leaves the features to be retried.
+        self._capabilities_probed = True
 
         if strict:
-            missing = sorted(
-                feature.value for feature, ok in capabilities.items() if not ok and self.feature_flags.is_enabled(feature)
-            )
+            missing = sorted(feature.value for feature, ok in capabilities.items() if not ok)
             if missing:
                 raise RuntimeError(
                     "GraphRAG backend is missing required endpoints for: " + ", ".join(missing)
@@ -412,6 +924,8 @@ class GraphRAGClient:
     ) -> IncrementalJobHandle:
         self._require_feature(GraphRAGFeature.INCREMENTAL_JOB_ADVISOR)
         scheduler = self._require_scheduler()
+        from .orchestration import IncrementalJobSpec
+
         spec = IncrementalJobSpec(
             job_type=job_type,
             payload=self._merge_context(dict(payload)),
@@ -430,6 +944,8 @@ class GraphRAGClient:
     ) -> IncrementalJobHandle:
         self._require_feature(GraphRAGFeature.INCREMENTAL_JOB_ADVISOR)
         scheduler = self._require_scheduler()
+        from .orchestration import IncrementalJobSpec
+
         spec = IncrementalJobSpec(
             job_type=job_type,
             payload=self._merge_context(dict(payload)),
@@ -485,19 +1001,63 @@ class GraphRAGClient:
             merged["idempotency_key"] = idempotency_key
         return self._client.trigger_graphrag_incremental_job_slice(**merged)
 
+    def trigger_incremental_job_slice_batch(
+        self,
+        slices: Iterable[Dict[str, Any]],
+        *,
+        chunk: int = 50,
+    ) -> List[Any]:
+        """Trigger many incremental job slices with one request per ``chunk`` slices.
+
+        Falls back to one request per slice when the client or backend has no batch
+        endpoint. Returns the response of every request made, in order.
+        """
+
+        self._require_feature(GraphRAGFeature.INCREMENTAL_JOB_ADVISOR)
+        merged = [self._merge_context(dict(item)) for item in slices]
+        step = max(1, int(chunk))
+        batch_trigger = getattr(self._client, "trigger_graphrag_incremental_job_slices_batch", None)
+        responses: List[Any] = []
+        for start in range(0, len(merged), step):
+            window = merged[start : start + step]
+            if batch_trigger is not None and self._slice_batch_supported:
+                try:
+                    responses.append(batch_trigger(window))
+                    continue
+                except PlexityError as exc:
+                    if exc.status_code not in (404, 405):
+                        raise
+                    self._slice_batch_supported = False
+            responses.extend(self._client.trigger_graphrag_incremental_job_slice(**item) for item in window)
+        return responses
+
     def apply_compliance_directive(self, directive: ComplianceDirective) -> Any:
         self._require_feature(GraphRAGFeature.ENTERPRISE_ADDONS)
         merged = self._merge_context({})
         return self._client.apply_graphrag_compliance_directive(directive=directive.to_dict(), **merged)
 
     # ------------------------------------------------------------------ Neo4j helpers
+    # Managers, planners and executors are cached per client so the schema snapshot / plan /
+    # apply sequence shares one driver and connection pool instead of opening one per call.
     def create_neo4j_driver_manager(self, config: Neo4jConnectionConfig) -> Neo4jDriverManager:
         self._require_feature(GraphRAGFeature.NEO4J_SUPPORT)
-        return Neo4jDriverManager(config)
+        from .neo4j import Neo4jDriverManager
+
+        with self._neo4j_lock:
+            manager = self._neo4j_managers.get(config)
+            if manager is None:
+                manager = self._neo4j_managers[config] = Neo4jDriverManager(config)
+        return manager
 
     def create_neo4j_schema_planner(self, manager: Neo4jDriverManager) -> Neo4jSchemaPlanner:
         self._require_feature(GraphRAGFeature.SCHEMA_DIFF)
-        return Neo4jSchemaPlanner(manager)
+        from .neo4j import Neo4jSchemaPlanner
+
+        with self._neo4j_lock:
+            planner = self._neo4j_planners.get(manager)
+            if planner is None:
+                planner = self._neo4j_planners[manager] = Neo4jSchemaPlanner(manager)
+        return planner
 
     def create_neo4j_batch_executor(
         self,
@@ -506,7 +1066,25 @@ class GraphRAGClient:
         batch_size: int = 50,
     ) -> Neo4jTransactionalBatchExecutor:
         self._require_feature(GraphRAGFeature.SCHEMA_DIFF)
-        return Neo4jTransactionalBatchExecutor(manager, batch_size=batch_size)
+        from .neo4j import Neo4jTransactionalBatchExecutor
+
+        key = (manager, batch_size)
+        with self._neo4j_lock:
+            executor = self._neo4j_executors.get(key)
+            if executor is None:
+                executor = self._neo4j_executors[key] = Neo4jTransactionalBatchExecutor(manager, batch_size=batch_size)
+        return executor
+
+    def close_neo4j(self) -> None:
+        """Close every cached Neo4j driver manager and forget the cached helpers."""
+
+        with self._neo4j_lock:
+            managers = list(self._neo4j_managers.values())
+            self._neo4j_managers.clear()
+            self._neo4j_planners.clear()
+            self._neo4j_executors.clear()
+        for manager in managers:
+            manager.close()
 
     def recommend_neo4j_job_slices(
         self,
@@ -516,6 +1094,8 @@ class GraphRAGClient:
         limit: int = 25,
     ) -> List[JobSliceRecommendation]:
         self._require_feature(GraphRAGFeature.NEO4J_SUPPORT)
+        from .neo4j import Neo4jIncrementalJobAdvisor
+
         advisor = Neo4jIncrementalJobAdvisor(manager)
         return advisor.recommend(labels=list(labels) if labels else None, limit=limit)
 
@@ -553,6 +1133,102 @@ class GraphRAGClient:
         return invoke_incremental_ingestion_plugin(plugin_name, self, slice_payload)
 
 
+# Skip pip's self-update check, interactive prompts and ahead-of-time bytecode compilation;
+# prefer wheels so optional C extensions are not built from sdists.
+_PIP_INSTALL_FLAGS: Tuple[str, ...] = (
+    "--disable-pip-version-check",
+    "--no-input",
+    "--no-compile",
+    "--prefer-binary",
+    "--no-warn-script-location",
+)
+# Bytecode is written lazily on first import instead of during provisioning.
+_PROVISION_ENV: Dict[str, str] = {"PIP_DISABLE_PIP_VERSION_CHECK": "1", "PYTHONDONTWRITEBYTECODE": "1"}
+# Exits non-zero (PackageNotFoundError) when graphrag is not installed in the interpreter.
+_GRAPHRAG_PROBE = "import importlib.metadata; importlib.metadata.distribution('graphrag')"
+
+
+_IS_WIN = sys.platform == "win32"
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_cached(path: str, cwd: str) -> Path:
+    return Path(cwd, path).resolve()
+
+
+def _resolve(path: str) -> Path:
+    # ``resolve`` stats every path component; repeated provisioning probes reuse the result.
+    # Relative paths are keyed on the working directory they are resolved against.
+    return _resolve_cached(path, "" if os.path.isabs(path) else os.getcwd())
+
+
+def _discard_tree(path: Path) -> None:
+    """Move ``path`` out of the way and delete it in the background.
+
+    Renaming within the same directory is a single metadata operation, so a replacement can
+    be created immediately while the (often large) old tree is removed concurrently.
+    """
+
+    doomed = path.with_name(f"{path.name}.old-{os.getpid()}-{threading.get_ident()}")
+    try:
+        os.rename(path, doomed)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    _remove_in_background([doomed])
+
+
+def _sweep_discarded_trees(path: Path) -> None:
+    """Remove ``.old-*`` siblings of ``path`` whose background delete was cut short by exit."""
+
+    # Only names ``_discard_tree`` generates, never e.g. a user's ``<venv>.old-backup``.
+    pattern = re.compile(rf"{re.escape(path.name)}\.old-\d+-\d+")
+    stale = [
+        entry
+        for entry in path.parent.glob(f"{glob.escape(path.name)}.old-*")
+        if pattern.fullmatch(entry.name) and entry.is_dir()
+    ]
+    if stale:
+        _remove_in_background(stale)
+
+
+def _remove_in_background(paths: Sequence[Path]) -> None:
+    # Daemon thread: exit does not wait for it, and the next provision sweeps any leftovers.
+    def remove() -> None:
+        for target in paths:
+            shutil.rmtree(target, ignore_errors=True)
+
+    threading.Thread(target=remove, name="plexity-rmtree", daemon=True).start()
+
+
+def _host_has_graphrag(version: Optional[str]) -> bool:
+    """Whether the current interpreter already has (the requested version of) graphrag."""
+
+    from importlib import metadata
+
+    try:
+        installed = metadata.version("graphrag")
+    except metadata.PackageNotFoundError:
+        return False
+    return version is None or installed == version
+
+
+def _venv_has_graphrag(venv_path: Path) -> Optional[bool]:
+    """Read graphrag's metadata straight from the venv's site-packages, without a subprocess.
+
+    Returns ``None`` when no site-packages directory is found, leaving the caller to ask the
+    venv's interpreter instead.
+    """
+
+    from importlib import metadata
+
+    pattern = "Lib/site-packages" if _IS_WIN else "lib/python*/site-packages"
+    site_dirs = [str(path) for path in venv_path.glob(pattern)]
+    if not site_dirs:
+        return None
+    return next(iter(metadata.distributions(name="graphrag", path=site_dirs)), None) is not None
+
+
 def ensure_microsoft_graphrag_runtime(
     *,
     virtual_env: str = "graphrag_env",
@@ -565,38 +1241,61 @@ def ensure_microsoft_graphrag_runtime(
     skip_if_installed: bool = True,
     logger: Optional[Callable[[str], None]] = None,
     verbose: bool = False,
+    prefer_uv: bool = False,
 ) -> None:
     """Provision a Microsoft GraphRAG runtime using pure Python tooling.
 
-    Mirrors the Node.js helper for environments that prefer Python orchestration.
+    Mirrors the Node.js helper for environments that prefer Python orchestration. When no
+    interpreter is given and the current one already has the requested graphrag version
+    (and the workspace exists), nothing is provisioned. With ``prefer_uv`` the virtual
+    environment is created and populated by ``uv`` when it is on ``PATH``; such
+    environments do not include pip.
     """
 
-    python_cmd = python_executable or sys.executable
-    venv_path = Path(virtual_env).resolve()
-    workspace_path = Path(workspace).resolve()
-
     def _log(message: str) -> None:
         if logger is not None:
             logger(message)
         elif verbose:
             print(f"[plexity-sdk] {message}")
 
+    if (
+        python_executable is None
+        and skip_if_installed
+        and not (force_virtualenv or force_workspace or extra_packages)
+        and _host_has_graphrag(graphrag_version)
+        and os.path.isdir(workspace)
+    ):
+        _log("graphrag runtime already satisfied in-process")
+        return
+
+    python_cmd = python_executable or sys.executable
+    venv_path = _resolve(virtual_env)
+    workspace_path = _resolve(workspace)
+    run_env = {**os.environ, **_PROVISION_ENV}
+    uv_bin = shutil.which("uv") if prefer_uv else None
+
     def _run(command: Sequence[str], *, cwd: Optional[str] = None) -> None:
-        _log(f"Running: {' '.join(command)}")
+        if logger is not None or verbose:
+            _log("Running: " + " ".join(command))
         try:
-            subprocess.run(command, check=True, cwd=cwd)
+            # No stdin: provisioning runs unattended, so a prompt must fail fast, not hang.
+            subprocess.run(command, check=True, cwd=cwd, stdin=subprocess.DEVNULL, env=run_env)
         except subprocess.CalledProcessError as exc:  # pragma: no cover - surfaced in tests
             cmd = " ".join(command)
             raise RuntimeError(f"Command failed with exit code {exc.returncode}: {cmd}") from exc
 
+    _sweep_discarded_trees(venv_path)
     if venv_path.exists() and force_virtualenv:
         _log(f"Removing existing virtual environment at {venv_path}")
-        shutil.rmtree(venv_path)
+        _discard_tree(venv_path)
     if not venv_path.exists():
         _log(f"Creating virtual environment at {venv_path}")
-        _run([python_cmd, "-m", "venv", str(venv_path)])
+        if uv_bin is not None:
+            _run([uv_bin, "venv", "--python", python_cmd, str(venv_path)])
+        else:
+            _run([python_cmd, "-m", "venv", str(venv_path)])
 
-    if sys.platform == "win32":
+    if _IS_WIN:
         python_bin = venv_path / "Scripts" / "python.exe"
         pip_bin = venv_path / "Scripts" / "pip.exe"
     else:
@@ -604,12 +1303,21 @@ def ensure_microsoft_graphrag_runtime(
         pip_bin = venv_path / "bin" / "pip"
 
     def _package_installed() -> bool:
-        result = subprocess.run(
-            [str(pip_bin), "show", "graphrag"],
-            check=False,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        found = _venv_has_graphrag(venv_path)
+        if found is not None:
+            return found
+        # Unknown layout: ask the venv's interpreter for the distribution metadata; starting
+        # pip just to run ``pip show`` costs far more than importing importlib.metadata.
+        probe = [str(python_bin), "-c", _GRAPHRAG_PROBE]
+        try:
+            result = subprocess.run(probe, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except FileNotFoundError:
+            result = subprocess.run(
+                [str(pip_bin), "show", "graphrag"],
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
         return result.returncode == 0
 
     should_install = True
@@ -623,9 +1331,13 @@ def ensure_microsoft_graphrag_runtime(
         install_targets.append(package)
     if extra_packages:
         install_targets.extend(extra_packages)
-    if install_targets:
-        _run([str(pip_bin), "install", "--upgrade", "pip", "setuptools", "wheel"])
-        _run([str(pip_bin), "install", *install_targets])
+    if install_targets and uv_bin is not None:
+        _run([uv_bin, "pip", "install", "--python", str(python_bin), *install_targets])
+    elif install_targets:
+        # ``--upgrade`` cannot be scoped per requirement, so only the tooling run carries it and
+        # already-installed targets keep their versions.
+        _run([str(pip_bin), "install", *_PIP_INSTALL_FLAGS, "--upgrade", "pip", "setuptools", "wheel"])
+        _run([str(pip_bin), "install", *_PIP_INSTALL_FLAGS, *install_targets])
 
     if not workspace_path.exists() or force_workspace:
         _log(f"Initialising GraphRAG workspace at {workspace_path}")
@@ -634,6 +1346,6 @@ def ensure_microsoft_graphrag_runtime(
             [str(python_bin), "-m", "graphrag", "init", "--workspace", str(workspace_path), "--non-interactive"],
             cwd=str(workspace_path),
         )
-
-    # Basic smoke test
-    _run([str(python_bin), "-c", "import graphrag"])
+    else:
+        # Basic smoke test; ``graphrag init`` above already imports the package.
+        _run([str(python_bin), "-c", "import graphrag"])
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from enum import Enum
 from typing import FrozenSet, Iterable, Mapping, Optional, Sequence, Set
@@ -80,6 +81,19 @@ _FEATURE_DEPENDENCIES: Mapping[GraphRAGFeature, FrozenSet[str]] = {
 }
 
 
+# Members are ``str`` subclasses, so both members and their raw values hit this table.
+_FEATURES_BY_VALUE: Mapping[str, GraphRAGFeature] = {feature.value: feature for feature in GraphRAGFeature}
+
+
+def _normalize_features(values: Optional[Iterable[GraphRAGFeature | str]]) -> FrozenSet[GraphRAGFeature]:
+    if not values:
+        return frozenset()
+    try:
+        return frozenset(_FEATURES_BY_VALUE[value] for value in values)
+    except KeyError as exc:
+        raise ValueError(f"{exc.args[0]!r} is not a valid {GraphRAGFeature.__name__}") from None
+
+
 def resolve_runtime_profile(
     package: GraphRAGPackage | str,
     *,
@@ -88,34 +102,46 @@ def resolve_runtime_profile(
 ) -> GraphRAGRuntimeProfile:
     """Resolve a runtime profile for the given package channel.
 
+    Profiles are immutable, so identical requests share one cached instance; plain package
+    profiles (no ``enable``/``disable``) are looked up without any normalisation.
+
     Args:
         package: Package identifier (`core` or `enterprise`).
         enable: Extra features to enable regardless of package defaults.
         disable: Features to disable from the resulting profile.
     """
 
-    package_enum = GraphRAGPackage(package)
-    defaults = set(_PACKAGE_DEFAULTS[package_enum])
+    if not enable and not disable:
+        profile = _DEFAULT_PROFILES.get(package)
+        if profile is not None:
+            return profile
+    return _resolve_profile(
+        GraphRAGPackage(package),
+        _normalize_features(enable),
+        _normalize_features(disable),
+    )
 
-    def _normalize(values: Optional[Iterable[GraphRAGFeature | str]]) -> Set[GraphRAGFeature]:
-        resolved: Set[GraphRAGFeature] = set()
-        if not values:
-            return resolved
-        for value in values:
-            resolved.add(GraphRAGFeature(value))
-        return resolved
 
-    defaults.update(_normalize(enable))
-    defaults.difference_update(_normalize(disable))
-    frozen = frozenset(defaults)
-    flags = GraphRAGFeatureFlags(enabled=frozen)
+@functools.lru_cache(maxsize=64)
+def _resolve_profile(
+    package: GraphRAGPackage,
+    enable: FrozenSet[GraphRAGFeature],
+    disable: FrozenSet[GraphRAGFeature],
+) -> GraphRAGRuntimeProfile:
+    enabled = (_PACKAGE_DEFAULTS[package] | enable) - disable
 
     optional_dependencies: Set[str] = set()
-    for feature in frozen:
+    for feature in enabled:
         optional_dependencies.update(_FEATURE_DEPENDENCIES.get(feature, ()))
 
     return GraphRAGRuntimeProfile(
-        package=package_enum,
-        feature_flags=flags,
+        package=package,
+        feature_flags=GraphRAGFeatureFlags(enabled=enabled),
         optional_dependencies=frozenset(optional_dependencies),
     )
+
+
+# Members are ``str`` subclasses, so plain ``"core"`` / ``"enterprise"`` strings hit these keys.
+_DEFAULT_PROFILES: Mapping[GraphRAGPackage, GraphRAGRuntimeProfile] = {
+    package: _resolve_profile(package, frozenset(), frozenset()) for package in GraphRAGPackage
+}
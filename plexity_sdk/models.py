@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional
 
 __all__ = ["WorkflowSummary", "ExecutionSummary"]
 
+# ``slots=True`` is only understood by dataclasses on Python 3.10+.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class WorkflowSummary:
     """Typed representation of a workflow returned by the Plexity API."""
 
@@ -16,9 +20,16 @@ class WorkflowSummary:
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "WorkflowSummary":
+        summary = cls._coerce(payload)
+        if summary is None:
+            raise ValueError("workflow payload is missing an 'id' field")
+        return summary
+
+    @classmethod
+    def _coerce(cls, payload: Dict[str, Any]) -> Optional["WorkflowSummary"]:
         identifier = payload.get("id") or payload.get("workflow_id")
         if not identifier:
-            raise ValueError("workflow payload is missing an 'id' field")
+            return None
         return cls(
             id=str(identifier),
             name=payload.get("name"),
@@ -35,16 +46,19 @@ class WorkflowSummary:
         else:
             items = []
         summaries: List[WorkflowSummary] = []
+        append = summaries.append
+        # Bound once so each item goes through the same construction path as ``from_dict``.
+        coerce = cls._coerce
         for item in items:
-            if isinstance(item, dict):
-                try:
-                    summaries.append(cls.from_dict(item))
-                except ValueError:
-                    continue
+            if not isinstance(item, dict):
+                continue
+            summary = coerce(item)
+            if summary is not None:
+                append(summary)
         return summaries
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ExecutionSummary:
     """Typed representation of an execution status returned by the API."""
 
@@ -57,9 +71,16 @@ class ExecutionSummary:
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "ExecutionSummary":
+        summary = cls._coerce(payload)
+        if summary is None:
+            raise ValueError("execution payload is missing an 'id' field")
+        return summary
+
+    @classmethod
+    def _coerce(cls, payload: Dict[str, Any]) -> Optional["ExecutionSummary"]:
         identifier = payload.get("id") or payload.get("execution_id")
         if not identifier:
-            raise ValueError("execution payload is missing an 'id' field")
+            return None
         return cls(
             id=str(identifier),
             workflow_id=payload.get("workflow_id"),
@@ -79,10 +100,12 @@ class ExecutionSummary:
         else:
             items = []
         summaries: List[ExecutionSummary] = []
+        append = summaries.append
+        coerce = cls._coerce
         for item in items:
-            if isinstance(item, dict):
-                try:
-                    summaries.append(cls.from_dict(item))
-                except ValueError:
-                    continue
+            if not isinstance(item, dict):
+                continue
+            summary = coerce(item)
+            if summary is not None:
+                append(summary)
         return summaries
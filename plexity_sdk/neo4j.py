@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+import contextlib
+import functools
+import hashlib
+import threading
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 
 try:
     from neo4j import GraphDatabase, Transaction  # type: ignore
@@ -13,6 +17,11 @@ except ImportError:  # pragma: no cover - optional dependency
     Transaction = Any  # type: ignore
     Neo4jError = RuntimeError  # type: ignore
 
+try:
+    import xxhash  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None  # type: ignore
+
 __all__ = [
     "Neo4jConnectionConfig",
     "Neo4jDriverManager",
@@ -36,6 +45,31 @@ def _require_neo4j_driver() -> None:
         )
 
 
+# Full index / constraint definitions, collapsed server-side into one row each. Label and
+# relationship property maps are deliberately not covered: Neo4j never drops tokens from
+# db.labels()/db.propertyKeys(), and reusing a key on another label changes no token list,
+# so only ``db.schema.*TypeProperties()`` itself can tell whether they changed.
+_SCHEMA_FINGERPRINT_QUERIES: Tuple[str, ...] = (
+    "SHOW INDEXES YIELD name, type, entityType, labelsOrTypes, properties, state "
+    "RETURN collect([name, type, entityType, labelsOrTypes, properties, state]) AS indexes",
+    "SHOW CONSTRAINTS YIELD name, type, entityType, labelsOrTypes, properties "
+    "RETURN collect([name, type, entityType, labelsOrTypes, properties]) AS constraints",
+)
+
+# Both property procedures in one round-trip; ``kind`` tags which one produced the row.
+_SCHEMA_PROPERTIES_QUERY = """
+CALL db.schema.nodeTypeProperties() YIELD nodeLabels, propertyName
+RETURN 'node' AS kind, nodeLabels AS types, propertyName
+UNION ALL
+CALL db.schema.relTypeProperties() YIELD relationshipType, propertyName
+RETURN 'rel' AS kind, [relationshipType] AS types, propertyName
+"""
+
+# Explicit YIELD pins the column order that ``from_values`` unpacks.
+_SHOW_INDEXES_QUERY = "SHOW INDEXES YIELD name, type, entityType, labelsOrTypes, properties"
+_SHOW_CONSTRAINTS_QUERY = "SHOW CONSTRAINTS YIELD name, type, entityType, labelsOrTypes, properties"
+
+
 @dataclass(frozen=True)
 class Neo4jConnectionConfig:
     """Connection details for Neo4j Aura / Bolt routing."""
@@ -47,15 +81,19 @@ class Neo4jConnectionConfig:
     max_connection_lifetime: float = 3600.0
     max_connection_pool_size: int = 50
     encrypted: bool = True
+    warm_query_cache: bool = False
 
 
 class Neo4jDriverManager:
     """Manages a shared Neo4j driver with connection pooling."""
 
-    def __init__(self, config: Neo4jConnectionConfig) -> None:
-        _require_neo4j_driver()
+    def __init__(self, config: Neo4jConnectionConfig, *, driver: Optional[Neo4jDriver] = None) -> None:
+        if driver is None:
+            _require_neo4j_driver()
         self._config = config
-        self._driver: Optional[Neo4jDriver] = None
+        self._driver: Optional[Neo4jDriver] = driver
+        self._schema_cache: Optional[Tuple[str, Neo4jSchemaSnapshot]] = None
+        self._local = threading.local()
 
     @property
     def config(self) -> Neo4jConnectionConfig:
@@ -71,8 +109,20 @@ class Neo4jDriverManager:
                 max_connection_pool_size=self._config.max_connection_pool_size,
                 encrypted=self._config.encrypted,
             )
+            if self._config.warm_query_cache:
+                self.warm_query_cache()
         return self._driver
 
+    def warm_query_cache(self) -> None:
+        """Plan the fixed introspection/advisor queries with EXPLAIN so their first run skips compilation."""
+
+        with self.session_scope() as session:
+            for query in _WARMUP_QUERIES:
+                try:
+                    session.run(f"EXPLAIN {query}", _WARMUP_PARAMETERS).consume()
+                except Neo4jError:  # pragma: no cover - requires live Neo4j
+                    continue
+
     def verify_connectivity(self) -> None:
         driver = self.get_driver()
         driver.verify_connectivity()
@@ -81,12 +131,105 @@ class Neo4jDriverManager:
         if self._driver is not None:
             self._driver.close()
             self._driver = None
+        self._schema_cache = None
+
+    @contextlib.contextmanager
+    def session_scope(self) -> Iterator[Any]:
+        """Yield a session, reusing the one an enclosing scope already opened on this thread."""
+
+        active = getattr(self._local, "session", None)
+        if active is not None:
+            yield active
+            return
+        with self.get_driver().session(database=self._config.database) as session:
+            self._local.session = session
+            try:
+                yield session
+            finally:
+                self._local.session = None
+
+    def schema_fingerprint(self) -> str:
+        """Return a digest of the index and constraint definitions."""
+
+        digest = hashlib.sha256()
+        with self.session_scope() as session:
+            for query in _SCHEMA_FINGERPRINT_QUERIES:
+                for record in session.run(query):
+                    for value in record.values():
+                        digest.update(repr(sorted(map(repr, value or ()))).encode("utf-8"))
+        return digest.hexdigest()
+
+    def schema_snapshot(
+        self,
+        *,
+        force_refresh: bool = False,
+        sections: Optional[Iterable[str]] = None,
+    ) -> Neo4jSchemaSnapshot:
+        """Return the schema snapshot.
+
+        Index and constraint definitions are reused from the cached snapshot while the
+        fingerprint is unchanged; label and relationship property maps are always reloaded.
+        """
+
+        with self.session_scope() as session:
+            fingerprint = self.schema_fingerprint()
+            cached = self._schema_cache
+            if not force_refresh and cached is not None and cached[0] == fingerprint:
+                wanted = _schema_sections(sections)
+                labels: Mapping[str, Tuple[str, ...]] = {}
+                relationships: Mapping[str, Tuple[str, ...]] = {}
+                if "labels" in wanted or "relationships" in wanted:
+                    labels, relationships = Neo4jSchemaSnapshot._load_properties(session)
+                snapshot = replace(cached[1], labels=labels, relationships=relationships)
+                if sections is not None:
+                    return snapshot.partial(wanted)
+                self._schema_cache = (fingerprint, snapshot)
+                return snapshot
+            if sections is not None:
+                # Partial snapshots are cheap to rebuild and must not replace the full cached one.
+                return Neo4jSchemaSnapshot.from_database(self, sections=sections)
+            snapshot = Neo4jSchemaSnapshot.from_database(self)
+        self._schema_cache = (fingerprint, snapshot)
+        return snapshot
+
+    def invalidate_schema_cache(self) -> None:
+        self._schema_cache = None
 
 
 def _sorted_tuple(value: Iterable[str]) -> Tuple[str, ...]:
     return tuple(sorted(set(value)))
 
 
+SCHEMA_SECTIONS: Tuple[str, ...] = ("labels", "relationships", "indexes", "constraints")
+
+
+def _schema_sections(sections: Optional[Iterable[str]]) -> frozenset[str]:
+    if sections is None:
+        return frozenset(SCHEMA_SECTIONS)
+    wanted = frozenset(sections)
+    unknown = wanted.difference(SCHEMA_SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown schema sections: {', '.join(sorted(unknown))}")
+    return wanted
+
+
+def _missing_properties(
+    source: Mapping[str, Tuple[str, ...]],
+    other: Mapping[str, Tuple[str, ...]],
+) -> Dict[str, Tuple[str, ...]]:
+    # Target snapshots are often built by hand, so the output is sorted and deduplicated
+    # rather than relying on the input tuples being canonical.
+    missing: Dict[str, Tuple[str, ...]] = {}
+    for key, props in source.items():
+        present = other.get(key)
+        if present:
+            present_set = frozenset(present)
+            props = tuple(prop for prop in props if prop not in present_set)
+        if props:
+            missing[key] = _sorted_tuple(props)
+    return missing
+
+
 @dataclass(frozen=True)
 class IndexDefinition:
     name: str
@@ -97,12 +240,29 @@ class IndexDefinition:
 
     @classmethod
     def from_record(cls, record: Mapping[str, Any]) -> "IndexDefinition":
+        return cls.from_values(
+            record.get("name"),
+            record.get("type", ""),
+            record.get("entityType", ""),
+            record.get("labelsOrTypes", ()),
+            record.get("properties", ()),
+        )
+
+    @classmethod
+    def from_values(
+        cls,
+        name: Any,
+        index_type: Any,
+        entity_type: Any,
+        labels_or_types: Optional[Iterable[str]],
+        properties: Optional[Iterable[str]],
+    ) -> "IndexDefinition":
         return cls(
-            name=record.get("name"),
-            index_type=record.get("type", ""),
-            entity_type=record.get("entityType", ""),
-            labels_or_types=_sorted_tuple(record.get("labelsOrTypes", ())),
-            properties=_sorted_tuple(record.get("properties", ())),
+            name=name,
+            index_type=index_type or "",
+            entity_type=entity_type or "",
+            labels_or_types=_sorted_tuple(labels_or_types or ()),
+            properties=_sorted_tuple(properties or ()),
         )
 
 
@@ -116,12 +276,29 @@ class ConstraintDefinition:
 
     @classmethod
     def from_record(cls, record: Mapping[str, Any]) -> "ConstraintDefinition":
+        return cls.from_values(
+            record.get("name"),
+            record.get("type", ""),
+            record.get("entityType", ""),
+            record.get("labelsOrTypes", ()),
+            record.get("properties", ()),
+        )
+
+    @classmethod
+    def from_values(
+        cls,
+        name: Any,
+        constraint_type: Any,
+        entity_type: Any,
+        labels_or_types: Optional[Iterable[str]],
+        properties: Optional[Iterable[str]],
+    ) -> "ConstraintDefinition":
         return cls(
-            name=record.get("name"),
-            constraint_type=record.get("type", ""),
-            entity_type=record.get("entityType", ""),
-            labels_or_types=_sorted_tuple(record.get("labelsOrTypes", ())),
-            properties=_sorted_tuple(record.get("properties", ())),
+            name=name,
+            constraint_type=constraint_type or "",
+            entity_type=entity_type or "",
+            labels_or_types=_sorted_tuple(labels_or_types or ()),
+            properties=_sorted_tuple(properties or ()),
         )
 
 
@@ -133,79 +310,98 @@ class Neo4jSchemaSnapshot:
     constraints: Tuple[ConstraintDefinition, ...]
 
     @classmethod
-    def from_database(cls, manager: Neo4jDriverManager) -> "Neo4jSchemaSnapshot":
-        driver = manager.get_driver()
+    def from_database(
+        cls,
+        manager: Neo4jDriverManager,
+        *,
+        sections: Optional[Iterable[str]] = None,
+    ) -> "Neo4jSchemaSnapshot":
+        """Introspect the database, optionally limited to some of ``SCHEMA_SECTIONS``.
+
+        Sections that are not requested are left empty and cost no queries.
+        """
+
+        wanted = _schema_sections(sections)
+        labels: Mapping[str, Tuple[str, ...]] = {}
+        relationships: Mapping[str, Tuple[str, ...]] = {}
+        indexes: Tuple[IndexDefinition, ...] = ()
+        constraints: Tuple[ConstraintDefinition, ...] = ()
+
+        with manager.session_scope() as session:
+            if "labels" in wanted or "relationships" in wanted:
+                labels, relationships = cls._load_properties(session)
+            if "indexes" in wanted:
+                index_from_values = IndexDefinition.from_values
+                indexes = tuple(index_from_values(*record) for record in session.run(_SHOW_INDEXES_QUERY))
+            if "constraints" in wanted:
+                constraint_from_values = ConstraintDefinition.from_values
+                constraints = tuple(
+                    constraint_from_values(*record) for record in session.run(_SHOW_CONSTRAINTS_QUERY)
+                )
+
+        snapshot = cls(labels=labels, relationships=relationships, indexes=indexes, constraints=constraints)
+        return snapshot if sections is None else snapshot.partial(wanted)
+
+    @staticmethod
+    def _load_properties(session: Any) -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, Tuple[str, ...]]]:
         labels: MutableMapping[str, set[str]] = {}
         relationships: MutableMapping[str, set[str]] = {}
-        indexes: List[IndexDefinition] = []
-        constraints: List[ConstraintDefinition] = []
-
-        with driver.session(database=manager.config.database) as session:
-            node_records = session.run("CALL db.schema.nodeTypeProperties()")
-            for record in node_records:
-                label_list = record.get("nodeLabels") or []
-                prop = record.get("propertyName")
-                for label in label_list:
+        # SHOW commands cannot run inside a UNION/subquery, so only the procedures are fused.
+        # Records are tuples in RETURN order, so unpacking avoids per-key lookups.
+        for kind, types, prop in session.run(_SCHEMA_PROPERTIES_QUERY):
+            if kind == "node":
+                for label in types or ():
                     labels.setdefault(label, set()).add(prop)
+            else:
+                for rel_type in types or ():
+                    if rel_type:
+                        relationships.setdefault(rel_type, set()).add(prop)
+        # The collected sets are already unique, so they skip _sorted_tuple's dedupe pass.
+        return (
+            {label: tuple(sorted(props)) for label, props in labels.items()},
+            {rel: tuple(sorted(props)) for rel, props in relationships.items()},
+        )
 
-            rel_records = session.run("CALL db.schema.relTypeProperties()")
-            for record in rel_records:
-                rel_type = record.get("relationshipType")
-                prop = record.get("propertyName")
-                if rel_type:
-                    relationships.setdefault(rel_type, set()).add(prop)
+    def partial(self, sections: Iterable[str]) -> "Neo4jSchemaSnapshot":
+        """Return a copy keeping only ``sections``; the others are emptied so they never diff."""
 
-            index_records = session.run("SHOW INDEXES")
-            indexes = [IndexDefinition.from_record(record.data()) for record in index_records]
+        wanted = _schema_sections(sections)
+        return Neo4jSchemaSnapshot(
+            labels=self.labels if "labels" in wanted else {},
+            relationships=self.relationships if "relationships" in wanted else {},
+            indexes=self.indexes if "indexes" in wanted else (),
+            constraints=self.constraints if "constraints" in wanted else (),
+        )
 
-            constraint_records = session.run("SHOW CONSTRAINTS")
-            constraints = [ConstraintDefinition.from_record(record.data()) for record in constraint_records]
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """Order-independent digest of the snapshot; equal fingerprints mean an empty diff."""
 
-        return cls(
-            labels={label: _sorted_tuple(props) for label, props in labels.items()},
-            relationships={rel: _sorted_tuple(props) for rel, props in relationships.items()},
-            indexes=tuple(indexes),
-            constraints=tuple(constraints),
-        )
+        canonical = repr(
+            (
+                sorted(self.labels.items()),
+                sorted(self.relationships.items()),
+                sorted(map(repr, self.indexes)),
+                sorted(map(repr, self.constraints)),
+            )
+        ).encode("utf-8")
+        if xxhash is not None:
+            return xxhash.xxh3_128_hexdigest(canonical)
+        return hashlib.blake2b(canonical, digest_size=16).hexdigest()
 
     def diff(self, target: "Neo4jSchemaSnapshot") -> "Neo4jSchemaDiff":
-        current_labels = {label: set(props) for label, props in self.labels.items()}
-        target_labels = {label: set(props) for label, props in target.labels.items()}
-        current_relationships = {rel: set(props) for rel, props in self.relationships.items()}
-        target_relationships = {rel: set(props) for rel, props in target.relationships.items()}
-
-        added_labels: Dict[str, set[str]] = {}
-        removed_labels: Dict[str, set[str]] = {}
-        for label, props in target_labels.items():
-            missing = props - current_labels.get(label, set())
-            if missing:
-                added_labels[label] = missing
-        for label, props in current_labels.items():
-            missing = props - target_labels.get(label, set())
-            if missing:
-                removed_labels[label] = missing
-
-        added_relationships: Dict[str, set[str]] = {}
-        removed_relationships: Dict[str, set[str]] = {}
-        for rel, props in target_relationships.items():
-            missing = props - current_relationships.get(rel, set())
-            if missing:
-                added_relationships[rel] = missing
-        for rel, props in current_relationships.items():
-            missing = props - target_relationships.get(rel, set())
-            if missing:
-                removed_relationships[rel] = missing
-
+        if self is target or self.fingerprint == target.fingerprint:
+            return _empty_schema_diff()
         current_indexes = set(self.indexes)
         target_indexes = set(target.indexes)
         current_constraints = set(self.constraints)
         target_constraints = set(target.constraints)
 
         return Neo4jSchemaDiff(
-            added_node_properties={label: tuple(sorted(props)) for label, props in added_labels.items()},
-            removed_node_properties={label: tuple(sorted(props)) for label, props in removed_labels.items()},
-            added_relationship_properties={rel: tuple(sorted(props)) for rel, props in added_relationships.items()},
-            removed_relationship_properties={rel: tuple(sorted(props)) for rel, props in removed_relationships.items()},
+            added_node_properties=_missing_properties(target.labels, self.labels),
+            removed_node_properties=_missing_properties(self.labels, target.labels),
+            added_relationship_properties=_missing_properties(target.relationships, self.relationships),
+            removed_relationship_properties=_missing_properties(self.relationships, target.relationships),
             added_indexes=tuple(sorted(target_indexes - current_indexes, key=lambda idx: idx.name or "")),
             removed_indexes=tuple(sorted(current_indexes - target_indexes, key=lambda idx: idx.name or "")),
             added_constraints=tuple(sorted(target_constraints - current_constraints, key=lambda c: c.name or "")),
@@ -237,6 +433,20 @@ class Neo4jSchemaDiff:
         )
 
 
+def _empty_schema_diff() -> Neo4jSchemaDiff:
+    # A fresh instance per call: the mappings are plain dicts that callers may mutate.
+    return Neo4jSchemaDiff(
+        added_node_properties={},
+        removed_node_properties={},
+        added_relationship_properties={},
+        removed_relationship_properties={},
+        added_indexes=(),
+        removed_indexes=(),
+        added_constraints=(),
+        removed_constraints=(),
+    )
+
+
 @dataclass(frozen=True)
 class Neo4jMigrationAction:
     statement: str
@@ -252,17 +462,54 @@ class Neo4jMigrationPlan:
         return len(self.actions) == 0
 
 
+# Bound ``str.format`` of fixed templates, resolved once at import.
+_format_create_index = "CREATE INDEX {name} IF NOT EXISTS FOR (n:{labels}) ON ({props})".format
+_format_create_unique_constraint = (
+    "CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{labels}) REQUIRE ({props}) IS UNIQUE".format
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote(identifier: str) -> str:
+    # Labels and property names recur across indexes and constraints.
+    escaped = identifier.replace("`", "``")
+    return f"`{escaped}`"
+
+
+@functools.lru_cache(maxsize=4096)
+def _node_property(prop: str) -> str:
+    return f"n.{_quote(prop)}"
+
+
 class Neo4jSchemaPlanner:
     """Plans schema diffs and executable migrations."""
 
     def __init__(self, manager: Neo4jDriverManager) -> None:
         self._manager = manager
 
-    def snapshot(self) -> Neo4jSchemaSnapshot:
-        return Neo4jSchemaSnapshot.from_database(self._manager)
+    def snapshot(
+        self,
+        *,
+        force_refresh: bool = False,
+        sections: Optional[Iterable[str]] = None,
+    ) -> Neo4jSchemaSnapshot:
+        return self._manager.schema_snapshot(force_refresh=force_refresh, sections=sections)
 
-    def diff(self, target: Neo4jSchemaSnapshot, *, current: Optional[Neo4jSchemaSnapshot] = None) -> Neo4jSchemaDiff:
-        baseline = current or self.snapshot()
+    def diff(
+        self,
+        target: Neo4jSchemaSnapshot,
+        *,
+        current: Optional[Neo4jSchemaSnapshot] = None,
+        sections: Optional[Iterable[str]] = None,
+    ) -> Neo4jSchemaDiff:
+        """Diff ``target`` against the database, restricted to ``sections`` when given."""
+
+        if sections is not None:
+            sections = _schema_sections(sections)
+            target = target.partial(sections)
+            if current is not None:
+                current = current.partial(sections)
+        baseline = current or self.snapshot(sections=sections)
         return baseline.diff(target)
 
     def plan_migration(
@@ -270,8 +517,9 @@ class Neo4jSchemaPlanner:
         target: Neo4jSchemaSnapshot,
         *,
         current: Optional[Neo4jSchemaSnapshot] = None,
+        sections: Optional[Iterable[str]] = None,
     ) -> Neo4jMigrationPlan:
-        diff = self.diff(target, current=current)
+        diff = self.diff(target, current=current, sections=sections)
         if diff.is_empty():
             return Neo4jMigrationPlan(actions=())
 
@@ -296,12 +544,12 @@ class Neo4jSchemaPlanner:
                 )
 
         for index in diff.added_indexes:
-            label_expr = ":".join(f"`{label}`" for label in index.labels_or_types if label)
-            props_expr = ", ".join(f"n.`{prop}`" for prop in index.properties if prop)
+            label_expr = ":".join(map(_quote, filter(None, index.labels_or_types)))
+            props_expr = ", ".join(map(_node_property, filter(None, index.properties)))
             if not label_expr or not props_expr:
                 statement = "// Informational: index metadata incomplete"
             elif index.entity_type == "NODE":
-                statement = f"CREATE INDEX {index.name} IF NOT EXISTS FOR (n:{label_expr}) ON ({props_expr})"
+                statement = _format_create_index(name=index.name, labels=label_expr, props=props_expr)
             else:
                 statement = f"// TODO: index creation for entity type {index.entity_type}"
             actions.append(
@@ -312,14 +560,13 @@ class Neo4jSchemaPlanner:
             )
 
         for constraint in diff.added_constraints:
-            label_expr = ":".join(f"`{label}`" for label in constraint.labels_or_types if label)
-            props_expr = ", ".join(f"n.`{prop}`" for prop in constraint.properties if prop)
+            label_expr = ":".join(map(_quote, filter(None, constraint.labels_or_types)))
+            props_expr = ", ".join(map(_node_property, filter(None, constraint.properties)))
             if not label_expr or not props_expr:
                 statement = "// Informational: constraint metadata incomplete"
             elif constraint.constraint_type.endswith("UNIQUENESS"):
-                statement = (
-                    f"CREATE CONSTRAINT {constraint.name} IF NOT EXISTS "
-                    f"FOR (n:{label_expr}) REQUIRE ({props_expr}) IS UNIQUE"
+                statement = _format_create_unique_constraint(
+                    name=constraint.name, labels=label_expr, props=props_expr
                 )
             else:
                 statement = f"// TODO: constraint creation for type {constraint.constraint_type}"
@@ -384,30 +631,32 @@ class Neo4jTransactionalBatchExecutor:
         if dry_run:
             return Neo4jMigrationResult(executed=0, skipped=len(plan.actions), failures=())
 
-        driver = self._manager.get_driver()
         executed = 0
         failures: List[str] = []
+        executable = [action for action in plan.actions if not action.statement.startswith("//")]
+        if not executable:
+            # Informational-only plans need no session (and no pooled connection) at all.
+            return Neo4jMigrationResult(executed=0, skipped=0, failures=())
+        batch_size = self._batch_size
 
-        with driver.session(database=self._manager.config.database) as session:
+        with self._manager.session_scope() as session:
             tx: Optional[Transaction] = None
             try:
-                for idx, action in enumerate(plan.actions):
-                    if action.statement.startswith("//"):
-                        continue
-                    if tx is None:
-                        tx = session.begin_transaction()
-                    tx.run(action.statement, action.parameters)
-                    executed += 1
-                    if executed % self._batch_size == 0:
-                        tx.commit()
-                        tx = None
-                if tx is not None:
+                for start in range(0, len(executable), batch_size):
+                    tx = session.begin_transaction()
+                    run = tx.run
+                    for action in executable[start : start + batch_size]:
+                        run(action.statement, action.parameters)
+                        executed += 1
                     tx.commit()
+                    tx = None
             except Neo4jError as err:  # pragma: no cover - requires live Neo4j
                 if tx is not None:
                     tx.rollback()
                 failures.append(str(err))
 
+        if executed:
+            self._manager.invalidate_schema_cache()
         return Neo4jMigrationResult(executed=executed, skipped=0, failures=tuple(failures))
 
 
@@ -421,6 +670,33 @@ class JobSliceRecommendation:
         return {"label": self.label, "orgId": self.org_id, "count": self.node_count}
 
 
+_ALL_SLICES_QUERY = """
+MATCH (n)
+WITH labels(n) AS nodeLabels, n[$orgProp] AS orgId
+UNWIND nodeLabels AS nodeLabel
+WITH nodeLabel AS label, orgId, count(*) AS nodeCount
+ORDER BY nodeCount DESC
+RETURN label, orgId, nodeCount
+LIMIT $limit
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def _label_slice_query(labels: Tuple[str, ...]) -> str:
+    # One label-scan branch per requested label instead of filtering a scan of every node.
+    # Labels cannot be parameterised in a MATCH pattern, so they are inlined quoted.
+    branches = "\n    UNION ALL\n".join(
+        f"    MATCH (n:{_quote(label)}) RETURN $labels[{idx}] AS label, n[$orgProp] AS orgId, count(*) AS nodeCount"
+        for idx, label in enumerate(labels)
+    )
+    return f"CALL {{\n{branches}\n}}\nRETURN label, orgId, nodeCount\nORDER BY nodeCount DESC\nLIMIT $limit\n"
+
+
+# SHOW commands cannot be EXPLAINed, so only the Cypher statements are pre-planned.
+_WARMUP_QUERIES: Tuple[str, ...] = (_SCHEMA_PROPERTIES_QUERY, _ALL_SLICES_QUERY)
+_WARMUP_PARAMETERS: Dict[str, Any] = {"orgProp": "orgId", "limit": 1}
+
+
 class Neo4jIncrementalJobAdvisor:
     """Generates incremental job slices grouped by label/org."""
 
@@ -439,26 +715,16 @@ class Neo4jIncrementalJobAdvisor:
         labels: Optional[Sequence[str]] = None,
         limit: int = 25,
     ) -> List[JobSliceRecommendation]:
-        driver = self._manager.get_driver()
+        label_list = tuple(dict.fromkeys(label for label in labels or () if label))
         params = {
-            "labels": list(labels) if labels else None,
+            "labels": list(label_list),
             "limit": max(1, int(limit)),
             "orgProp": self._org_id_property,
         }
-
-        cypher = """
-        MATCH (n)
-        WHERE $labels IS NULL OR any(label IN labels(n) WHERE label IN $labels)
-        WITH labels(n) AS nodeLabels, n[$orgProp] AS orgId
-        UNWIND nodeLabels AS nodeLabel
-        WITH nodeLabel AS label, orgId, count(*) AS nodeCount
-        ORDER BY nodeCount DESC
-        RETURN label, orgId, nodeCount
-        LIMIT $limit
-        """
+        cypher = _label_slice_query(label_list) if label_list else _ALL_SLICES_QUERY
 
         recommendations: List[JobSliceRecommendation] = []
-        with driver.session(database=self._manager.config.database) as session:
+        with self._manager.session_scope() as session:
             records = session.run(cypher, params)
             for record in records:
                 recommendations.append(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Mapping, Optional
@@ -13,6 +14,12 @@ __all__ = [
 ]
 
 
+def _detached(payload: Mapping[str, object]) -> Dict[str, object]:
+    # Payloads are cached on frozen instances; nested containers are copied per call so a
+    # caller mutating the result cannot change later serialisations.
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in payload.items()}
+
+
 @dataclass(frozen=True)
 class AccessControlPolicy:
     """Models fine-grained access control for SDK operations."""
@@ -23,6 +30,10 @@ class AccessControlPolicy:
     data_partition: Optional[str] = None
 
     def to_dict(self) -> Dict[str, object]:
+        return _detached(self._payload)
+
+    @functools.cached_property
+    def _payload(self) -> Dict[str, object]:
         payload: Dict[str, object] = {
             "tenantId": self.tenant_id,
             "roles": dict(self.roles),
@@ -43,6 +54,10 @@ class EncryptionContext:
     kms_alias: Optional[str] = None
 
     def to_dict(self) -> Dict[str, object]:
+        return dict(self._payload)
+
+    @functools.cached_property
+    def _payload(self) -> Dict[str, object]:
         payload: Dict[str, object] = {
             "encryptInTransit": self.encrypt_in_transit,
             "encryptAtRest": self.encrypt_at_rest,
@@ -72,6 +87,10 @@ class ComplianceDirective:
     reason: Optional[str] = None
 
     def to_dict(self) -> Dict[str, object]:
+        return _detached(self._payload)
+
+    @functools.cached_property
+    def _payload(self) -> Dict[str, object]:
         data: Dict[str, object] = {
             "directive": self.directive.value,
             "payload": dict(self.payload),
@@ -90,6 +109,10 @@ class SecretReference:
     provider: Optional[str] = None
 
     def to_dict(self) -> Dict[str, object]:
+        return dict(self._payload)
+
+    @functools.cached_property
+    def _payload(self) -> Dict[str, object]:
         payload: Dict[str, object] = {"name": self.name}
         if self.version:
             payload["version"] = self.version
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import io
-from typing import Any, Dict, Iterable, List, Optional, Protocol, runtime_checkable
+import sys
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Protocol, Union, runtime_checkable
+
+try:
+    import pybase64  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    pybase64 = None  # type: ignore
 
 __all__ = [
     "StorageObject",
@@ -14,8 +21,29 @@ __all__ = [
     "MinIOStorageAdapter",
 ]
 
+# ``slots=True`` is only understood by dataclasses on Python 3.10+.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# ``bytes`` payloads are handed to the client as-is; ``bytearray``/``memoryview`` payloads are
+# converted once where the client API cannot take them directly. File-like payloads are streamed,
+# and the returned ``StorageObject`` then carries empty ``data`` rather than reading the stream back.
+StoragePayload = Union[bytes, bytearray, memoryview, BinaryIO]
+
+_MINIO_PART_SIZE = 10 * 1024 * 1024
+_S3_MAX_WORKERS = 16
+
+_b64encode = pybase64.b64encode if pybase64 is not None else base64.b64encode
+
+
+def _is_stream(data: StoragePayload) -> bool:
+    return not isinstance(data, (bytes, bytearray, memoryview))
+
 
-@dataclass
+def _stored_data(data: StoragePayload) -> Any:
+    return b"" if _is_stream(data) else data
+
+
+@dataclass(**_SLOTS)
 class StorageObject:
     """Represents an object stored via a storage adapter."""
 
@@ -24,17 +52,22 @@ class StorageObject:
     metadata: Dict[str, str]
 
     def as_text(self, encoding: str = "utf-8") -> str:
-        return self.data.decode(encoding)
+        return str(self.data, encoding)
 
     def as_base64(self) -> str:
-        return base64.b64encode(self.data).decode("ascii")
+        return _b64encode(self.data).decode("ascii")
 
 
 @runtime_checkable
 class StorageAdapter(Protocol):
     """Protocol for pluggable object storage adapters."""
 
-    def put_object(self, key: str, data: bytes, *, metadata: Optional[Dict[str, str]] = None) -> StorageObject:
+    def put_object(self, key: str, data: StoragePayload, *, metadata: Optional[Dict[str, str]] = None) -> StorageObject:
+        """Store ``data`` under ``key``.
+
+        When ``data`` is a file-like object the returned ``StorageObject.data`` is ``b""``;
+        use ``get_object`` to read the stored content back.
+        """
         ...
 
     def get_object(self, key: str) -> StorageObject:
@@ -49,21 +82,28 @@ class StorageAdapterRegistry:
 
     def __init__(self) -> None:
         self._adapters: Dict[str, StorageAdapter] = {}
+        self._sorted_names: Optional[List[str]] = None
 
     def register(self, name: str, adapter: StorageAdapter, *, override: bool = False) -> None:
-        normalized = name.lower()
+        normalized = sys.intern(name.lower())
         if not override and normalized in self._adapters:
             raise ValueError(f"Storage adapter '{name}' is already registered")
         self._adapters[normalized] = adapter
+        self._sorted_names = None
 
     def get(self, name: str) -> StorageAdapter:
-        normalized = name.lower()
-        if normalized not in self._adapters:
+        adapter = self._adapters.get(name)
+        if adapter is None:
+            # Fall back to case-insensitive lookup only when the exact name misses.
+            adapter = self._adapters.get(name.lower())
+        if adapter is None:
             raise KeyError(f"Storage adapter '{name}' is not registered")
-        return self._adapters[normalized]
+        return adapter
 
     def list(self) -> List[str]:
-        return sorted(self._adapters.keys())
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self._adapters)
+        return list(self._sorted_names)
 
 
 def _require_boto3() -> Any:
@@ -106,14 +146,24 @@ class S3StorageAdapter:
         client: Any = None,
         extra_client_kwargs: Optional[Dict[str, Any]] = None,
     ) -> None:
-        boto3 = _require_boto3()
         self._bucket = bucket
-        self._client = client or boto3.client("s3", **(extra_client_kwargs or {}))
-
-    def put_object(self, key: str, data: bytes, *, metadata: Optional[Dict[str, str]] = None) -> StorageObject:
+        if client is None:
+            boto3 = _require_boto3()
+            client_kwargs = dict(extra_client_kwargs or {})
+            if "config" not in client_kwargs:
+                from botocore.config import Config  # type: ignore
+
+                # Size the connection pool so ``get_many`` workers do not queue on it.
+                client_kwargs["config"] = Config(max_pool_connections=_S3_MAX_WORKERS)
+            client = boto3.client("s3", **client_kwargs)
+        self._client = client
+
+    def put_object(self, key: str, data: StoragePayload, *, metadata: Optional[Dict[str, str]] = None) -> StorageObject:
         meta = metadata or {}
-        self._client.put_object(Bucket=self._bucket, Key=key, Body=data, Metadata=meta)
-        return StorageObject(key=key, data=data, metadata=meta)
+        # botocore accepts bytes, bytearray and file objects as ``Body`` but not memoryview.
+        body = bytes(data) if isinstance(data, memoryview) else data
+        self._client.put_object(Bucket=self._bucket, Key=key, Body=body, Metadata=meta)
+        return StorageObject(key=key, data=_stored_data(data), metadata=meta)
 
     def get_object(self, key: str) -> StorageObject:
         resp = self._client.get_object(Bucket=self._bucket, Key=key)
@@ -121,6 +171,16 @@ class S3StorageAdapter:
         metadata = resp.get("Metadata", {})
         return StorageObject(key=key, data=body, metadata=metadata)
 
+    def get_many(self, keys: Iterable[str], *, max_workers: int = _S3_MAX_WORKERS) -> List[StorageObject]:
+        """Fetch several objects concurrently, returned in the order of ``keys``."""
+
+        keys = list(keys)
+        if len(keys) <= 1:
+            return [self.get_object(key) for key in keys]
+        # boto3 clients are thread-safe, so the workers share this adapter's client.
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(keys)))) as pool:
+            return list(pool.map(self.get_object, keys))
+
     def delete_object(self, key: str) -> None:
         self._client.delete_object(Bucket=self._bucket, Key=key)
 
@@ -140,11 +200,15 @@ class GCSStorageAdapter:
         self._client = client or storage.Client(**(extra_client_kwargs or {}))
         self._bucket = self._client.bucket(bucket)
 
-    def put_object(self, key: str, data: bytes, *, metadata: Optional[Dict[str, str]] = None) -> StorageObject:
+    def put_object(self, key: str, data: StoragePayload, *, metadata: Optional[Dict[str, str]] = None) -> StorageObject:
         blob = self._bucket.blob(key)
         blob.metadata = metadata or {}
-        blob.upload_from_string(data)
-        return StorageObject(key=key, data=data, metadata=blob.metadata or {})
+        if isinstance(data, bytes):
+            blob.upload_from_string(data)
+        else:
+            # ``upload_from_string`` only takes ``bytes``; other payloads go through the file API.
+            blob.upload_from_file(data if _is_stream(data) else io.BytesIO(data))
+        return StorageObject(key=key, data=_stored_data(data), metadata=blob.metadata or {})
 
     def get_object(self, key: str) -> StorageObject:
         blob = self._bucket.blob(key)
@@ -182,10 +246,16 @@ class MinIOStorageAdapter:
         if not self._client.bucket_exists(bucket):  # pragma: no cover - network side effect
             self._client.make_bucket(bucket)
 
-    def put_object(self, key: str, data: bytes, *, metadata: Optional[Dict[str, str]] = None) -> StorageObject:
-        stream = io.BytesIO(data)
-        self._client.put_object(self._bucket, key, stream, len(data), metadata=metadata or {})
-        return StorageObject(key=key, data=data, metadata=metadata or {})
+    def put_object(self, key: str, data: StoragePayload, *, metadata: Optional[Dict[str, str]] = None) -> StorageObject:
+        meta = metadata or {}
+        if _is_stream(data):
+            # Unknown length: let MinIO upload the stream in multipart chunks.
+            self._client.put_object(self._bucket, key, data, -1, metadata=meta, part_size=_MINIO_PART_SIZE)
+        else:
+            # MinIO needs a readable stream; ``BytesIO`` shares a ``bytes`` buffer until written,
+            # but copies ``bytearray``/``memoryview`` payloads.
+            self._client.put_object(self._bucket, key, io.BytesIO(data), memoryview(data).nbytes, metadata=meta)
+        return StorageObject(key=key, data=_stored_data(data), metadata=meta)
 
     def get_object(self, key: str) -> StorageObject:
         response = self._client.get_object(self._bucket, key)
@@ -194,8 +264,8 @@ class MinIOStorageAdapter:
         finally:  # pragma: no branch
             response.close()
             response.release_conn()
-        headers = dict(getattr(response, "headers", {}) or {})
-        metadata = {str(key): str(value) for key, value in headers.items()}
+        headers = getattr(response, "headers", None) or {}
+        metadata = {str(name): str(value) for name, value in headers.items()}
         return StorageObject(key=key, data=body, metadata=metadata)
 
     def delete_object(self, key: str) -> None:
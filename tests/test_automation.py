@@ -1,3 +1,4 @@
+import asyncio
 import json
 import unittest
 from typing import Any, Dict, Optional
@@ -126,6 +127,39 @@ class FakeClient:
         return {"pull_request": {"number": 42}}
 
 
+class FakeAsyncClient:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Dict[str, Any]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _record(self, name: str, kwargs: Dict[str, Any], response: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls.append((name, kwargs))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return response
+
+    async def clone_repository(self, **kwargs: Any) -> Dict[str, Any]:
+        return await self._record("clone", kwargs, {"local_path": "/tmp/repo"})
+
+    async def prepare_integration(self, **kwargs: Any) -> Dict[str, Any]:
+        return await self._record("prepare", kwargs, {"local_path": "/tmp/repo"})
+
+    async def install_integration_dependencies(self, **kwargs: Any) -> Dict[str, Any]:
+        return await self._record("install", kwargs, {"installed": True})
+
+    async def write_integration_files(self, **kwargs: Any) -> Dict[str, Any]:
+        return await self._record("write", kwargs, {"written": True})
+
+    async def run_integration_tests(self, **kwargs: Any) -> Dict[str, Any]:
+        return await self._record("test", kwargs, {"status": "passed"})
+
+    async def create_github_pull_request(self, **kwargs: Any) -> Dict[str, Any]:
+        return await self._record("pr", kwargs, {"pull_request": {"number": 42}})
+
+
 class IntegrationAutomationClientTests(unittest.TestCase):
     def test_apply_plan_runs_full_pipeline(self) -> None:
         fake_client = FakeClient()
@@ -153,6 +187,94 @@ class IntegrationAutomationClientTests(unittest.TestCase):
         )
         self.assertIn("pull_request", result)
 
+    def test_apply_plan_reuses_prepared_repository(self) -> None:
+        fake_client = FakeClient()
+        automation = IntegrationAutomationClient(fake_client)
+        plan = IntegrationPlan(files={"config.yml": "value: 1"})
+
+        result = automation.apply_plan(
+            repository_url="https://github.com/org/repo",
+            plan=plan,
+            repository_path="/tmp/existing",
+            run_tests=False,
+            auto_pr=False,
+        )
+
+        self.assertEqual([name for name, _ in fake_client.calls], ["write"])
+        self.assertEqual(fake_client.calls[0][1]["repository_path"], "/tmp/existing")
+        self.assertTrue(result["bootstrap"]["skipped"])
+
+    def test_apply_plan_async_overlaps_install_and_write(self) -> None:
+        fake_client = FakeAsyncClient()
+        automation = IntegrationAutomationClient(FakeClient(), auth_token="secret")
+        plan = IntegrationPlan(files={"config.yml": "value: 1"}, dependencies=["dep1"])
+
+        result = asyncio.run(
+            automation.apply_plan_async(
+                async_client=fake_client,
+                repository_url="https://github.com/org/repo",
+                plan=plan,
+            )
+        )
+
+        call_names = [name for name, _ in fake_client.calls]
+        self.assertEqual(call_names[:2], ["clone", "prepare"])
+        self.assertEqual(set(call_names[2:4]), {"install", "write"})
+        self.assertEqual(call_names[4:], ["test", "pr"])
+        self.assertEqual(fake_client.max_in_flight, 2)
+        self.assertEqual(result["dependencies"], {"installed": True})
+        self.assertEqual(result["files"], {"written": True})
+
+    def test_pull_request_body_is_kept_without_plan_metadata(self) -> None:
+        sync_client = FakeClient()
+        async_client = FakeAsyncClient()
+        automation = IntegrationAutomationClient(sync_client)
+        options: Dict[str, Any] = {
+            "repository_url": "https://github.com/org/repo",
+            "plan": IntegrationPlan(),
+            "repository_path": "/tmp/existing",
+            "run_tests": False,
+            "pull_request_body": "Explicit body",
+        }
+
+        automation.apply_plan(**options)
+        asyncio.run(automation.apply_plan_async(async_client=async_client, **options))
+
+        self.assertEqual(sync_client.calls[-1][1]["body"], "Explicit body")
+        self.assertEqual(async_client.calls[-1][1]["body"], "Explicit body")
+
+    def test_apply_plan_goes_through_overridable_wrappers(self) -> None:
+        wrapped: list[str] = []
+
+        class AuditedAutomation(IntegrationAutomationClient):
+            def install_dependencies(self, **kwargs: Any) -> Any:
+                wrapped.append("install")
+                return super().install_dependencies(**kwargs)
+
+            def write_files(self, **kwargs: Any) -> Any:
+                wrapped.append("write")
+                return super().write_files(**kwargs)
+
+            def create_pull_request(self, **kwargs: Any) -> Any:
+                wrapped.append("pr")
+                return super().create_pull_request(**kwargs)
+
+        automation = AuditedAutomation(FakeClient())
+        automation.apply_plan(
+            repository_url="https://github.com/org/repo",
+            plan=IntegrationPlan(files={"config.yml": "value: 1"}, dependencies=["dep1"]),
+            repository_path="/tmp/existing",
+            run_tests=False,
+        )
+
+        self.assertEqual(wrapped, ["install", "write", "pr"])
+
+    def test_plan_from_dict_drops_blank_dependencies(self) -> None:
+        plan = IntegrationPlan.from_dict({"dependencies": ["dep1", "", 2], "dev_dependencies": None})
+
+        self.assertEqual(plan.dependencies, ("dep1", "2"))
+        self.assertEqual(plan.dev_dependencies, ())
+
 
 class FakeClaudeClient:
     def __init__(self) -> None:
@@ -172,6 +294,15 @@ class ClaudeAutomationClientTests(unittest.TestCase):
         assert client._client.payload is not None
         self.assertEqual(len(client._client.payload["tasks"]), 3)
 
+    def test_default_tasks_serialise_as_plain_dicts(self) -> None:
+        plexity_client, session = make_client({"session_id": "session-1"})
+        ClaudeAutomationClient(plexity_client).delegate_repository_setup(repository_name="Repo")
+
+        tasks = session.requests[0]["json"]["tasks"]
+        self.assertEqual(len(tasks), 3)
+        self.assertTrue(all(type(task) is dict for task in tasks))
+        json.dumps(tasks)
+
 
 if __name__ == "__main__":
     unittest.main()
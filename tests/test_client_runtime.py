@@ -81,3 +81,47 @@ def test_raises_transport_error_after_exhausting_retries() -> None:
 
     assert exc.value.status_code == 0
     assert "transport_error" in str(exc.value)
+
+
+class BodySession:
+    def __init__(self) -> None:
+        self.kwargs: Dict[str, Any] = {}
+
+    def request(self, method: str, url: str, **kwargs: Any) -> DummyResponse:
+        self.kwargs = kwargs
+        return DummyResponse({"accepted": 2})
+
+
+def test_telemetry_ingest_pre_encodes_with_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    from plexity_sdk import client as client_module
+
+    class FakeOrjson:
+        OPT_NON_STR_KEYS = 1
+
+        @staticmethod
+        def dumps(payload: Any, option: int = 0) -> bytes:
+            return repr(payload).encode()
+
+    monkeypatch.setattr(client_module, "orjson", FakeOrjson)
+    session = BodySession()
+    client = PlexityClient(base_url="https://example.test", session=session)
+
+    assert client.record_graphrag_entity_events([{"id": "e1"}, {"id": "e2"}]) == 2
+    assert session.kwargs["data"] == repr({"events": [{"id": "e1"}, {"id": "e2"}]}).encode()
+    assert "json" not in session.kwargs
+    assert session.kwargs["headers"]["content-type"] == "application/json"
+
+    monkeypatch.setattr(client_module, "orjson", None)
+    client.record_graphrag_entity_events({"id": "e3"})
+    assert session.kwargs["json"] == {"events": [{"id": "e3"}]}
+
+
+def test_types_submodule_is_reachable_as_package_attribute() -> None:
+    import subprocess
+    import sys
+
+    # A fresh interpreter, so no earlier import has already bound the submodule attribute.
+    code = "import plexity_sdk; print(plexity_sdk.types.__name__)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "plexity_sdk.types"
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import pytest
 
-from plexity_sdk.graphrag import GraphRAGClient
-from plexity_sdk.graphrag_runtime import GraphRAGFeature, GraphRAGPackage
+from plexity_sdk.client import PlexityError
+from plexity_sdk.graphrag import GraphRAGClient, GraphRAGTelemetry, GraphRAGTelemetryContext
+from plexity_sdk.graphrag_runtime import GraphRAGFeature, GraphRAGPackage, resolve_runtime_profile
+from plexity_sdk.neo4j import (
+    IndexDefinition,
+    Neo4jConnectionConfig,
+    Neo4jDriverManager,
+    Neo4jIncrementalJobAdvisor,
+    Neo4jMigrationAction,
+    Neo4jMigrationPlan,
+    Neo4jSchemaPlanner,
+    Neo4jSchemaSnapshot,
+)
 from plexity_sdk.orchestration import InMemoryJobScheduler, JobState
 from plexity_sdk.security import (
     AccessControlPolicy,
@@ -15,7 +28,7 @@ from plexity_sdk.security import (
     ComplianceDirectiveType,
     EncryptionContext,
 )
-from plexity_sdk.storage import StorageAdapter, StorageObject
+from plexity_sdk.storage import S3StorageAdapter, StorageAdapter, StorageObject
 
 
 class DummyStorageAdapter(StorageAdapter):
@@ -40,6 +53,25 @@ class DummyStorageAdapter(StorageAdapter):
         self._store.pop(key, None)
 
 
+class FakeNeo4jDriver:
+    def __init__(self, session: Any) -> None:
+        self._session = session
+        self.sessions_opened = 0
+        self.closed = False
+
+    def session(self, database: Optional[str] = None):
+        self.sessions_opened += 1
+        return contextlib.nullcontext(self._session)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _neo4j_manager(session: Any) -> Neo4jDriverManager:
+    config = Neo4jConnectionConfig(uri="bolt://localhost", username="neo4j", password="secret")
+    return Neo4jDriverManager(config, driver=FakeNeo4jDriver(session))
+
+
 class FakeClient:
     def __init__(self) -> None:
         self.recommend_payload: Optional[Dict[str, Any]] = None
@@ -111,6 +143,39 @@ def test_recommendations_and_context_merging():
     assert fake.recommend_payload["access_policy"]["tenantId"] == "orgA"
 
 
+def test_policy_setters_refresh_cached_context():
+    fake = FakeClient()
+    client = _enterprise_client(fake)
+
+    client.set_access_policy(None)
+    client.set_encryption_context(EncryptionContext(encrypt_in_transit=True, encrypt_at_rest=False))
+    client.recommend_incremental_job_slices()
+    assert fake.recommend_payload is not None
+    assert "access_policy" not in fake.recommend_payload
+    assert fake.recommend_payload["encryption"]["encryptAtRest"] is False
+
+
+def test_policy_serialisation_is_not_shared_between_calls():
+    policy = AccessControlPolicy(tenant_id="orgA", roles={"maintainer": True})
+    policy.to_dict()["roles"]["admin"] = True
+
+    assert policy.to_dict()["roles"] == {"maintainer": True}
+
+
+def test_request_payloads_do_not_share_policy_dicts():
+    fake = FakeClient()
+    client = _enterprise_client(fake)
+
+    client.recommend_incremental_job_slices()
+    assert fake.recommend_payload is not None
+    fake.recommend_payload["access_policy"]["roles"]["admin"] = True
+    fake.recommend_payload["encryption"]["encryptAtRest"] = False
+
+    client.recommend_incremental_job_slices()
+    assert fake.recommend_payload["access_policy"]["roles"] == {"maintainer": True}
+    assert fake.recommend_payload["encryption"]["encryptAtRest"] is True
+
+
 def test_storage_offload_roundtrip():
     fake = FakeClient()
     client = _enterprise_client(fake)
@@ -187,12 +252,133 @@ def test_incremental_job_creation_and_compliance_calls():
     assert fake.compliance_payload["access_policy"]["tenantId"] == "orgA"
 
 
+def test_slice_batch_trigger_chunks_and_falls_back_without_batch_endpoint():
+    class BatchClient(FakeClient):
+        def __init__(self, status_code: Optional[int] = None) -> None:
+            super().__init__()
+            self.status_code = status_code
+            self.batches: list[list[Dict[str, Any]]] = []
+            self.single_calls = 0
+
+        def trigger_graphrag_incremental_job_slices_batch(self, slices):
+            if self.status_code is not None:
+                raise PlexityError(self.status_code, "not_found")
+            self.batches.append(list(slices))
+            return {"queued": len(slices)}
+
+        def trigger_graphrag_incremental_job_slice(self, **payload: Any):
+            self.single_calls += 1
+            return super().trigger_graphrag_incremental_job_slice(**payload)
+
+    slices = [{"job_id": "job-1", "slice_id": f"slice-{i}"} for i in range(5)]
+
+    batching = BatchClient()
+    responses = _enterprise_client(batching).trigger_incremental_job_slice_batch(slices, chunk=2)
+    assert responses == [{"queued": 2}, {"queued": 2}, {"queued": 1}]
+    assert [len(batch) for batch in batching.batches] == [2, 2, 1]
+    assert batching.batches[0][0]["org_id"] == "orgA"
+    assert batching.single_calls == 0
+
+    legacy = BatchClient(status_code=404)
+    responses = _enterprise_client(legacy).trigger_incremental_job_slice_batch(slices, chunk=2)
+    assert len(responses) == 5
+    assert legacy.single_calls == 5
+    assert legacy.trigger_payload is not None and legacy.trigger_payload["slice_id"] == "slice-4"
+
+
+@pytest.mark.asyncio
+async def test_asearch_runs_sync_client_off_loop():
+    class SearchClient(FakeClient):
+        def search_graphrag(self, query: str, **payload: Any):
+            return {"query": query, **payload}
+
+    client = _enterprise_client(SearchClient())
+    result = await client.asearch("customers", max_tokens=64)
+    assert result["query"] == "customers"
+    assert result["max_tokens"] == 64
+    assert result["org_id"] == "orgA"
+
+
+@pytest.mark.asyncio
+async def test_asearch_uses_sized_pool_from_env(monkeypatch):
+    import threading
+
+    from plexity_sdk import graphrag as graphrag_module
+
+    threads = []
+
+    class SearchClient(FakeClient):
+        def search_graphrag(self, query: str, **payload: Any):
+            threads.append(threading.current_thread().name)
+            return {"query": query}
+
+    monkeypatch.setenv("PLEXITY_THREAD_POOL_SIZE", "2")
+    monkeypatch.setattr(graphrag_module, "_blocking_executor", None)
+    client = _enterprise_client(SearchClient())
+    await client.asearch("customers")
+    executor = graphrag_module._blocking_executor
+    assert executor is not None and executor._max_workers == 2
+    assert threads[0].startswith("plexity")
+    executor.shutdown(wait=False)
+
+
 def test_feature_flags_include_enterprise_addons():
     fake = FakeClient()
     client = _enterprise_client(fake)
     assert client.feature_flags.is_enabled(GraphRAGFeature.ENTERPRISE_ADDONS)
 
 
+def test_backend_validation_probes_enabled_routes_once():
+    class CountingProbeClient(FakeClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.probes: list[tuple[str, str]] = []
+
+        def probe_endpoint(self, method: str, path: str, *, timeout: Optional[float] = None) -> bool:
+            self.probes.append((method, path))
+            return True
+
+    core = CountingProbeClient()
+    GraphRAGClient(core, org_id="orgA", package=GraphRAGPackage.CORE)
+    assert core.probes == []
+
+    enterprise = CountingProbeClient()
+    client = GraphRAGClient(enterprise, org_id="orgA", package=GraphRAGPackage.ENTERPRISE)
+    probed = len(enterprise.probes)
+    assert probed == 4
+    assert "OPTIONS" not in {method for method, _path in enterprise.probes}
+    client.validate_backend_support(strict=True)
+    client.create_incremental_job({"slice": {}})
+    assert len(enterprise.probes) == probed
+
+    preflight = CountingProbeClient()
+    GraphRAGClient(preflight, org_id="orgA", package=GraphRAGPackage.ENTERPRISE, prefer_options_probe=True)
+    assert {method for method, _path in preflight.probes} == {"OPTIONS"}
+
+
+def test_failed_probe_round_is_retried():
+    class FlakyProbeClient(FakeClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.fail = True
+
+        def probe_endpoint(self, method: str, path: str, *, timeout: Optional[float] = None) -> bool:
+            if self.fail:
+                raise ConnectionError("orchestrator unavailable")
+            return True
+
+    fake = FlakyProbeClient()
+    client = GraphRAGClient(fake, org_id="orgA", package=GraphRAGPackage.ENTERPRISE, validate_backend_support=False)
+
+    with pytest.raises(ConnectionError):
+        client.validate_backend_support()
+    assert not client._capabilities_probed
+
+    fake.fail = False
+    assert all(client.validate_backend_support().values())
+    assert client._capabilities_probed
+
+
 def test_backend_validation_detects_missing_routes():
     class MissingRouteClient(FakeClient):
         def probe_endpoint(self, method: str, path: str, *, timeout: Optional[float] = None) -> bool:
@@ -212,3 +398,446 @@ def test_backend_validation_detects_missing_routes():
         )
 
     assert "enterprise_addons" in str(exc.value)
+
+
+class RecordingTelemetryClient:
+    def __init__(self) -> None:
+        self.batches: list[tuple[str, list[Dict[str, Any]]]] = []
+
+    def __getattr__(self, name: str):
+        if not name.startswith("record_graphrag_"):
+            raise AttributeError(name)
+
+        def record(events: list[Dict[str, Any]]) -> int:
+            self.batches.append((name, list(events)))
+            return len(events)
+
+        return record
+
+
+def test_telemetry_sends_immediately_by_default():
+    fake = RecordingTelemetryClient()
+    telemetry = GraphRAGTelemetry(fake, GraphRAGTelemetryContext(org_id="orgA"))
+
+    assert telemetry.record_entity_events([{"id": "e1"}]) == 1
+    assert fake.batches == [("record_graphrag_entity_events", [{"id": "e1", "orgId": "orgA", "environment": "prod"}])]
+    assert telemetry.flush() == 0
+
+
+def test_telemetry_defaults_follow_context_changes():
+    fake = RecordingTelemetryClient()
+    context = GraphRAGTelemetryContext(org_id="orgA")
+    telemetry = GraphRAGTelemetry(fake, context)
+
+    telemetry.record_entity_events([{"id": "e1"}])
+    telemetry.update_context(org_id="orgB", triggered_by="ci")
+    context.environment = "staging"
+    telemetry.record_entity_events([{"id": "e2"}])
+    telemetry.record_query_coverage([{"q": 1}])
+
+    assert [batch[0] for _, batch in fake.batches] == [
+        {"orgId": "orgA", "environment": "prod", "id": "e1"},
+        {"orgId": "orgB", "environment": "staging", "triggeredBy": "ci", "id": "e2"},
+        {"orgId": "orgB", "environment": "staging", "q": 1},
+    ]
+
+
+def test_telemetry_batches_events_until_full_or_flushed():
+    fake = RecordingTelemetryClient()
+    telemetry = GraphRAGTelemetry(
+        fake,
+        GraphRAGTelemetryContext(org_id="orgA"),
+        batch=True,
+        max_batch=3,
+        flush_interval=60,
+    )
+
+    assert telemetry.record_entity_events([{"id": "e1"}]) == 1
+    assert telemetry.record_schema_snapshots([{"labels": []}]) == 1
+    assert fake.batches == []
+    assert telemetry.buffer_stats["pending"] == 2
+
+    telemetry.record_entity_events([{"id": "e2"}])
+    assert [(name, len(batch)) for name, batch in fake.batches] == [
+        ("record_graphrag_entity_events", 2),
+        ("record_graphrag_schema_snapshots", 1),
+    ]
+    assert telemetry.buffer_stats == {"pending": 0, "buffer_high_water": 3, "drop_count": 0}
+    assert telemetry.flush() == 0
+
+
+def test_telemetry_keeps_events_pending_when_a_sender_fails(caplog):
+    class FailingSchemaClient(RecordingTelemetryClient):
+        fail = True
+
+        def record_graphrag_schema_snapshots(self, events: list[Dict[str, Any]]) -> int:
+            if self.fail:
+                raise ConnectionError("ingest unavailable")
+            self.batches.append(("record_graphrag_schema_snapshots", list(events)))
+            return len(events)
+
+    fake = FailingSchemaClient()
+    telemetry = GraphRAGTelemetry(fake, GraphRAGTelemetryContext(org_id="orgA"), batch=True, flush_interval=60)
+    telemetry.record_entity_events([{"id": "e1"}])
+    telemetry.record_schema_snapshots([{"labels": []}])
+
+    with pytest.raises(ConnectionError):
+        telemetry.flush()
+    assert telemetry.buffer_stats["pending"] == 1
+
+    # The timer/exit path logs the failure instead of losing the events silently.
+    telemetry._batcher._flush_and_log()  # type: ignore[union-attr]
+    assert "1 events remain pending" in caplog.text
+    assert telemetry.buffer_stats["pending"] == 1
+
+    fake.fail = False
+    assert telemetry.flush() == 1
+    assert [name for name, _ in fake.batches] == [
+        "record_graphrag_entity_events",
+        "record_graphrag_schema_snapshots",
+    ]
+
+
+def test_persistent_telemetry_replays_unsent_events(tmp_path):
+    path = tmp_path / "telemetry.sqlite"
+    first = RecordingTelemetryClient()
+    telemetry = GraphRAGTelemetry(
+        first,
+        GraphRAGTelemetryContext(org_id="orgA"),
+        persistent_path=path,
+        flush_interval=60,
+    )
+    telemetry.record_entity_events([{"id": "e1"}, {"id": "e2"}])
+    assert first.batches == []
+    assert telemetry.buffer_stats["pending"] == 2
+
+    # A second helper on the same file stands in for the process restarting after a crash.
+    second = RecordingTelemetryClient()
+    replayed = GraphRAGTelemetry(second, GraphRAGTelemetryContext(org_id="orgA"), persistent_path=path)
+    assert second.batches == [
+        (
+            "record_graphrag_entity_events",
+            [
+                {"orgId": "orgA", "environment": "prod", "id": "e1"},
+                {"orgId": "orgA", "environment": "prod", "id": "e2"},
+            ],
+        )
+    ]
+    assert replayed.buffer_stats["pending"] == 0
+    assert replayed.flush() == 0
+
+
+def test_telemetry_buffer_counts_dropped_events():
+    fake = RecordingTelemetryClient()
+    telemetry = GraphRAGTelemetry(
+        fake,
+        GraphRAGTelemetryContext(org_id="orgA"),
+        batch=True,
+        max_batch=2,
+        flush_interval=60,
+        buffer_capacity=2,
+    )
+
+    telemetry.record_entity_events([{"id": "e1"}, {"id": "e2"}, {"id": "e3"}])
+
+    assert [e["id"] for e in fake.batches[0][1]] == ["e2", "e3"]
+    assert telemetry.buffer_stats["drop_count"] == 1
+
+
+def test_telemetry_deduplicates_entity_events_per_flush():
+    fake = RecordingTelemetryClient()
+    telemetry = GraphRAGTelemetry(fake, GraphRAGTelemetryContext(org_id="orgA"), batch=True, flush_interval=60)
+
+    assert telemetry.record_entity_events([{"id": "e1", "name": "A"}, {"name": "A", "id": "e1"}]) == 1
+    assert telemetry.record_indexing_operations([{"op": "run"}, {"op": "run"}]) == 2
+    assert telemetry.flush() == 3
+
+    assert telemetry.record_entity_events([{"id": "e1", "name": "A"}]) == 1
+
+
+def test_telemetry_streams_large_inputs_in_chunks():
+    fake = RecordingTelemetryClient()
+    telemetry = GraphRAGTelemetry(fake, GraphRAGTelemetryContext(org_id="orgA"))
+
+    accepted = telemetry.record_indexing_operations({"op": i} for i in range(2500))
+
+    assert accepted == 2500
+    assert [len(batch) for _, batch in fake.batches] == [1024, 1024, 452]
+    assert fake.batches[-1][1][-1] == {"op": 2499, "orgId": "orgA", "environment": "prod"}
+
+
+def test_runtime_profiles_are_shared_for_identical_inputs():
+    first = resolve_runtime_profile("core", enable=["neo4j_support", GraphRAGFeature.SCHEMA_DIFF])
+    second = resolve_runtime_profile(
+        GraphRAGPackage.CORE,
+        enable=iter([GraphRAGFeature.SCHEMA_DIFF, "neo4j_support"]),
+    )
+
+    assert first is second
+    assert first.feature_flags.is_enabled(GraphRAGFeature.NEO4J_SUPPORT)
+    assert first.optional_dependencies == frozenset({"neo4j>=5.16"})
+
+    trimmed = resolve_runtime_profile("enterprise", disable=["enterprise_addons"])
+    assert not trimmed.feature_flags.is_enabled(GraphRAGFeature.ENTERPRISE_ADDONS)
+
+
+def test_disabled_features_are_rejected():
+    client = GraphRAGClient(FakeClient(), org_id="orgA", package=GraphRAGPackage.CORE)
+
+    with pytest.raises(RuntimeError, match="schema_diff"):
+        client.create_neo4j_schema_planner(None)  # type: ignore[arg-type]
+
+
+def test_neo4j_helpers_are_reused_per_manager():
+    client = _enterprise_client(FakeClient())
+    manager = object()
+
+    planner = client.create_neo4j_schema_planner(manager)  # type: ignore[arg-type]
+    executor = client.create_neo4j_batch_executor(manager)  # type: ignore[arg-type]
+
+    assert client.create_neo4j_schema_planner(manager) is planner  # type: ignore[arg-type]
+    assert client.create_neo4j_batch_executor(manager) is executor  # type: ignore[arg-type]
+    assert client.create_neo4j_batch_executor(manager, batch_size=10) is not executor  # type: ignore[arg-type]
+
+
+def test_informational_migration_plan_skips_neo4j_session():
+    class NoSessionManager:
+        def session_scope(self):
+            raise AssertionError("informational plans must not open a session")
+
+    plan = Neo4jMigrationPlan(
+        actions=(Neo4jMigrationAction(statement="// Informational: add node properties", description="info"),)
+    )
+    client = _enterprise_client(FakeClient())
+    executor = client.create_neo4j_batch_executor(NoSessionManager())  # type: ignore[arg-type]
+
+    result = client.apply_neo4j_schema_migration(executor, plan)
+    assert (result.executed, result.skipped, tuple(result.failures)) == (0, 0, ())
+
+
+@pytest.mark.asyncio
+async def test_telemetry_async_variants_fan_out_chunks():
+    class AsyncTelemetryClient:
+        def __init__(self) -> None:
+            self.sizes: list[int] = []
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def _record(self, events: list[Dict[str, Any]]) -> int:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            self.sizes.append(len(events))
+            return len(events)
+
+        def __getattr__(self, name: str):
+            if not name.startswith("record_graphrag_"):
+                raise AttributeError(name)
+            return self._record
+
+    fake = AsyncTelemetryClient()
+    telemetry = GraphRAGTelemetry(fake, GraphRAGTelemetryContext(org_id="orgA"))  # type: ignore[arg-type]
+    events = ({"id": f"e{i}"} for i in range(10))
+
+    assert await telemetry.record_entity_events_async(events, chunk_size=3, concurrency=2) == 10
+    assert sorted(fake.sizes) == [1, 3, 3, 3]
+    assert fake.max_in_flight == 2
+
+    blocking = RecordingTelemetryClient()
+    telemetry = GraphRAGTelemetry(blocking, GraphRAGTelemetryContext(org_id="orgA"))
+    assert await telemetry.record_schema_snapshots_async([{"labels": []}] * 4, chunk_size=2) == 4
+    assert [len(batch) for _name, batch in blocking.batches] == [2, 2]
+    assert await telemetry.record_entity_events_async([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_telemetry_async_variants_stream_and_respect_batching(tmp_path):
+    produced: list[int] = []
+    seen_at_send: list[int] = []
+
+    class AsyncTelemetryClient:
+        async def _record(self, events: list[Dict[str, Any]]) -> int:
+            seen_at_send.append(len(produced))
+            return len(events)
+
+        def __getattr__(self, name: str):
+            if not name.startswith("record_graphrag_"):
+                raise AttributeError(name)
+            return self._record
+
+    def events():
+        for i in range(10):
+            produced.append(i)
+            yield {"id": f"e{i}"}
+
+    streaming = GraphRAGTelemetry(AsyncTelemetryClient(), GraphRAGTelemetryContext(org_id="orgA"))  # type: ignore[arg-type]
+    assert await streaming.record_indexing_operations_async(events(), chunk_size=2, concurrency=1) == 10
+    assert seen_at_send[0] < 10
+
+    fake = RecordingTelemetryClient()
+    batched = GraphRAGTelemetry(fake, GraphRAGTelemetryContext(org_id="orgA"), batch=True, flush_interval=60)
+    assert await batched.record_entity_events_async([{"id": "e1"}, {"id": "e1"}]) == 1
+    assert fake.batches == []
+    assert batched.buffer_stats["pending"] == 1
+
+    persistent = GraphRAGTelemetry(
+        fake, GraphRAGTelemetryContext(org_id="orgA"), persistent_path=tmp_path / "t.sqlite", flush_interval=60
+    )
+    await persistent.record_schema_snapshots_async([{"labels": []}])
+    assert persistent.buffer_stats["pending"] == 1
+    assert persistent.flush() == 1
+
+
+def test_schema_snapshot_reloads_property_maps_when_indexes_are_unchanged():
+    class FingerprintRecord:
+        def __init__(self, value: list) -> None:
+            self._value = value
+
+        def values(self) -> list:
+            return [self._value]
+
+    class FakeSession:
+        def __init__(self) -> None:
+            self.properties = [("node", ["Customer"], "name")]
+
+        def run(self, query: str, *args: Any):
+            if "collect(" in query:
+                return [FingerprintRecord([["idx", "RANGE", "NODE", ["Customer"], ["name"]]])]
+            if "nodeTypeProperties" in query:
+                return list(self.properties)
+            if query.startswith("SHOW INDEXES"):
+                return [("idx", "RANGE", "NODE", ["Customer"], ["name"])]
+            return []
+
+    session = FakeSession()
+    manager = _neo4j_manager(session)
+    driver = manager.get_driver()
+
+    first = manager.schema_snapshot()
+    session.properties.append(("node", ["Customer"], "email"))
+    second = manager.schema_snapshot()
+
+    assert first.labels == {"Customer": ("name",)}
+    assert second.labels == {"Customer": ("email", "name")}
+    assert second.indexes is first.indexes
+    # The fingerprint and property queries share the snapshot's session.
+    assert driver.sessions_opened == 2
+
+    manager.close()
+    assert driver.closed
+    assert manager._schema_cache is None
+
+
+def test_session_scope_reuses_the_enclosing_session():
+    session = object()
+    manager = _neo4j_manager(session)
+    driver = manager.get_driver()
+
+    with manager.session_scope() as outer:
+        with manager.session_scope() as inner:
+            assert inner is outer is session
+    assert driver.sessions_opened == 1
+
+    with manager.session_scope():
+        pass
+    assert driver.sessions_opened == 2
+
+
+def test_job_advisor_scans_each_requested_label_once():
+    class RecordingSession:
+        def __init__(self) -> None:
+            self.calls: List[Any] = []
+
+        def run(self, query: str, params: Dict[str, Any]):
+            self.calls.append((query, params))
+            return [{"label": "Customer", "orgId": "orgA", "nodeCount": 3}]
+
+    session = RecordingSession()
+    advisor = Neo4jIncrementalJobAdvisor(_neo4j_manager(session), org_id_property="tenant")
+
+    recommendations = advisor.recommend(labels=["Customer", "Order", "Customer", ""], limit=0)
+
+    query, params = session.calls[0]
+    assert "MATCH (n:`Customer`) RETURN $labels[0] AS label" in query
+    assert "MATCH (n:`Order`) RETURN $labels[1] AS label" in query
+    assert query.count("MATCH (n:") == 2
+    assert params == {"labels": ["Customer", "Order"], "limit": 1, "orgProp": "tenant"}
+    assert [(r.label, r.org_id, r.node_count) for r in recommendations] == [("Customer", "orgA", 3)]
+
+
+def test_s3_adapter_converts_memoryview_bodies():
+    class RecordingS3Client:
+        def __init__(self) -> None:
+            self.bodies: List[Any] = []
+
+        def put_object(self, **kwargs: Any) -> None:
+            self.bodies.append(kwargs["Body"])
+
+    adapter = S3StorageAdapter("bucket", client=RecordingS3Client())
+
+    payload = b"graph"
+    adapter.put_object("a", memoryview(payload))
+    adapter.put_object("b", payload)
+
+    assert adapter._client.bodies == [b"graph", b"graph"]
+    assert type(adapter._client.bodies[0]) is bytes
+    assert adapter._client.bodies[1] is payload
+
+
+def test_s3_adapter_get_many_preserves_key_order():
+    class Body:
+        def __init__(self, data: bytes) -> None:
+            self._data = data
+
+        def read(self) -> bytes:
+            return self._data
+
+    class SlowS3Client:
+        def get_object(self, *, Bucket: str, Key: str) -> Dict[str, Any]:
+            # Earlier keys finish last, so completion order differs from request order.
+            time.sleep(0.01 * (3 - int(Key)))
+            return {"Body": Body(Key.encode())}
+
+    adapter = S3StorageAdapter("bucket", client=SlowS3Client())
+    objects = adapter.get_many(["0", "1", "2"])
+
+    assert [obj.key for obj in objects] == ["0", "1", "2"]
+    assert [obj.data for obj in objects] == [b"0", b"1", b"2"]
+
+
+def test_migration_plan_escapes_backticks_in_property_names():
+    empty = Neo4jSchemaSnapshot(labels={}, relationships={}, indexes=(), constraints=())
+    target = Neo4jSchemaSnapshot(
+        labels={},
+        relationships={},
+        indexes=(IndexDefinition.from_values("idx", "RANGE", "NODE", ["Customer"], ["odd`name"]),),
+        constraints=(),
+    )
+
+    plan = Neo4jSchemaPlanner(None).plan_migration(target, current=empty)  # type: ignore[arg-type]
+
+    assert "n.`odd``name`" in plan.actions[0].statement
+
+
+def test_index_definition_from_values_dedupes_inputs():
+    index = IndexDefinition.from_values("idx", "RANGE", "NODE", ["Customer", "Customer"], ["name", "id", "name"])
+
+    assert index.labels_or_types == ("Customer",)
+    assert index.properties == ("id", "name")
+
+
+def test_identical_snapshot_diffs_are_independent():
+    snapshot = Neo4jSchemaSnapshot(labels={"Customer": ("name",)}, relationships={}, indexes=(), constraints=())
+
+    first = snapshot.diff(snapshot)
+    first.added_node_properties["Leaked"] = ("x",)  # type: ignore[index]
+
+    assert snapshot.diff(snapshot).is_empty()
+
+
+def test_diff_canonicalises_hand_built_target_properties():
+    current = Neo4jSchemaSnapshot(labels={"P": ("id",)}, relationships={}, indexes=(), constraints=())
+    target = Neo4jSchemaSnapshot(labels={"P": ("name", "id", "age", "age")}, relationships={}, indexes=(), constraints=())
+
+    assert current.diff(target).added_node_properties == {"P": ("age", "name")}
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import sys
+import threading
 import types
 import unittest
 from contextlib import contextmanager
@@ -15,6 +16,9 @@ from plexity_sdk.frameworks import (
     create_langchain_retriever,
     create_llamaindex_retriever,
 )
+from plexity_sdk.frameworks import haystack as haystack_integration
+from plexity_sdk.frameworks import langchain as langchain_integration
+from plexity_sdk.frameworks import llamaindex as llamaindex_integration
 
 
 class StubGraphRAGClient:
@@ -29,6 +33,16 @@ class StubGraphRAGClient:
         return payload
 
 
+class StubAsyncGraphRAGClient(StubGraphRAGClient):
+    def __init__(self, result: Dict[str, Any]) -> None:
+        super().__init__(result)
+        self.async_calls: List[Tuple[str, Dict[str, Any]]] = []
+
+    async def asearch(self, query: str, **kwargs: Any) -> Dict[str, Any]:
+        self.async_calls.append((query, kwargs))
+        return self.search(query, **kwargs)
+
+
 SAMPLE_RESULT: Dict[str, Any] = {
     "confidence": 0.82,
     "context": {
@@ -213,12 +227,21 @@ def install_haystack_stub() -> Iterable[None]:
 
 
 class FrameworkIntegrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # Framework imports are memoised; reset them so each test sees its own stubs.
+        langchain_integration._import_langchain.cache_clear()
+        llamaindex_integration._import_llamaindex.cache_clear()
+        langchain_integration._retriever_class.cache_clear()
+        llamaindex_integration._retriever_class.cache_clear()
+        haystack_integration._import_haystack.cache_clear()
+        haystack_integration._retriever_class.cache_clear()
+
     def test_langchain_retriever_transforms_entities(self) -> None:
         client = StubGraphRAGClient(SAMPLE_RESULT)
         with install_langchain_stub():
             retriever = create_langchain_retriever(
                 client,
-                LangChainRetrieverOptions(search_type="hybrid", max_entities=5),
+                LangChainRetrieverOptions(search_type="hybrid", max_entities=5, cache_size=16),
             )
             docs = retriever.get_relevant_documents("Summarise integrations")
 
@@ -228,6 +251,11 @@ class FrameworkIntegrationTests(unittest.TestCase):
 
             loop_result = asyncio.run(retriever.aget_relevant_documents("Summarise integrations"))
             self.assertEqual(len(loop_result), len(docs))
+            self.assertEqual(len(client.calls), 1)
+
+            retriever.cache_clear()
+            retriever.get_relevant_documents("Summarise integrations")
+            self.assertEqual(len(client.calls), 2)
 
     def test_langchain_retriever_requires_dependency(self) -> None:
         client = StubGraphRAGClient(SAMPLE_RESULT)
@@ -247,19 +275,147 @@ class FrameworkIntegrationTests(unittest.TestCase):
         finally:
             setattr(sys.modules["builtins"], "__import__", original_import)
 
+    def test_langchain_retriever_awaits_async_client(self) -> None:
+        client = StubAsyncGraphRAGClient(SAMPLE_RESULT)
+        with install_langchain_stub():
+            retriever = create_langchain_retriever(client, LangChainRetrieverOptions(max_tokens=128))
+            docs = asyncio.run(retriever.aget_relevant_documents("Summarise integrations"))
+
+            self.assertEqual(len(docs), 2)
+            self.assertEqual(client.async_calls, [("Summarise integrations", {"search_type": "hybrid", "max_tokens": 128})])
+
     def test_llamaindex_retriever_builds_nodes(self) -> None:
         client = StubGraphRAGClient(SAMPLE_RESULT)
         with install_llamaindex_stub():
-            retriever = create_llamaindex_retriever(client, LlamaIndexRetrieverOptions(max_entities=1))
+            retriever = create_llamaindex_retriever(
+                client, LlamaIndexRetrieverOptions(max_entities=1, cache_size=16)
+            )
             nodes = retriever.retrieve("Find relationships")
 
             self.assertEqual(len(nodes), 2)
             first = nodes[0]
             self.assertEqual(first.node.metadata["type"], "entity")
             self.assertTrue(first.node.text.startswith("LangChain SDK"))
+            self.assertIn("DEPENDS_ON: Relates to another entity.", first.node.text)
 
             async_nodes = asyncio.run(retriever.aretrieve("Find relationships"))
             self.assertEqual(len(async_nodes), len(nodes))
+            self.assertEqual(len(client.calls), 1)
+
+    def test_langchain_retriever_truncates_oversized_results(self) -> None:
+        entities = [{"id": f"entity-{idx}", "name": f"Entity {idx}"} for idx in range(5)]
+        client = StubGraphRAGClient({"context": {"entities": ["noise", *entities], "communities": []}})
+        with install_langchain_stub():
+            retriever = create_langchain_retriever(client, LangChainRetrieverOptions(max_entities=2))
+            docs = retriever.get_relevant_documents("Entities")
+
+            self.assertEqual([doc.metadata["entity_id"] for doc in docs], ["entity-0", "entity-1"])
+
+    def test_langchain_retriever_handles_empty_context(self) -> None:
+        client = StubGraphRAGClient({"confidence": 0.1, "context": {"entities": [], "communities": []}})
+        with install_langchain_stub():
+            retriever = create_langchain_retriever(client)
+            self.assertEqual(retriever.get_relevant_documents("Unknown topic"), [])
+
+    def test_llamaindex_retriever_tolerates_unhashable_ids(self) -> None:
+        composite = {"ns": "crm", "key": 7}
+        result = {
+            "context": {
+                "entities": [
+                    {"id": dict(composite), "name": "Composite"},
+                    {"id": "entity-1", "name": "Plain"},
+                ],
+                "communities": [],
+                "relationships": [
+                    {"source": dict(composite), "target": "entity-1", "type": "LINKS", "description": "x"},
+                    {"source": "entity-1", "target": "entity-2", "type": "DEPENDS_ON", "description": "y"},
+                ],
+            }
+        }
+        with install_llamaindex_stub():
+            retriever = create_llamaindex_retriever(StubGraphRAGClient(result))
+            nodes = retriever.retrieve("Composite ids")
+
+            self.assertIn("LINKS: x", nodes[0].node.text)
+            self.assertIn("LINKS: x", nodes[1].node.text)
+            self.assertIn("DEPENDS_ON: y", nodes[1].node.text)
+
+    def test_llamaindex_retriever_batches_queries(self) -> None:
+        client = StubAsyncGraphRAGClient(SAMPLE_RESULT)
+        with install_llamaindex_stub():
+            retriever = create_llamaindex_retriever(client, LlamaIndexRetrieverOptions(max_parallel=2))
+            batches = asyncio.run(retriever.abatch_retrieve(["one", "two", "three"]))
+
+            self.assertEqual([len(nodes) for nodes in batches], [2, 2, 2])
+            self.assertEqual(sorted(query for query, _ in client.async_calls), ["one", "three", "two"])
+            self.assertIsNone(retriever.executor)
+
+    def test_langchain_retriever_batches_blocking_queries(self) -> None:
+        client = StubGraphRAGClient(SAMPLE_RESULT)
+        with install_langchain_stub():
+            retriever = create_langchain_retriever(client, LangChainRetrieverOptions(cache_size=16))
+            batches = asyncio.run(retriever.abatch_retrieve(["one", "two", "one"]))
+            retriever.close()
+
+            self.assertEqual([len(docs) for docs in batches], [2, 2, 2])
+            self.assertLessEqual(len(client.calls), 3)
+            self.assertIsNone(retriever.executor)
+
+    def test_llamaindex_retriever_cache_can_be_disabled(self) -> None:
+        client = StubGraphRAGClient(SAMPLE_RESULT)
+        with install_llamaindex_stub():
+            retriever = create_llamaindex_retriever(client, LlamaIndexRetrieverOptions(cache_size=0))
+            retriever.retrieve("Find relationships")
+            retriever.retrieve("Find relationships")
+
+            self.assertEqual(len(client.calls), 2)
+
+    def test_langchain_retriever_caching_is_opt_in(self) -> None:
+        client = StubGraphRAGClient(SAMPLE_RESULT)
+        with install_langchain_stub():
+            retriever = create_langchain_retriever(client)
+            retriever.get_relevant_documents("Summarise integrations")
+            retriever.get_relevant_documents("Summarise integrations")
+
+            self.assertEqual(len(client.calls), 2)
+
+    def test_langchain_async_retrievals_share_the_cache(self) -> None:
+        client = StubAsyncGraphRAGClient(SAMPLE_RESULT)
+        with install_langchain_stub():
+            retriever = create_langchain_retriever(client, LangChainRetrieverOptions(cache_size=16))
+            asyncio.run(retriever.aget_relevant_documents("Summarise integrations"))
+            asyncio.run(retriever.aget_relevant_documents("Summarise integrations"))
+            docs = retriever.get_relevant_documents("Summarise integrations")
+
+            self.assertEqual(len(docs), 2)
+            self.assertEqual(len(client.async_calls), 1)
+            self.assertEqual(len(client.calls), 1)
+
+    def test_llamaindex_retrievers_share_generated_class(self) -> None:
+        client = StubGraphRAGClient(SAMPLE_RESULT)
+        with install_llamaindex_stub():
+            first = create_llamaindex_retriever(client)
+            second = create_llamaindex_retriever(client, LlamaIndexRetrieverOptions(max_entities=1))
+
+            self.assertIs(type(first), type(second))
+            self.assertEqual(second.max_entities, 1)
+
+    def test_langchain_retriever_runs_blocking_client_on_own_pool(self) -> None:
+        threads: List[str] = []
+
+        class RecordingClient(StubGraphRAGClient):
+            def search(self, query: str, **kwargs: Any) -> Dict[str, Any]:
+                threads.append(threading.current_thread().name)
+                return super().search(query, **kwargs)
+
+        with install_langchain_stub():
+            retriever = create_langchain_retriever(RecordingClient(SAMPLE_RESULT))
+            docs = asyncio.run(retriever.aget_relevant_documents("Summarise integrations"))
+            retriever.close()
+
+            self.assertEqual(len(docs), 2)
+            self.assertTrue(threads[0].startswith("graphrag-retriever"))
+            self.assertIsNone(retriever.executor)
 
     def test_haystack_retriever_supports_run_and_retrieve(self) -> None:
         client = StubGraphRAGClient(SAMPLE_RESULT)
@@ -268,6 +424,10 @@ class FrameworkIntegrationTests(unittest.TestCase):
             docs = retriever.retrieve("Launch checklist")
             self.assertEqual(len(docs), 1)
             self.assertEqual(docs[0].content, "Integration ready entity.")
+            self.assertEqual(
+                client.calls[0][1],
+                {"search_type": "hybrid", "max_entities": 1, "max_communities": 1},
+            )
 
             run_result = retriever.run("Launch checklist")
             self.assertIn("documents", run_result)
@@ -276,6 +436,26 @@ class FrameworkIntegrationTests(unittest.TestCase):
             async_result = asyncio.run(retriever.arun("Launch checklist"))
             self.assertEqual(len(async_result["documents"]), 1)
 
+    def test_haystack_retriever_awaits_async_client(self) -> None:
+        client = StubAsyncGraphRAGClient(SAMPLE_RESULT)
+        with install_haystack_stub():
+            retriever = create_haystack_retriever(client, HaystackRetrieverOptions(top_k=1))
+            result = asyncio.run(retriever.arun("Launch checklist"))
+
+            self.assertEqual(len(result["documents"]), 1)
+            self.assertEqual([query for query, _ in client.async_calls], ["Launch checklist"])
+
+
+    def test_haystack_retriever_skips_search_when_top_k_is_zero(self) -> None:
+        client = StubGraphRAGClient(SAMPLE_RESULT)
+        with install_haystack_stub():
+            retriever = create_haystack_retriever(client, HaystackRetrieverOptions(top_k=0))
+
+            self.assertEqual(retriever.run("Launch checklist"), {"documents": []})
+            self.assertEqual(asyncio.run(retriever.arun("Launch checklist")), {"documents": []})
+            self.assertEqual(client.calls, [])
+            self.assertEqual(haystack_integration._transform_result({"context": {}}, object), [])
+
 
 if __name__ == "__main__":
     unittest.main()
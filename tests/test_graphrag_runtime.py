@@ -55,3 +55,158 @@ def test_ensure_runtime_raises_runtime_error_on_failure(tmp_path, monkeypatch: p
             skip_if_installed=False,
             verbose=False,
         )
+
+
+def test_ensure_runtime_probes_metadata_instead_of_pip_show(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    commands = capture_commands(monkeypatch)
+
+    ensure_microsoft_graphrag_runtime(
+        virtual_env=str(tmp_path / "env"),
+        workspace=str(tmp_path / "workspace"),
+        python_executable=sys.executable,
+        skip_if_installed=True,
+    )
+
+    assert not any("show" in cmd for cmd, *_ in commands)
+    assert any(cmd[1] == "-c" and "importlib.metadata" in cmd[2] for cmd, *_ in commands)
+
+
+def test_ensure_runtime_returns_early_when_host_has_graphrag(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from importlib import metadata
+
+    commands = capture_commands(monkeypatch)
+    monkeypatch.setattr(metadata, "version", lambda name: "1.2.0")
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+
+    ensure_microsoft_graphrag_runtime(
+        virtual_env=str(tmp_path / "env"),
+        workspace=str(workspace),
+        graphrag_version="1.2.0",
+    )
+    assert commands == []
+
+    ensure_microsoft_graphrag_runtime(
+        virtual_env=str(tmp_path / "env"),
+        workspace=str(workspace),
+        graphrag_version="2.0.0",
+    )
+    assert commands
+
+
+def test_ensure_runtime_moves_old_virtualenv_aside(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    capture_commands(monkeypatch)
+    venv = tmp_path / "env"
+    (venv / "lib").mkdir(parents=True)
+    (venv / "lib" / "marker.txt").write_text("old")
+
+    ensure_microsoft_graphrag_runtime(
+        virtual_env=str(venv),
+        workspace=str(tmp_path / "workspace"),
+        python_executable=sys.executable,
+        force_virtualenv=True,
+    )
+
+    assert not (venv / "lib" / "marker.txt").exists()
+
+
+def test_ensure_runtime_sweeps_stale_discarded_virtualenvs(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    capture_commands(monkeypatch)
+    stale = tmp_path / "env.old-1234-5678"
+    (stale / "lib").mkdir(parents=True)
+    unrelated = tmp_path / "envelope.old-1"
+    unrelated.mkdir()
+    backup = tmp_path / "env.old-backup"
+    backup.mkdir()
+
+    ensure_microsoft_graphrag_runtime(
+        virtual_env=str(tmp_path / "env"),
+        workspace=str(tmp_path / "workspace"),
+        python_executable=sys.executable,
+    )
+    for thread in threading.enumerate():
+        if thread.name == "plexity-rmtree":
+            thread.join()
+
+    assert not stale.exists()
+    assert unrelated.exists()
+    assert backup.exists()
+
+
+def test_ensure_runtime_installs_without_bytecode_compilation(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[Tuple[Tuple[str, ...], dict]] = []
+
+    def fake_run(cmd: Sequence[str], **kwargs: object) -> SimpleNamespace:
+        calls.append((tuple(str(part) for part in cmd), kwargs))
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    ensure_microsoft_graphrag_runtime(
+        virtual_env=str(tmp_path / "env"),
+        workspace=str(tmp_path / "workspace"),
+        python_executable=sys.executable,
+        skip_if_installed=False,
+    )
+
+    installs = [(cmd, kwargs) for cmd, kwargs in calls if "install" in cmd]
+    assert installs
+    for cmd, kwargs in installs:
+        assert {"--no-compile", "--prefer-binary", "--no-warn-script-location"} <= set(cmd)
+        assert kwargs["env"]["PYTHONDONTWRITEBYTECODE"] == "1"
+
+
+def test_ensure_runtime_only_upgrades_pip_tooling(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    commands = capture_commands(monkeypatch)
+
+    ensure_microsoft_graphrag_runtime(
+        virtual_env=str(tmp_path / "env"),
+        workspace=str(tmp_path / "workspace"),
+        python_executable=sys.executable,
+        skip_if_installed=False,
+        extra_packages=["neo4j"],
+    )
+
+    tooling, targets = [cmd for cmd, *_ in commands if "install" in cmd]
+    assert "--upgrade" in tooling and "graphrag" not in tooling
+    assert "--upgrade" not in targets
+    assert targets[-2:] == ("graphrag", "neo4j")
+
+
+def test_ensure_runtime_uses_uv_when_preferred(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import shutil
+
+    commands = capture_commands(monkeypatch)
+    monkeypatch.setattr(shutil, "which", lambda name: "/opt/bin/uv" if name == "uv" else None)
+
+    ensure_microsoft_graphrag_runtime(
+        virtual_env=str(tmp_path / "env"),
+        workspace=str(tmp_path / "workspace"),
+        python_executable=sys.executable,
+        skip_if_installed=False,
+        prefer_uv=True,
+    )
+
+    invoked = [cmd for cmd, *_ in commands]
+    assert invoked[0][:2] == ("/opt/bin/uv", "venv")
+    installs = [cmd for cmd in invoked if "install" in cmd]
+    assert installs == [("/opt/bin/uv", "pip", "install", "--python", str(tmp_path / "env" / "bin" / "python"), "graphrag")]
+
+
+def test_ensure_runtime_reads_venv_metadata_in_process(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    commands = capture_commands(monkeypatch)
+    site_packages = tmp_path / "env" / "lib" / "python3.11" / "site-packages"
+    dist_info = site_packages / "graphrag-1.0.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: graphrag\nVersion: 1.0.0\n")
+    (tmp_path / "workspace").mkdir()
+
+    ensure_microsoft_graphrag_runtime(
+        virtual_env=str(tmp_path / "env"),
+        workspace=str(tmp_path / "workspace"),
+        python_executable=sys.executable,
+    )
+
+    assert [cmd[1:] for cmd, *_ in commands] == [("-c", "import graphrag")]